@@ -0,0 +1,105 @@
+"""
+동기(psycopg2 + 스레드 풀) vs 비동기(asyncpg) 조회 경로 벤치마크.
+
+같은 콘텐츠 목록 쿼리를 sync def 라우트와 async def 라우트로 각각 노출하고,
+동시 요청 수를 늘려가며 처리량과 p50/p99 지연을 비교합니다.
+sync 라우트는 anyio 워커 스레드(기본 40개)를 점유하므로 동시성이 이를 넘으면 대기가 생깁니다.
+
+DATABASE_URL 의 DB를 그대로 사용합니다. (Postgres 권장, 콘텐츠 데이터가 있어야 의미 있음)
+--db-latency-ms 를 주면 Postgres 에서 pg_sleep 으로 느린 쿼리를 흉내냅니다.
+
+사용법:
+    python -m benchmarks.bench_async_vs_sync --concurrency 10 50 200 --requests 1000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.core.config import settings
+from src.db.session import AsyncSessionLocal, async_engine, engine
+from src.repositories import contents as contents_repo
+
+_db_latency = 0.0
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    use_sleep = settings.DATABASE_URL.startswith("postgres")
+
+    @app.get("/sync")
+    def sync_route():
+        with Session(engine) as db:
+            if use_sleep and _db_latency:
+                db.exec(text("SELECT pg_sleep(:s)").bindparams(s=_db_latency))
+            items, total = contents_repo.list_contents(
+                db, q=None, genre_id=None, sort="latest", page=1, size=20
+            )
+            return {"count": len(items), "total": total}
+
+    @app.get("/async")
+    async def async_route():
+        async with AsyncSessionLocal() as db:
+            if use_sleep and _db_latency:
+                await db.exec(text("SELECT pg_sleep(:s)").bindparams(s=_db_latency))
+            items, total = await contents_repo.list_contents_async(
+                db, q=None, genre_id=None, sort="latest", page=1, size=20
+            )
+            return {"count": len(items), "total": total}
+
+    return app
+
+
+async def _run(client: httpx.AsyncClient, path: str, concurrency: int, n: int):
+    latencies: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with sem:
+            start = time.perf_counter()
+            resp = await client.get(path)
+            resp.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(n)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return n / elapsed, statistics.median(latencies) * 1000, p99 * 1000
+
+
+async def _main(args) -> None:
+    app = _build_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 커넥션 풀 워밍업
+        await client.get("/sync")
+        await client.get("/async")
+        print(f"{'path':>6} {'conc':>5} {'req/s':>9} {'p50_ms':>8} {'p99_ms':>8}")
+        for concurrency in args.concurrency:
+            for path in ("/sync", "/async"):
+                rps, p50, p99 = await _run(client, path, concurrency, args.requests)
+                print(f"{path:>6} {concurrency:>5} {rps:>9.1f} {p50:>8.1f} {p99:>8.1f}")
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main() -> None:
+    global _db_latency
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--db-latency-ms", type=float, default=0)
+    args = parser.parse_args()
+    _db_latency = args.db_latency_ms / 1000
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
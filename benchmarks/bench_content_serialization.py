@@ -0,0 +1,118 @@
+"""
+콘텐츠 목록/상세 응답 생성 CPU 시간 벤치마크 (DB/네트워크 제외).
+
+ORM 객체와 장르 행을 메모리에 만들어 두고 응답 bytes 를 만들기까지의 시간을 비교합니다.
+- legacy: 장르마다 GenreBrief.model_validate -> ContentBase.model_validate
+          -> model_dump() 로 풀어 ContentResponse(**...) -> model_dump() -> jsonable_encoder -> json
+- current: dict 를 한 번 만들어 최상위 모델에서 한 번 검증 -> pydantic_core 로 한 번 직렬화
+
+사용법:
+    python -m benchmarks.bench_content_serialization --items 20 --number 1000
+"""
+import argparse
+import json
+import timeit
+from datetime import date, datetime, timedelta
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api.routes.contents import _content_dict, _tmdb_payload
+from src.core.errors import success_response
+from src.db.models import Content, Genre
+from src.schemas.contents import ContentBase, ContentListResponse, ContentResponse, GenreBrief
+
+TMDB_DETAIL = {
+    "id": 603, "title": "The Matrix", "overview": "x" * 300, "release_date": "1999-03-30",
+    "runtime": 136, "poster_path": "/p.jpg", "backdrop_path": "/b.jpg", "original_language": "en",
+    "popularity": 83.1, "vote_average": 8.2, "vote_count": 25000,
+    "genres": [{"id": 28, "name": "Action"}, {"id": 878, "name": "Science Fiction"}],
+}
+
+
+def _fixtures(n: int):
+    now = datetime.utcnow()
+    contents = [
+        Content(
+            id=i, tmdb_id=100000 + i, title=f"영화 제목 {i}",
+            release_date=date(2000, 1, 1) + timedelta(days=i), runtime_minutes=120,
+            created_at=now, updated_at=now,
+        )
+        for i in range(1, n + 1)
+    ]
+    genre_rows = [(1, "Action"), (2, "Drama"), (3, "Science Fiction")]
+    genre_entities = [Genre(id=gid, tmdb_genre_id=gid, name=name) for gid, name in genre_rows]
+    return contents, genre_rows, genre_entities
+
+
+def _legacy_base(content, genre_entities) -> ContentBase:
+    genres = [GenreBrief.model_validate(g) for g in genre_entities]
+    return ContentBase.model_validate({
+        "id": content.id, "tmdb_id": content.tmdb_id, "title": content.title,
+        "release_date": content.release_date, "runtime_minutes": content.runtime_minutes,
+        "created_at": content.created_at, "updated_at": content.updated_at,
+        "deleted_at": content.deleted_at, "genres": genres,
+    })
+
+
+def _legacy_response(request: Request, data) -> JSONResponse:
+    return JSONResponse(jsonable_encoder({
+        "timestamp": "2025-01-01T00:00:00Z", "path": request.url.path, "status": 200,
+        "code": "SUCCESS", "message": "성공", "data": data,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    contents, genre_rows, genre_entities = _fixtures(args.items)
+    request = Request({
+        "type": "http", "method": "GET", "scheme": "http", "server": ("bench", 80),
+        "path": "/contents", "query_string": b"", "headers": [],
+    })
+
+    def legacy_list():
+        payload = ContentListResponse(
+            items=[_legacy_base(c, genre_entities) for c in contents], page=1, size=args.items, total=100,
+        )
+        return _legacy_response(request, payload.model_dump())
+
+    def current_list():
+        payload = ContentListResponse.model_validate({
+            "items": [_content_dict(c, genre_rows) for c in contents], "page": 1, "size": args.items, "total": 100,
+        })
+        return success_response(request, data=payload)
+
+    def legacy_detail():
+        response = ContentResponse(
+            **_legacy_base(contents[0], genre_entities).model_dump(), tmdb=_tmdb_payload(TMDB_DETAIL),
+        )
+        return _legacy_response(request, response.model_dump())
+
+    def current_detail():
+        response = ContentResponse.model_validate(
+            {**_content_dict(contents[0], genre_rows), "tmdb": _tmdb_payload(TMDB_DETAIL)}
+        )
+        return success_response(request, data=response)
+
+    for legacy, current in ((legacy_list, current_list), (legacy_detail, current_detail)):
+        assert json.loads(legacy().body)["data"] == json.loads(current().body)["data"]
+
+    print(f"{'case':>16} {'us/request':>11} {'speedup':>8}")
+    for label, legacy, current in (
+        (f"list ({args.items})", legacy_list, current_list),
+        ("detail", legacy_detail, current_detail),
+    ):
+        results = []
+        for fn in (legacy, current):
+            results.append(min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number * 1e6)
+        print(f"{label + ' legacy':>16} {results[0]:>11.1f}")
+        print(f"{label + ' current':>16} {results[1]:>11.1f} {results[0] / results[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+미들웨어 스택 요청당 오버헤드 벤치마크 (네트워크 제외, ASGI 앱을 직접 호출).
+
+main.py 와 같은 순서의 스택(CORS -> 압축 -> 요청 로그)을 작은 앱에 씌워 비교합니다.
+- base:   CORS + 압축 (요청 로그 미들웨어 없음)
+- legacy: base + app.middleware("http") 방식 로그 미들웨어 (BaseHTTPMiddleware)
+- asgi:   base + LoggingMiddleware (현재, 순수 ASGI)
+Rate limit 은 미들웨어가 아닌 라우트 의존성(enforce_rate_limit)이라 비교 대상에서 제외합니다.
+
+사용법:
+    python -m benchmarks.bench_middleware_stack --number 5000
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+
+from src.core import metrics as prom
+from src.core import tracing
+from src.core.logging import access_logger
+from src.core.request_context import reset_route, set_route
+from src.db import instrumentation as sql_stats
+from src.middlewares.compression import CompressionMiddleware
+from src.middlewares.logging import LoggingMiddleware, _server_timing
+
+
+async def legacy_logging_middleware(request: Request, call_next):
+    # 교체 전 app.middleware("http") 로그 미들웨어와 같은 일을 하는 비교용 구현
+    start = time.perf_counter()
+    token = set_route(request.method, request.url.path)
+    stats, stats_token = sql_stats.start_request()
+    in_progress = prom.HTTP_IN_PROGRESS.labels(request.method)
+    in_progress.inc()
+    span, span_token = tracing.start_request(
+        request.method, request.url.path, request.headers.get("traceparent")
+    )
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        prom.observe_request(request.method, prom.route_label(request.scope), status, elapsed_ms / 1000)
+        access_logger.info("%s %s -> %s (%.1fms, db %d queries %.1fms)",
+                           request.method, request.url.path, status, elapsed_ms,
+                           stats.count, stats.total_ms)
+        response.headers["Server-Timing"] = _server_timing(stats, elapsed_ms)
+        return response
+    finally:
+        tracing.end_request(span, span_token, getattr(request.scope.get("route"), "path", None), status)
+        in_progress.dec()
+        sql_stats.end_request(stats_token)
+        reset_route(token)
+
+
+def build_app(kind: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id, "title": "영화 제목"}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(10):
+                yield f"{i},row\n".encode()
+        return StreamingResponse(chunks(), media_type="text/csv")
+
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"], allow_credentials=True,
+                       allow_methods=["*"], allow_headers=["*"])
+    app.add_middleware(CompressionMiddleware)
+    if kind == "legacy":
+        app.middleware("http")(legacy_logging_middleware)
+    elif kind == "asgi":
+        app.add_middleware(LoggingMiddleware)
+    return app
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "server": ("bench", 80), "client": ("127.0.0.1", 5000),
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [
+            (b"host", b"bench"), (b"origin", b"http://localhost:3000"),
+            (b"accept-encoding", b"gzip, br"), (b"user-agent", b"bench"),
+        ],
+    }
+
+
+async def _call(app, path: str) -> int:
+    messages = []
+    received = False
+
+    async def receive():
+        # 요청 본문은 한 번만 주고, 이후(연결 끊김 대기)에는 응답이 끝날 때까지 대기
+        nonlocal received
+        if received:
+            await asyncio.Event().wait()
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(_scope(path), receive, send)
+    assert messages[0]["status"] == 200
+    return sum(1 for m in messages if m["type"] == "http.response.body")
+
+
+async def _measure(apps: dict, path: str, number: int, repeat: int = 7) -> dict:
+    for app in apps.values():
+        for _ in range(200):  # warm-up (미들웨어 스택 생성 등)
+            await _call(app, path)
+    # 스택을 번갈아 측정하여 시간에 따른 편차가 한쪽에만 몰리지 않게 하고, 최솟값 사용
+    best = {kind: float("inf") for kind in apps}
+    for _ in range(repeat):
+        for kind, app in apps.items():
+            start = time.perf_counter()
+            for _ in range(number):
+                await _call(app, path)
+            best[kind] = min(best[kind], (time.perf_counter() - start) / number)
+    return {kind: t * 1e6 for kind, t in best.items()}
+
+
+async def main_async(number: int) -> None:
+    apps = {kind: build_app(kind) for kind in ("base", "legacy", "asgi")}
+    # 스트리밍 응답이 조각 단위로 전달되는지 (body 메시지 수)
+    for kind, app in apps.items():
+        print(f"{kind:>6}: /stream -> {await _call(app, '/stream')} body messages")
+
+    for label, path in (("json", "/items/1"), ("stream", "/stream")):
+        results = await _measure(apps, path, number)
+        print(f"\n{label} ({path})")
+        print(f"{'stack':>8} {'us/request':>11} {'overhead':>9}")
+        for kind, us in results.items():
+            print(f"{kind:>8} {us:>11.1f} {us - results['base']:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+로그인(비밀번호 검증) 처리량 벤치마크.
+
+- 단일 스레드 verify_password 로 "코어당 초당 로그인 수"를 측정하고
+- 전용 해시 풀(verify_password_async)로 동시 요청을 흘려 전체 처리량과 대기 시간을 확인합니다.
+
+사용법:
+    python -m benchmarks.bench_password_hashing --rounds 10 12 --requests 200
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from src.core import security
+from src.core.config import settings
+
+
+def _bench_single(rounds: int, n: int) -> float:
+    settings.BCRYPT_ROUNDS = rounds
+    password_hash = security.hash_password("password123")
+    start = time.perf_counter()
+    for _ in range(n):
+        security.verify_password("password123", password_hash)
+    return n / (time.perf_counter() - start)
+
+
+async def _bench_pool(rounds: int, n: int) -> float:
+    settings.BCRYPT_ROUNDS = rounds
+    password_hash = security.hash_password("password123")
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        security.verify_password_async("password123", password_hash) for _ in range(n)
+    ])
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 12])
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    workers = security._hasher.workers
+    print(f"cpu_count={os.cpu_count()} hash_workers={workers}")
+    print(f"{'rounds':>6} {'logins/s/core':>14} {'pool logins/s':>14} {'pool/worker':>12} {'wait_avg_ms':>12}")
+    for rounds in args.rounds:
+        single = _bench_single(rounds, max(args.requests // 10, 5))
+        # 라운드별로 통계를 새로 집계하고, 대기열 제한으로 거절되지 않도록 충분히 크게
+        security._hasher.shutdown()
+        security._hasher = security._PasswordHasher(workers, args.requests)
+        pooled = asyncio.run(_bench_pool(rounds, args.requests))
+        stats = security.password_hasher_stats()
+        print(
+            f"{rounds:>6} {single:>14.1f} {pooled:>14.1f} "
+            f"{pooled / workers:>12.1f} {stats['wait_avg_ms']:>12.1f}"
+        )
+    security.shutdown_password_hasher()
+
+
+if __name__ == "__main__":
+    main()
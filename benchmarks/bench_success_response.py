@@ -0,0 +1,91 @@
+"""
+success_response 직렬화 경로 마이크로벤치마크.
+
+콘텐츠 50개(장르 3개씩) 목록 응답을 만드는 데 걸리는 시간을 비교합니다.
+- legacy:     model_dump() + jsonable_encoder + JSONResponse(stdlib json)
+- dump+fast:  model_dump() 한 dict 를 FastJSONResponse 로 직렬화
+- model+fast: 모델을 그대로 success_response 에 전달 (현재 권장 방식)
+
+사용법:
+    python -m benchmarks.bench_success_response --items 50 --number 2000
+"""
+import argparse
+import json
+import timeit
+from datetime import date, datetime, timedelta
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.core.errors import ErrorCode, FastJSONResponse, _utc_now_iso, success_response
+from src.schemas.contents import ContentBase, ContentListResponse, GenreBrief
+
+
+def _payload(n: int) -> ContentListResponse:
+    now = datetime.utcnow()
+    genres = [GenreBrief(id=i, name=name) for i, name in enumerate(["Action", "Drama", "Science Fiction"], 1)]
+    items = [
+        ContentBase(
+            id=i,
+            tmdb_id=100000 + i,
+            title=f"영화 제목 {i}",
+            release_date=date(2000, 1, 1) + timedelta(days=i),
+            runtime_minutes=120,
+            created_at=now,
+            updated_at=now,
+            genres=genres,
+        )
+        for i in range(n)
+    ]
+    return ContentListResponse(items=items, page=1, size=n, total=n * 10)
+
+
+def _request() -> Request:
+    return Request({
+        "type": "http", "method": "GET", "scheme": "http", "server": ("bench", 80),
+        "path": "/contents", "query_string": b"", "headers": [],
+    })
+
+
+def _envelope(request: Request, data) -> dict:
+    return {
+        "timestamp": _utc_now_iso(),
+        "path": request.url.path,
+        "status": 200,
+        "code": ErrorCode.SUCCESS.value,
+        "message": "콘텐츠 목록 조회 성공",
+        "data": data,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = _payload(args.items)
+    request = _request()
+
+    cases = {
+        "legacy": lambda: JSONResponse(jsonable_encoder(_envelope(request, payload.model_dump()))),
+        "dump+fast": lambda: FastJSONResponse(_envelope(request, payload.model_dump())),
+        "model+fast": lambda: success_response(request, data=payload, message="콘텐츠 목록 조회 성공"),
+    }
+
+    # 세 경로의 data 가 같은 JSON 을 만드는지 확인
+    bodies = {name: json.loads(fn().body)["data"] for name, fn in cases.items()}
+    assert bodies["legacy"] == bodies["dump+fast"] == bodies["model+fast"]
+
+    print(f"{args.items} items, {len(cases['model+fast']().body):,} bytes")
+    print(f"{'path':>11} {'us/response':>12} {'speedup':>8}")
+    baseline = None
+    for name, fn in cases.items():
+        per_call = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number * 1e6
+        baseline = baseline or per_call
+        print(f"{name:>11} {per_call:>12.1f} {baseline / per_call:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,12 @@ echo " 배포 환경 시작: DB Seeding 시도..."
 # 시딩 스크립트 실행
 python -m seed.seed
 
+# 여러 워커의 Prometheus 메트릭을 합산하는 경우, 이전 실행의 파일이 섞이지 않도록 비움
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+  rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+  mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 echo "🔥 메인 서버 실행..."
 # Dockerfile의 CMD에서 전달된 명령어(uvicorn ...)를 실행
 exec "$@"
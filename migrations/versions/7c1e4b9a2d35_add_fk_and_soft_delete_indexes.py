@@ -0,0 +1,65 @@
+"""add fk and soft delete indexes
+
+Revision ID: 7c1e4b9a2d35
+Revises: 52080c49d898
+Create Date: 2026-10-19 10:12:03.418220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9a2d35'
+down_revision: Union[str, Sequence[str], None] = '52080c49d898'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, partial WHERE)
+# CREATE INDEX CONCURRENTLY 로 생성하여 운영 중인 DB 의 쓰기를 막지 않습니다.
+# (트랜잭션 안에서 실행할 수 없으므로 autocommit_block 사용,
+#  중간에 실패해 INVALID 인덱스가 남으면 DROP 후 다시 실행)
+INDEXES = [
+    # 콘텐츠별 리뷰 목록 (createdAt 정렬)
+    ('ix_reviews_content_id_created_at', 'reviews', ['content_id', 'created_at'], None),
+    # 내 리뷰 목록/내보내기, 중복 리뷰 확인
+    ('ix_reviews_user_id_created_at', 'reviews', ['user_id', 'created_at'], None),
+    # 리뷰별 좋아요 집계 (PK 가 (user_id, review_id) 라 review_id 단독 조회는 못 씀)
+    ('ix_review_likes_review_id', 'review_likes', ['review_id'], None),
+    # 내 북마크 목록 (createdAt 정렬)
+    ('ix_bookmarks_user_id_created_at', 'bookmarks', ['user_id', 'created_at'], None),
+    # 장르별 콘텐츠 필터 (PK 가 (content_id, genre_id))
+    ('ix_content_genres_genre_id', 'content_genres', ['genre_id'], None),
+    # 삭제되지 않은 콘텐츠 최신순 목록
+    ('ix_contents_created_at_active', 'contents', ['created_at'], 'deleted_at IS NULL'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
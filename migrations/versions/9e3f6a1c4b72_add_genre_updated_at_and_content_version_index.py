@@ -0,0 +1,49 @@
+"""add genre updated_at and content version index
+
+Revision ID: 9e3f6a1c4b72
+Revises: 7c1e4b9a2d35
+Create Date: 2026-10-19 15:40:27.915034
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3f6a1c4b72'
+down_revision: Union[str, Sequence[str], None] = '7c1e4b9a2d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 장르 목록/콘텐츠 응답의 ETag 버전 값 (기존 행은 created_at 으로 채움)
+    op.add_column('genres', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE genres SET updated_at = created_at")
+    op.alter_column('genres', 'updated_at', nullable=False)
+
+    # 콘텐츠 목록 ETag 의 max(updated_at) 조회용 (CONCURRENTLY: 쓰기를 막지 않음)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contents_updated_at',
+            'contents',
+            ['updated_at'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_contents_updated_at',
+            table_name='contents',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_column('genres', 'updated_at')
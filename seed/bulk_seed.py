@@ -0,0 +1,392 @@
+"""
+부하 테스트용 대용량 더미 데이터 생성기.
+
+seed/seed.py 는 개발용 소량 데이터(유저 20명, 콘텐츠 50개)를 한 건씩 커밋하므로
+운영 규모의 실행 계획을 재현할 수 없습니다. 이 스크립트는
+- 콘텐츠 인기도(리뷰/북마크 대상)와 리뷰 인기도(좋아요 대상)를 Zipf 분포로 치우치게 만들고
+- Postgres 는 COPY, 그 외 DB 는 다중 행 INSERT 로 청크 단위 적재하며
+- 비밀번호 해시는 한 번만 계산해 모든 유저에 재사용하고
+- id 범위를 나눠 여러 프로세스가 동시에 적재합니다.
+
+기존 데이터는 지우지 않고 각 테이블의 max(id) 다음부터 추가합니다.
+(장르는 seed.py 와 같은 목록을 사용, 생성된 유저 비밀번호는 --password)
+
+사용법:
+    python -m seed.bulk_seed --users 1000000 --contents 200000 \\
+        --reviews 10000000 --likes 30000000 --bookmarks 5000000 --workers 8
+"""
+import argparse
+import io
+import itertools
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import create_engine, func, select, text
+from sqlmodel import Session, SQLModel
+
+from src.core.config import settings
+from src.core.security import hash_password
+from src.db.models import Content, Genre, Review, User, UserRole, UserStatus
+from seed.seed import ADJECTIVES, NOUNS, create_genres
+
+COMMENTS = [
+    "정말 최고의 영화였습니다!", "시간 가는 줄 모르고 봤네요.", "기대보다는 조금 아쉬웠어요.",
+    "배우들의 연기가 일품입니다.", "인생 영화 등극!", "연출이 대박이네요.",
+    "스토리가 탄탄합니다.", "음악이 너무 좋아요.", "한 번 더 보고 싶어요.", "그저 그랬습니다.",
+]
+# 평점은 4~5점에 몰리도록
+RATING_WEIGHTS = [0.05, 0.08, 0.17, 0.35, 0.35]
+# 가짜 tmdb_id 는 실제 TMDB id 와 겹치지 않게 큰 수부터
+FAKE_TMDB_ID_BASE = 100_000_000
+# 최근 3년 사이에 고르게 생성
+NOW = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+SPAN_SECONDS = 3 * 365 * 24 * 3600
+
+USER_COLUMNS = ("id", "email", "password_hash", "nickname", "role", "status", "created_at", "updated_at")
+CONTENT_COLUMNS = ("id", "tmdb_id", "title", "release_date", "runtime_minutes", "created_at", "updated_at", "deleted_at")
+CONTENT_GENRE_COLUMNS = ("content_id", "genre_id")
+REVIEW_COLUMNS = ("id", "user_id", "content_id", "rating", "comment", "like_count", "created_at", "updated_at")
+LIKE_COLUMNS = ("user_id", "review_id", "created_at")
+BOOKMARK_COLUMNS = ("user_id", "content_id", "created_at")
+
+
+# ==========================================
+# 분포
+# ==========================================
+
+class Zipf:
+    """
+    start..start+n-1 id 에 1/rank^s 가중치를 주는 샘플러.
+    순위와 id 의 대응은 seed 로 섞어 인기 항목이 id 순서(=생성 시각)와 무관하게 분포합니다.
+    같은 seed 로 만들면 모든 프로세스에서 같은 인기 순위를 가집니다.
+    """
+
+    def __init__(self, start: int, n: int, s: float, seed: int):
+        self.ids = list(range(start, start + n))
+        random.Random(seed).shuffle(self.ids)
+        self.cum_weights = list(itertools.accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+
+    def sample(self, rng: random.Random, k: int) -> List[int]:
+        return rng.choices(self.ids, cum_weights=self.cum_weights, k=k)
+
+
+def _random_time(rng: random.Random, after: Optional[datetime] = None) -> datetime:
+    if after is None:
+        return NOW - timedelta(seconds=rng.randrange(SPAN_SECONDS))
+    remaining = int((NOW - after).total_seconds())
+    return after + timedelta(seconds=rng.randrange(remaining + 1))
+
+
+# ==========================================
+# 적재 (COPY / 다중 행 INSERT)
+# ==========================================
+
+def _copy_value(value) -> str:
+    # COPY text 포맷: NULL 은 \N, 생성 값에는 탭/개행/역슬래시가 없음
+    return "\\N" if value is None else str(value)
+
+
+def _write(conn, table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+    if not rows:
+        return
+    if conn.dialect.name == "postgresql":
+        buf = io.StringIO()
+        buf.writelines("\t".join(map(_copy_value, row)) + "\n" for row in rows)
+        buf.seek(0)
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+        finally:
+            cursor.close()
+    else:
+        table_obj = SQLModel.metadata.tables[table]
+        conn.execute(table_obj.insert(), [dict(zip(columns, row)) for row in rows])
+
+
+_engine = None
+
+
+def _worker_init(url: str) -> None:
+    # 프로세스마다 자체 엔진/커넥션 사용 (부모의 커넥션을 fork 로 공유하지 않음)
+    global _engine
+    _engine = create_engine(url, pool_size=1, max_overflow=0) if url.startswith("postgres") else create_engine(url)
+
+
+def _load(chunks: Iterable[Iterable[Tuple[str, Sequence[str], List[tuple]]]]) -> int:
+    """청크마다 한 트랜잭션으로 적재하고 적재한 행 수를 반환합니다."""
+    written = 0
+    for chunk in chunks:
+        with _engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                # 재생성 가능한 더미 데이터이므로 커밋 시 WAL flush 를 기다리지 않음
+                conn.execute(text("SET LOCAL synchronous_commit = off"))
+            for table, columns, rows in chunk:
+                _write(conn, table, columns, rows)
+                written += len(rows)
+    return written
+
+
+# ==========================================
+# 테이블별 생성 (id 범위 단위로 워커에서 실행)
+# ==========================================
+
+def _users(task) -> int:
+    lo, hi, password_hash, seed, chunk_size = task
+    rng = random.Random(seed)
+
+    def chunks():
+        for start in range(lo, hi, chunk_size):
+            rows = []
+            for uid in range(start, min(start + chunk_size, hi)):
+                created = _random_time(rng)
+                rows.append((
+                    uid, f"bulk{uid}@example.com", password_hash, f"유저{uid}",
+                    UserRole.USER.value, UserStatus.ACTIVE.value, created, created,
+                ))
+            yield [("users", USER_COLUMNS, rows)]
+
+    return _load(chunks())
+
+
+def _contents(task) -> int:
+    lo, hi, genre_ids, deleted_ratio, seed, chunk_size = task
+    rng = random.Random(seed)
+
+    def chunks():
+        for start in range(lo, hi, chunk_size):
+            contents, links = [], []
+            for cid in range(start, min(start + chunk_size, hi)):
+                created = _random_time(rng)
+                deleted = _random_time(rng, after=created) if rng.random() < deleted_ratio else None
+                contents.append((
+                    cid, FAKE_TMDB_ID_BASE + cid,
+                    f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {cid}",
+                    date(2000, 1, 1) + timedelta(days=rng.randrange(9000)),
+                    rng.randint(80, 180), created, created, deleted,
+                ))
+                for gid in rng.sample(genre_ids, k=min(len(genre_ids), rng.randint(1, 3))):
+                    links.append((cid, gid))
+            yield [("contents", CONTENT_COLUMNS, contents), ("content_genres", CONTENT_GENRE_COLUMNS, links)]
+
+    return _load(chunks())
+
+
+class _Reviewers:
+    """
+    콘텐츠별로 서로 다른 작성자를 고릅니다. (유저당 콘텐츠 하나에 리뷰 하나)
+    콘텐츠마다 무작위 시작 위치에서 유저 구간을 stride 간격으로 순회하므로,
+    구간 크기만큼은 같은 유저가 다시 나오지 않고 콘텐츠당 정수 두 개만 기억합니다.
+    """
+
+    def __init__(self, start: int, n: int, rng: random.Random):
+        self.start, self.n, self.rng = start, n, rng
+        # n 과 서로소인 stride 여야 n 번 안에 모든 유저를 한 번씩 지남
+        self.stride = max(1, int(n * 0.618)) if n > 2 else 1
+        while math.gcd(self.stride, n) != 1:
+            self.stride += 1
+        self.given: dict = {}  # content_id -> [시작 위치, 배정한 수]
+
+    def full(self, content_id: int) -> bool:
+        state = self.given.get(content_id)
+        return state is not None and state[1] >= self.n
+
+    def pick(self, content_id: int) -> int:
+        state = self.given.setdefault(content_id, [self.rng.randrange(self.n), 0])
+        user = self.start + (state[0] + state[1] * self.stride) % self.n
+        state[1] += 1
+        return user
+
+
+def _reviews(task) -> int:
+    """
+    리뷰와 그 리뷰의 좋아요를 같은 청크에서 만들어 like_count 를 좋아요 행 수와 맞춥니다.
+    좋아요 대상은 청크(chunk_size 리뷰) 안에서 Zipf 분포로 고릅니다.
+    작성자는 프로세스마다 겹치지 않는 유저 구간(authors)에서 골라 (user_id, content_id) 가 중복되지 않습니다.
+    """
+    lo, hi, users, authors, contents, likes_per_review, skew, seed, chunk_size = task
+    rng = random.Random(seed)
+    user_lo, user_n = users
+    reviewers = _Reviewers(*authors, rng=rng)
+    content_picker = Zipf(*contents, s=skew, seed=0)
+    review_picker = Zipf(0, chunk_size, s=skew, seed=seed)
+
+    def chunks():
+        for start in range(lo, hi, chunk_size):
+            n = min(chunk_size, hi - start)
+            like_counts = Counter(
+                i for i in review_picker.sample(rng, int(n * likes_per_review)) if i < n
+            )
+            reviews, likes = [], []
+            content_ids = content_picker.sample(rng, n)
+            ratings = rng.choices(range(1, 6), weights=RATING_WEIGHTS, k=n)
+            for i in range(n):
+                rid = start + i
+                content_id = content_ids[i]
+                # 구간의 모든 유저가 이미 리뷰한 콘텐츠는 다시 뽑음 (main 에서 총량을 검증)
+                while reviewers.full(content_id):
+                    content_id = content_picker.sample(rng, 1)[0]
+                created = _random_time(rng)
+                like_count = min(like_counts.get(i, 0), user_n)
+                reviews.append((
+                    rid, reviewers.pick(content_id), content_id, ratings[i],
+                    rng.choice(COMMENTS), like_count, created, created,
+                ))
+                for offset in rng.sample(range(user_n), like_count):
+                    likes.append((user_lo + offset, rid, _random_time(rng, after=created)))
+            yield [("reviews", REVIEW_COLUMNS, reviews), ("review_likes", LIKE_COLUMNS, likes)]
+
+    return _load(chunks())
+
+
+def _bookmarks(task) -> int:
+    lo, hi, contents, bookmarks_per_user, skew, seed, chunk_size = task
+    rng = random.Random(seed)
+    content_picker = Zipf(*contents, s=skew, seed=0)
+    max_per_user = max(1, contents[1] // 2)
+
+    def chunks():
+        for start in range(lo, hi, chunk_size):
+            users = range(start, min(start + chunk_size, hi))
+            per_user = Counter(rng.choices(users, k=int(len(users) * bookmarks_per_user)))
+            rows = []
+            for uid, k in per_user.items():
+                picked = set()
+                # 인기 콘텐츠가 자주 뽑히므로 중복은 다시 뽑음 (PK: user_id, content_id)
+                while len(picked) < min(k, max_per_user):
+                    picked.update(content_picker.sample(rng, k - len(picked)))
+                for cid in itertools.islice(picked, k):
+                    rows.append((uid, cid, _random_time(rng)))
+            yield [("bookmarks", BOOKMARK_COLUMNS, rows)]
+
+    return _load(chunks())
+
+
+# ==========================================
+# 실행
+# ==========================================
+
+def _ranges(lo: int, n: int, parts: int, seed: int) -> List[Tuple[int, int, int]]:
+    """[lo, lo+n) 를 parts 개 구간으로 나누고 구간별 난수 seed 를 붙입니다."""
+    step = -(-n // parts) if n else 1
+    return [
+        (start, min(start + step, lo + n), seed * 1000 + i)
+        for i, start in enumerate(range(lo, lo + n, step))
+    ]
+
+
+def _next_id(db: Session, model) -> int:
+    return (db.scalar(select(func.max(model.id))) or 0) + 1
+
+
+def _run(pool: ProcessPoolExecutor, label: str, fn, tasks: list) -> None:
+    start = time.perf_counter()
+    rows = sum(pool.map(fn, tasks))
+    elapsed = time.perf_counter() - start
+    print(f"  - {label}: {rows:,} rows in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
+
+
+def _reset_sequences(db: Session) -> None:
+    # id 를 직접 지정해 넣었으므로 이후 앱의 INSERT 가 충돌하지 않도록 시퀀스를 맞춤
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for table in ("users", "contents", "reviews"):
+        db.exec(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(max(id), 1) FROM {table}))"
+        ))
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--contents", type=int, default=50_000)
+    parser.add_argument("--reviews", type=int, default=1_000_000)
+    parser.add_argument("--likes", type=int, default=3_000_000)
+    parser.add_argument("--bookmarks", type=int, default=500_000)
+    parser.add_argument("--deleted-ratio", type=float, default=0.01, help="soft delete 된 콘텐츠 비율")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf 지수 (클수록 상위 항목에 집중)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--password", default="1234")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    url = settings.DATABASE_URL
+    workers = args.workers
+    if not url.startswith("postgres") and workers > 1:
+        print(" SQLite 등은 동시 쓰기를 지원하지 않으므로 --workers 1 로 실행합니다.")
+        workers = 1
+
+    # 리뷰 구간마다 작성자 유저 구간을 따로 주므로, 구간별 리뷰 수가 (유저 수 x 콘텐츠 수) 를 넘을 수 없음
+    review_ranges = _ranges(0, args.reviews, min(workers, args.users) or 1, args.seed + 2)
+    author_slices = [
+        (i * args.users // len(review_ranges), (i + 1) * args.users // len(review_ranges))
+        for i in range(len(review_ranges))
+    ]
+    if args.users and args.contents:
+        for (lo, hi, _), (a_lo, a_hi) in zip(review_ranges, author_slices):
+            if hi - lo > (a_hi - a_lo) * args.contents:
+                parser.error("--reviews 는 --users x --contents 보다 클 수 없습니다. (유저당 콘텐츠 하나에 리뷰 하나)")
+
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as db:
+        create_genres(db)
+        genre_ids = list(db.scalars(select(Genre.id)))
+        user_lo = _next_id(db, User)
+        content_lo = _next_id(db, Content)
+        review_lo = _next_id(db, Review)
+    # fork 전에 부모 커넥션 정리
+    engine.dispose()
+
+    print(" Hashing password once...")
+    password_hash = hash_password(args.password)
+
+    users = (user_lo, args.users)
+    contents = (content_lo, args.contents)
+    likes_per_review = args.likes / args.reviews if args.reviews else 0
+    bookmarks_per_user = args.bookmarks / args.users if args.users else 0
+    chunk = args.chunk_size
+
+    print(f" Loading with {workers} worker(s), chunk={chunk:,}...")
+    total_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init, initargs=(url,)) as pool:
+        _run(pool, "users", _users, [
+            (lo, hi, password_hash, seed, chunk)
+            for lo, hi, seed in _ranges(user_lo, args.users, workers, args.seed)
+        ])
+        _run(pool, "contents + content_genres", _contents, [
+            (lo, hi, genre_ids, args.deleted_ratio, seed, chunk)
+            for lo, hi, seed in _ranges(content_lo, args.contents, workers, args.seed + 1)
+        ])
+        if args.users and args.contents:
+            _run(pool, "reviews + review_likes", _reviews, [
+                (review_lo + lo, review_lo + hi, users, (user_lo + a_lo, a_hi - a_lo), contents,
+                 likes_per_review, args.skew, seed, chunk)
+                for (lo, hi, seed), (a_lo, a_hi) in zip(review_ranges, author_slices)
+            ])
+            _run(pool, "bookmarks", _bookmarks, [
+                (lo, hi, contents, bookmarks_per_user, args.skew, seed, chunk)
+                for lo, hi, seed in _ranges(user_lo, args.users, workers, args.seed + 3)
+            ])
+
+    engine = create_engine(url)
+    with Session(engine) as db:
+        _reset_sequences(db)
+    if url.startswith("postgres"):
+        # 통계를 갱신해야 실행 계획이 새 데이터 분포를 반영
+        with engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+    engine.dispose()
+    print(f" Bulk seed done in {time.perf_counter() - total_start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
 from datetime import datetime, timezone
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Query, Request
+from redis import Redis
 from sqlmodel import Session, select, func
 
+from src.core import revocation
+
 from src.core.docs import success_example, error_example
 from src.core.errors import ErrorCode, http_error, success_response, STANDARD_ERROR_RESPONSES
 from src.deps.auth import require_admin
 from src.deps.db import get_db
+from src.deps.redis import get_redis
 from src.db.models import User, UserRole, UserStatus
 from src.schemas.users import UserMeResponse
 
@@ -97,6 +103,7 @@ def change_role(
     user_id: int,
     role: str = Query(..., description="변경할 Role (USER, ADMIN)"),
     db: Session = Depends(get_db),
+    rds: Optional[Redis] = Depends(get_redis),
 ):
     user = db.get(User, user_id)
     if not user:
@@ -108,6 +115,7 @@ def change_role(
     user.role = role
     db.add(user)
     db.commit()
+    revocation.revoke_user_access(rds, user_id)
     
     return success_response(request, message="사용자 권한이 변경되었습니다.", data={"userId": user_id, "role": role})
 
@@ -126,6 +134,7 @@ def change_status(
     user_id: int,
     status: str = Query(..., description="변경할 Status (ACTIVE, BLOCKED)"),
     db: Session = Depends(get_db),
+    rds: Optional[Redis] = Depends(get_redis),
 ):
     user = db.get(User, user_id)
     if not user:
@@ -141,6 +150,7 @@ def change_status(
     db.add(user)
     db.commit()
     db.refresh(user)
+    revocation.revoke_user_access(rds, user_id)
     
     return success_response(
         request, 
@@ -166,6 +176,7 @@ def force_delete(
     request: Request,
     user_id: int,
     db: Session = Depends(get_db),
+    rds: Optional[Redis] = Depends(get_redis),
 ):
     user = db.get(User, user_id)
     if not user:
@@ -178,5 +189,6 @@ def force_delete(
     user.status = UserStatus.DELETED
     db.add(user)
     db.commit()
+    revocation.revoke_user_access(rds, user_id)
     
     return success_response(request, message="사용자를 강제 탈퇴 처리했습니다.", data={"userId": user_id})
\ No newline at end of file
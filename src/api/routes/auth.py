@@ -1,21 +1,28 @@
 import firebase_admin
-from firebase_admin import credentials, auth as firebase_auth
-from google.oauth2 import id_token as google_id_token
-from google.auth.transport import requests as google_requests
+from firebase_admin import credentials
 
 from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session
-from redis import Redis
+from redis import Redis, RedisError
 from typing import Optional
 
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.core import refresh_tokens
 from src.core.config import settings
+from src.core.logging import logger
+from src.core.social_auth import verifier as social_verifier
 from src.core.docs import success_example, error_example
 from src.core.errors import ErrorCode, http_error, success_response, STANDARD_ERROR_RESPONSES
-from src.core.security import verify_password, create_token, decode_token
+from src.core.security import (
+    access_token_claims, create_token, decode_token,
+    hash_password_async, needs_rehash, verify_password_async,
+)
 from src.db.models import User, UserStatus, UserRole
 from src.deps.db import get_db
 from src.deps.redis import get_redis
-from src.deps.auth import get_current_user
+from src.deps.auth import bearer, get_current_user
 from src.repositories import users as users_repo
 from src.schemas.auth import (
     LoginRequest, TokenResponse, RefreshRequest, 
@@ -36,11 +43,20 @@ router = APIRouter(
     responses=STANDARD_ERROR_RESPONSES
 )
 
-ACCESS_MIN = 30
-REFRESH_MIN = 60 * 24 * 7 
+ACCESS_MIN = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+REFRESH_MIN = settings.REFRESH_TOKEN_EXPIRE_MINUTES
+
+
+def _access_token(user: User, fid: str) -> str:
+    # role/status 클레임은 AUTH_STATELESS 모드에서 DB 조회 없이 인증할 때 사용됩니다.
+    # fid 는 로그아웃 시 해당 기기의 Refresh Token 패밀리만 폐기하기 위해 사용됩니다.
+    return create_token(
+        str(user.id), "access", ACCESS_MIN, extra={**access_token_claims(user), "fid": fid}
+    )
 
-def _refresh_key(user_id: int) -> str:
-    return f"refresh:{user_id}"
+
+def _refresh_token(user_id: int, fid: str, jti: str) -> str:
+    return create_token(str(user_id), "refresh", REFRESH_MIN, extra={"fid": fid, "jti": jti})
 
 # [Helper] 로그인 공통 처리
 def _process_social_login(request: Request, email: str, nickname: str, db: Session, rds: Optional[Redis]):
@@ -57,16 +73,7 @@ def _process_social_login(request: Request, email: str, nickname: str, db: Sessi
     elif user.deleted_at:
         raise http_error(403, ErrorCode.FORBIDDEN, "탈퇴한 계정입니다.")
 
-    access = create_token(str(user.id), "access", ACCESS_MIN)
-    refresh = create_token(str(user.id), "refresh", REFRESH_MIN)
-
-    if rds:
-        try:
-            rds.setex(_refresh_key(user.id), REFRESH_MIN * 60, refresh)
-        except Exception:
-            pass
-
-    return success_response(request, data={"access_token": access, "refresh_token": refresh}, message="로그인 성공")
+    return _issue_tokens(request, user, rds, message="로그인 성공")
 
 
 @router.post(
@@ -78,23 +85,37 @@ def _process_social_login(request: Request, email: str, nickname: str, db: Sessi
         403: error_example(403, ErrorCode.FORBIDDEN, "정지되었거나 탈퇴한 계정입니다."),
     }
 )
-def login(request: Request, body: LoginRequest, db: Session = Depends(get_db), rds: Optional[Redis] = Depends(get_redis)):
-    user = users_repo.get_user_by_email(db, body.email)
-    if not user or user.deleted_at or not verify_password(body.password, user.password_hash):
+async def login(request: Request, body: LoginRequest, db: Session = Depends(get_db), rds: Optional[Redis] = Depends(get_redis)):
+    # DB/Redis 호출은 짧게 스레드 풀에서, bcrypt는 전용 해시 풀에서 실행
+    user = await run_in_threadpool(users_repo.get_user_by_email, db, body.email)
+    if not user or user.deleted_at or not await verify_password_async(body.password, user.password_hash):
         raise http_error(401, ErrorCode.UNAUTHORIZED, "이메일/비번 불일치")
     if user.status in (UserStatus.BLOCKED, UserStatus.DELETED):
         raise http_error(403, ErrorCode.FORBIDDEN, "정지된 계정")
 
-    access = create_token(str(user.id), "access", ACCESS_MIN)
-    refresh = create_token(str(user.id), "refresh", REFRESH_MIN)
+    # BCRYPT_ROUNDS 가 바뀐 경우 로그인 시점에 평문으로 재해시
+    if needs_rehash(user.password_hash):
+        new_hash = await hash_password_async(body.password)
+        await run_in_threadpool(users_repo.update_password_hash, db, user, new_hash)
+
+    return await run_in_threadpool(_issue_tokens, request, user, rds)
+
+
+def _issue_tokens(request: Request, user: User, rds: Optional[Redis], message: str = "성공"):
+    # 로그인마다 새 패밀리를 만들어 기기별 세션을 독립적으로 유지
+    fid, jti = refresh_tokens.new_id(), refresh_tokens.new_id()
+    access = _access_token(user, fid)
+    refresh = _refresh_token(user.id, fid, jti)
 
     if rds:
         try:
-            rds.setex(_refresh_key(user.id), REFRESH_MIN * 60, refresh)
-        except Exception:
-            pass
+            refresh_tokens.issue(rds, user.id, fid, jti)
+        except Exception as e:
+            logger.warning("refresh token store failed (user=%s): %s", user.id, e)
 
-    return success_response(request, data={"access_token": access, "refresh_token": refresh})
+    return success_response(
+        request, data={"access_token": access, "refresh_token": refresh}, message=message
+    )
 
 
 @router.post(
@@ -103,6 +124,8 @@ def login(request: Request, body: LoginRequest, db: Session = Depends(get_db), r
     responses={
         **success_example(TokenResponse, message="토큰 갱신 성공"),
         401: error_example(401, ErrorCode.UNAUTHORIZED, "유효하지 않거나 만료된 토큰입니다."),
+        403: error_example(403, ErrorCode.FORBIDDEN, "정지되었거나 탈퇴한 계정입니다."),
+        503: error_example(503, ErrorCode.SERVICE_UNAVAILABLE, "토큰 저장소를 사용할 수 없습니다. 잠시 후 다시 시도해주세요."),
     }
 )
 def refresh(request: Request, body: RefreshRequest, db: Session = Depends(get_db), rds: Optional[Redis] = Depends(get_redis)):
@@ -110,18 +133,38 @@ def refresh(request: Request, body: RefreshRequest, db: Session = Depends(get_db
         payload = decode_token(body.refresh_token)
     except ValueError:
         raise http_error(401, ErrorCode.UNAUTHORIZED, "유효하지 않은 토큰")
-        
+    if payload.get("type") != "refresh":
+        raise http_error(401, ErrorCode.UNAUTHORIZED, "유효하지 않은 토큰")
+
     user_id = int(payload.get("sub", 0))
-    if rds:
-        saved = rds.get(_refresh_key(user_id))
-        if not saved or saved != body.refresh_token:
-            raise http_error(401, ErrorCode.UNAUTHORIZED, "만료된 토큰")
+    fid, jti = payload.get("fid"), payload.get("jti")
+    if not fid or not jti:
+        raise http_error(401, ErrorCode.UNAUTHORIZED, "만료된 토큰")
+    # 패밀리 저장소 없이 갱신하면 교체/재사용된 토큰과 로그아웃한 기기의 토큰까지 받아들이게 되므로
+    # Redis 를 쓸 수 없으면 거부 (fail closed)
+    if rds is None:
+        raise http_error(503, ErrorCode.SERVICE_UNAVAILABLE, "토큰 저장소를 사용할 수 없습니다. 잠시 후 다시 시도해주세요.")
+    # 패밀리 확인 + jti 교체를 Lua 스크립트 한 번으로 처리
+    try:
+        result, new_jti = refresh_tokens.rotate(rds, user_id, fid, jti)
+    except RedisError as e:
+        logger.warning("refresh token rotate failed (user=%s): %s", user_id, e)
+        raise http_error(503, ErrorCode.SERVICE_UNAVAILABLE, "토큰 저장소를 사용할 수 없습니다. 잠시 후 다시 시도해주세요.")
+    if result == refresh_tokens.REUSED:
+        logger.warning(f"REFRESH_TOKEN_REUSED user={user_id} fid={fid}")
+        raise http_error(401, ErrorCode.UNAUTHORIZED, "이미 사용된 토큰")
+    if result != refresh_tokens.ROTATED:
+        raise http_error(401, ErrorCode.UNAUTHORIZED, "만료된 토큰")
+
+    # 새 Access Token에 최신 role/status를 싣기 위해 사용자 상태를 다시 확인
+    user = users_repo.get_user_by_id(db, user_id)
+    if not user or user.deleted_at:
+        raise http_error(401, ErrorCode.UNAUTHORIZED, "유효하지 않은 토큰")
+    if user.status in (UserStatus.BLOCKED, UserStatus.DELETED):
+        raise http_error(403, ErrorCode.FORBIDDEN, "정지된 계정")
 
-    new_access = create_token(str(user_id), "access", ACCESS_MIN)
-    new_refresh = create_token(str(user_id), "refresh", REFRESH_MIN)
-    
-    if rds:
-        rds.setex(_refresh_key(user_id), REFRESH_MIN * 60, new_refresh)
+    new_access = _access_token(user, fid)
+    new_refresh = _refresh_token(user_id, fid, new_jti)
 
     return success_response(request, data={"access_token": new_access, "refresh_token": new_refresh})
 
@@ -133,12 +176,22 @@ def refresh(request: Request, body: RefreshRequest, db: Session = Depends(get_db
         401: error_example(401, ErrorCode.UNAUTHORIZED, "로그인이 필요합니다.")
     }
 )
-def logout(request: Request, user=Depends(get_current_user), rds: Optional[Redis] = Depends(get_redis)):
+def logout(
+    request: Request,
+    user=Depends(get_current_user),
+    creds: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
+    rds: Optional[Redis] = Depends(get_redis),
+):
     if rds:
+        # 현재 기기의 패밀리만 폐기 (fid 가 없는 구 토큰이면 전체 세션 폐기)
+        fid = decode_token(creds.credentials).get("fid")
         try:
-            rds.delete(_refresh_key(user.id))
-        except Exception:
-            pass
+            if fid:
+                refresh_tokens.revoke(rds, user.id, fid)
+            else:
+                refresh_tokens.revoke_all(rds, user.id)
+        except Exception as e:
+            logger.warning("refresh token revoke failed (user=%s): %s", user.id, e)
     return success_response(request, message="로그아웃 완료")
 
 
@@ -152,7 +205,7 @@ def logout(request: Request, user=Depends(get_current_user), rds: Optional[Redis
 )
 def firebase_login(request: Request, body: FirebaseRequest, db: Session = Depends(get_db), rds: Optional[Redis] = Depends(get_redis)):
     try:
-        decoded_token = firebase_auth.verify_id_token(body.id_token)
+        decoded_token = social_verifier.verify_firebase(body.id_token)
         email = decoded_token.get("email")
         nickname = decoded_token.get("name") or email.split("@")[0]
     except Exception:
@@ -171,14 +224,8 @@ def firebase_login(request: Request, body: FirebaseRequest, db: Session = Depend
 )
 def google_login(request: Request, body: GoogleRequest, db: Session = Depends(get_db), rds: Optional[Redis] = Depends(get_redis)):
     try:
-        CLIENT_ID = getattr(settings, "GOOGLE_CLIENT_ID", None) 
-        PLAYGROUND_CLIENT_ID = "407408718192.apps.googleusercontent.com"
-        
-        id_info = google_id_token.verify_oauth2_token(
-            body.id_token, 
-            google_requests.Request(), 
-            audience=None
-        )
+        # 메모리에 캐시된 Google 공개키로 로컬 검증 (요청마다 인증서를 받지 않음)
+        id_info = social_verifier.verify_google(body.id_token)
         
         email = id_info['email']
         nickname = id_info.get('name') or email.split("@")[0]
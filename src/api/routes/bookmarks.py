@@ -1,18 +1,27 @@
 from datetime import datetime
 from math import ceil
+from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, Request
+from redis import Redis
+from sqlalchemy import select as select_rows
 from sqlmodel import Session, select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.core import bookmark_cache
 from src.core.errors import ErrorCode, http_error, success_response, STANDARD_ERROR_RESPONSES
 from src.core.docs import success_example, error_example
+from src.core.fields import FIELDS_DESCRIPTION, parse_fields, wants
 from src.db.models import Bookmark, Content
 from src.deps.auth import get_current_user
-from src.deps.db import get_db
+from src.deps.db import get_db, get_read_db
+from src.deps.redis import get_redis
 from src.schemas.bookmarks import (
     BookmarkCreateRequest,
     BookmarkItem,
     BookmarkListResponse,
+    BookmarkStatusItem,
+    BookmarkStatusResponse,
 )
 
 router = APIRouter(
@@ -44,6 +53,26 @@ def _sort_clause(sort: str):
     return column.desc() if direction.upper() == "DESC" else column.asc()
 
 
+MAX_STATUS_IDS = 100
+
+
+def _parse_content_ids(raw: str) -> list[int]:
+    try:
+        ids = [int(x) for x in raw.split(",") if x.strip()]
+    except ValueError:
+        raise http_error(
+            400, ErrorCode.INVALID_QUERY_PARAM, "contentIds는 쉼표로 구분된 정수여야 합니다.",
+            details={"contentIds": raw}
+        )
+    if not ids or len(ids) > MAX_STATUS_IDS:
+        raise http_error(
+            400, ErrorCode.INVALID_QUERY_PARAM,
+            f"contentIds는 1개 이상 {MAX_STATUS_IDS}개 이하여야 합니다.",
+            details={"contentIds": raw}
+        )
+    return ids
+
+
 @router.post(
     "",
     status_code=201,
@@ -60,6 +89,7 @@ def create_bookmark(
     request: Request,
     body: BookmarkCreateRequest,
     db: Session = Depends(get_db),
+    rds: Optional[Redis] = Depends(get_redis),
     user=Depends(get_current_user),
 ):
     content = db.get(Content, body.content_id)
@@ -85,6 +115,7 @@ def create_bookmark(
     db.add(bookmark)
     db.commit()
     db.refresh(bookmark)
+    bookmark_cache.add(rds, user.id, body.content_id)
 
     item = BookmarkItem(
         content_id=bookmark.content_id,
@@ -107,7 +138,7 @@ def create_bookmark(
         401: error_example(401, ErrorCode.UNAUTHORIZED, "로그인이 필요합니다."),
     }
 )
-def list_bookmarks(
+async def list_bookmarks(
     request: Request,
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=50),
@@ -115,14 +146,26 @@ def list_bookmarks(
     keyword: str | None = Query(None, description="콘텐츠 제목 검색어"),
     date_from: datetime | None = Query(None, alias="dateFrom"),
     date_to: datetime | None = Query(None, alias="dateTo"),
-    db: Session = Depends(get_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
-    stmt = (
-        select(Bookmark, Content)
-        .join(Content, Content.id == Bookmark.content_id)
-        .where(Bookmark.user_id == user.id)
-    )
+    selected = parse_fields(fields, BookmarkItem.model_fields)
+    # 엔티티 대신 응답에 쓰는 컬럼만 조회
+    columns = [
+        column
+        for name, column in (
+            ("content_id", Bookmark.content_id),
+            ("title", Content.title),
+            ("created_at", Bookmark.created_at),
+        )
+        if wants(selected, name)
+    ]
+    stmt = select_rows(*columns).select_from(Bookmark)
+    # 제목을 요청/검색/정렬하지 않으면 contents 조인 생략
+    if wants(selected, "title") or keyword or sort.split(",")[0] == "title":
+        stmt = stmt.join(Content, Content.id == Bookmark.content_id)
+    stmt = stmt.where(Bookmark.user_id == user.id)
 
     if keyword:
         stmt = stmt.where(Content.title.ilike(f"%{keyword}%"))
@@ -133,30 +176,54 @@ def list_bookmarks(
 
     stmt = stmt.order_by(_sort_clause(sort))
 
-    total = db.exec(select(func.count()).select_from(stmt.subquery())).one()
-    rows = db.exec(stmt.offset(page * size).limit(size)).all()
+    total = (await db.exec(select(func.count()).select_from(stmt.subquery()))).one()
+    rows = (await db.exec(stmt.offset(page * size).limit(size))).all()
 
-    items = [
-        BookmarkItem(
-            content_id=bookmark.content_id,
-            title=content.title,
-            created_at=bookmark.created_at,
+    page_info = {
+        "page": page,
+        "size": size,
+        "totalElements": int(total),
+        "totalPages": ceil(int(total) / size) if size else 0,
+        "sort": sort,
+    }
+    if selected is None:
+        payload = BookmarkListResponse(
+            content=[BookmarkItem(**row._mapping) for row in rows], **page_info
         )
-        for bookmark, content in rows
-    ]
+    else:
+        payload = {"content": [dict(row._mapping) for row in rows], **page_info}
+    return success_response(
+        request,
+        message="북마크 목록이 조회되었습니다.",
+        data=payload,
+    )
+
+
+@router.get(
+    "/status",
+    responses={
+        **success_example(BookmarkStatusResponse, message="북마크 여부 조회 성공"),
+        400: error_example(400, ErrorCode.INVALID_QUERY_PARAM, "contentIds 파라미터가 잘못되었습니다."),
+        401: error_example(401, ErrorCode.UNAUTHORIZED, "로그인이 필요합니다."),
+    }
+)
+def bookmark_status(
+    request: Request,
+    content_ids: str = Query(..., alias="contentIds", description="쉼표로 구분된 콘텐츠 ID 목록"),
+    db: Session = Depends(get_db),
+    rds: Optional[Redis] = Depends(get_redis),
+    user=Depends(get_current_user),
+):
+    ids = _parse_content_ids(content_ids)
+    flags = bookmark_cache.contains_many(rds, db, user.id, ids)
 
-    payload = BookmarkListResponse(
-        content=items,
-        page=page,
-        size=size,
-        totalElements=int(total),
-        totalPages=ceil(int(total) / size) if size else 0,
-        sort=sort,
+    payload = BookmarkStatusResponse(
+        items=[BookmarkStatusItem(content_id=cid, bookmarked=flags[cid]) for cid in ids]
     )
     return success_response(
         request,
-        message="북마크 목록이 조회되었습니다.",
-        data=payload.model_dump(),
+        message="북마크 여부가 조회되었습니다.",
+        data=payload,
     )
 
 
@@ -172,6 +239,7 @@ def delete_bookmark(
     request: Request,
     content_id: int,
     db: Session = Depends(get_db),
+    rds: Optional[Redis] = Depends(get_redis),
     user=Depends(get_current_user),
 ):
     bookmark = db.exec(
@@ -188,6 +256,7 @@ def delete_bookmark(
 
     db.delete(bookmark)
     db.commit()
+    bookmark_cache.remove(rds, user.id, content_id)
     return success_response(
         request,
         message="북마크가 삭제되었습니다.",
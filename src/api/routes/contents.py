@@ -1,11 +1,18 @@
+import time
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.core.config import settings
 from src.core.errors import ErrorCode, http_error, success_response, STANDARD_ERROR_RESPONSES
+from src.core.fields import FIELDS_DESCRIPTION, Fields, parse_fields, wants
+from src.core.http_cache import (
+    AGGREGATE_CACHE, CATALOG_CACHE, make_etag, not_modified, with_cache_headers,
+)
 from src.core.docs import success_example, error_example
 from src.deps.auth import require_admin
-from src.deps.db import get_db
+from src.deps.db import get_db, get_read_db
 from src.core import tmdb as tmdb_svc 
 from src.repositories import contents as contents_repo
 from src.repositories import genres as genres_repo
@@ -14,7 +21,6 @@ from src.schemas.contents import (
     ContentCreateRequest,
     ContentListResponse,
     ContentResponse,
-    GenreBrief,
     TMDBGenre,
     TMDBMoviePayload,
     TopRatedItem,
@@ -28,11 +34,6 @@ router = APIRouter(
 )
 
 
-def _genres(db: Session, content_id: int) -> list[GenreBrief]:
-    genres = contents_repo.get_content_genres(db, content_id)
-    return [GenreBrief.model_validate(g) for g in genres]
-
-
 def _tmdb_payload(raw: dict) -> TMDBMoviePayload:
     return TMDBMoviePayload(
         id=raw["id"],
@@ -50,19 +51,26 @@ def _tmdb_payload(raw: dict) -> TMDBMoviePayload:
     )
 
 
-def _content_base(db: Session, content) -> ContentBase:
-    content_dict = {
-        "id": content.id,
-        "tmdb_id": content.tmdb_id,
-        "title": content.title,
-        "release_date": content.release_date,
-        "runtime_minutes": content.runtime_minutes,
-        "created_at": content.created_at,
-        "updated_at": content.updated_at,
-        "deleted_at": content.deleted_at,
-        "genres": _genres(db, content.id),
+def _content_dict(content, genres: list[tuple[int, str]], fields: Fields = None) -> dict:
+    """
+    ORM 행(또는 컬럼 Row) + (genre_id, name) 행 -> 응답 모델 입력.
+    검증은 최상위 모델에서 한 번만 합니다. fields 가 있으면 요청된 필드만 담습니다.
+    """
+    data = {
+        name: getattr(content, name)
+        for name in contents_repo.CONTENT_COLUMNS
+        if wants(fields, name)
     }
-    return ContentBase.model_validate(content_dict)
+    if wants(fields, "genres"):
+        data["genres"] = [{"id": gid, "name": name} for gid, name in genres]
+    return data
+
+
+def _content_response(db: Session, content, tmdb_detail: dict) -> ContentResponse:
+    genres = contents_repo.get_content_genres(db, [content.id]).get(content.id, [])
+    return ContentResponse.model_validate(
+        {**_content_dict(content, genres), "tmdb": _tmdb_payload(tmdb_detail)}
+    )
 
 
 @router.get(
@@ -70,27 +78,43 @@ def _content_base(db: Session, content) -> ContentBase:
     response_model=ContentListResponse,
     responses={**success_example(ContentListResponse)},
 )
-def list_contents(
+async def list_contents(
     request: Request,
     q: str | None = None,
     genre_id: int | None = None,
     sort: str = "latest",
     page: int = 1,
     size: int = 20,
-    db: Session = Depends(get_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    items, total = contents_repo.list_contents(
-        db, q=q, genre_id=genre_id, sort=sort, page=page, size=size
-    )
-    payload = ContentListResponse(
-        items=[_content_base(db, c) for c in items],
-        page=page,
-        size=size,
-        total=total,
+    selected = parse_fields(fields, ContentBase.model_fields)
+    # 목록을 조회하기 전에 버전 값으로 ETag 를 비교 (변경 없으면 304)
+    etag = make_etag("contents", *(await contents_repo.catalog_version_async(db)))
+    if (cached := not_modified(request, etag, CATALOG_CACHE)) is not None:
+        return cached
+
+    items, total = await contents_repo.list_contents_async(
+        db, q=q, genre_id=genre_id, sort=sort, page=page, size=size,
+        columns=None if selected is None else contents_repo.content_columns(selected),
     )
-    return success_response(
-        request, message="콘텐츠 목록 조회 성공", data=payload.model_dump()
+    genres = {}
+    if wants(selected, "genres"):
+        # 페이지 전체의 장르를 한 번에 조회 (콘텐츠마다 조회하던 N+1 제거)
+        genres = await contents_repo.get_content_genres_async(db, [c.id for c in items])
+    payload = {
+        "items": [_content_dict(c, genres.get(c.id, []), selected) for c in items],
+        "page": page,
+        "size": size,
+        "total": total,
+    }
+    # 일부 필드만 요청한 경우 모델 검증 없이 조회한 값을 그대로 응답
+    response = success_response(
+        request,
+        message="콘텐츠 목록 조회 성공",
+        data=ContentListResponse.model_validate(payload) if selected is None else payload,
     )
+    return with_cache_headers(response, CATALOG_CACHE, etag)
 
 
 @router.get(
@@ -101,17 +125,17 @@ def list_contents(
         400: error_example(400, ErrorCode.INVALID_QUERY_PARAM, "limit 값 오류")
     },
 )
-def top_rated(
+async def top_rated(
     request: Request,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     if limit <= 0:
         raise http_error(
             400, ErrorCode.INVALID_QUERY_PARAM, "limit은 0보다 커야 합니다."
         )
 
-    rows = contents_repo.top_rated(db, limit=limit)
+    rows = await contents_repo.top_rated_async(db, limit=limit)
     items = [
         TopRatedItem(
             content_id=row[0],
@@ -121,11 +145,12 @@ def top_rated(
         )
         for row in rows
     ]
-    return success_response(
+    response = success_response(
         request,
         message="인기 콘텐츠 조회 성공",
-        data=TopRatedResponse(items=items).model_dump(),
+        data=TopRatedResponse(items=items),
     )
+    return with_cache_headers(response, AGGREGATE_CACHE)
 
 
 @router.get(
@@ -136,26 +161,55 @@ def top_rated(
         404: error_example(404, ErrorCode.RESOURCE_NOT_FOUND, "요청하신 콘텐츠를 찾을 수 없습니다."),
     },
 )
-def get_content(
+async def get_content(
     request: Request,
     content_id: int,
-    db: Session = Depends(get_db)
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION + " (tmdb 생략 시 TMDB 조회 안 함)"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    content = contents_repo.get_content(db, content_id)
+    selected = parse_fields(fields, ContentResponse.model_fields)
+    version = await contents_repo.content_version_async(db, content_id)
+    if version is None:
+        raise http_error(
+            404, ErrorCode.RESOURCE_NOT_FOUND, "요청하신 콘텐츠를 찾을 수 없습니다.",
+            details={"contentId": content_id}
+        )
+    etag_parts = ["content", content_id, *version]
+    if wants(selected, "tmdb"):
+        # TMDB 상세 정보는 버전 값이 없으므로 일정 주기마다 ETag 를 바꿔 반영
+        etag_parts.append(int(time.time() // settings.CACHE_TMDB_WINDOW_SECONDS))
+    etag = make_etag(*etag_parts)
+    if (cached := not_modified(request, etag, CATALOG_CACHE)) is not None:
+        # 본문 조회와 TMDB 호출 모두 생략
+        return cached
+
+    columns = None
+    if selected is not None:
+        # TMDB 를 조회하려면 tmdb_id 가 필요
+        columns = contents_repo.content_columns(
+            (selected | {"tmdb_id"}) if "tmdb" in selected else selected
+        )
+    content = await contents_repo.get_content_async(db, content_id, columns)
     if not content:
         raise http_error(
             404, ErrorCode.RESOURCE_NOT_FOUND, "요청하신 콘텐츠를 찾을 수 없습니다.",
             details={"contentId": content_id}
         )
-    
-    tmdb_detail = tmdb_svc.fetch_movie_detail(content.tmdb_id)
-    
-    response = ContentResponse(
-        **_content_base(db, content).model_dump(),
-        tmdb=_tmdb_payload(tmdb_detail),
-    )
-    return success_response(
-        request, message="콘텐츠 상세 조회 성공", data=response.model_dump()
+    genres = {}
+    if wants(selected, "genres"):
+        genres = await contents_repo.get_content_genres_async(db, [content.id])
+    data = _content_dict(content, genres.get(content.id, []), selected)
+    # TMDB 응답을 기다리는 동안 커넥션을 점유하지 않도록 먼저 반납
+    await db.close()
+
+    if wants(selected, "tmdb"):
+        tmdb_detail = await tmdb_svc.fetch_movie_detail_async(content.tmdb_id)
+        data["tmdb"] = _tmdb_payload(tmdb_detail)
+
+    response = ContentResponse.model_validate(data) if selected is None else data
+    return with_cache_headers(
+        success_response(request, message="콘텐츠 상세 조회 성공", data=response),
+        CATALOG_CACHE, etag,
     )
 
 
@@ -202,15 +256,11 @@ def create_content(
             genre_ids = [g.id for g in active_genres if g.deleted_at is None]
             contents_repo.set_content_genres(db, existing.id, genre_ids)
 
-            response = ContentResponse(
-                **_content_base(db, existing).model_dump(),
-                tmdb=_tmdb_payload(tmdb_detail),
-            )
             return success_response(
                 request,
                 status_code=201,
                 message="삭제된 콘텐츠가 복구되었습니다.",
-                data=response.model_dump(),
+                data=_content_response(db, existing, tmdb_detail),
             )
 
     tmdb_detail = tmdb_svc.fetch_movie_detail(body.tmdb_id)
@@ -227,15 +277,11 @@ def create_content(
     )
     contents_repo.set_content_genres(db, content.id, genre_ids)
 
-    response = ContentResponse(
-        **_content_base(db, content).model_dump(),
-        tmdb=_tmdb_payload(tmdb_detail),
-    )
     return success_response(
         request,
         status_code=201,
         message="콘텐츠가 생성되었습니다.",
-        data=response.model_dump(),
+        data=_content_response(db, content, tmdb_detail),
     )
 
 
@@ -3,6 +3,7 @@ from sqlmodel import Session
 
 from src.core.docs import success_example, error_example
 from src.core.errors import ErrorCode, http_error, success_response, STANDARD_ERROR_RESPONSES
+from src.core.http_cache import CATALOG_CACHE, make_etag, not_modified, with_cache_headers
 from src.deps.auth import require_admin
 from src.deps.db import get_db
 from src.repositories import genres as genres_repo
@@ -26,13 +27,18 @@ router = APIRouter(
     responses={**success_example(GenreListResponse)},
 )
 def list_genres(request: Request, db: Session = Depends(get_db)):
+    etag = make_etag("genres", genres_repo.genres_version(db))
+    if (cached := not_modified(request, etag, CATALOG_CACHE)) is not None:
+        return cached
+
     items = genres_repo.list_active_genres(db)
     payload = GenreListResponse(items=[GenreResponse.model_validate(i) for i in items])
-    return success_response(
+    response = success_response(
         request,
         message="장르 목록 조회 성공",
         data=payload.model_dump(),
     )
+    return with_cache_headers(response, CATALOG_CACHE, etag)
 
 @router.post(
     "/sync",
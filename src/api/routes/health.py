@@ -1,12 +1,24 @@
 import time
 from datetime import timedelta
-from fastapi import APIRouter, Depends, Request
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, Response
+from redis import Redis
 from sqlmodel import Session, text
 
+from src.db.pool import pool_stats
+from src.db.replicas import replica_stats
+from src.db.session import async_engine, engine
 from src.deps.db import get_db
 from src.core.config import settings
+from src.core.metrics import render_latest
 from src.core.docs import success_example
 from src.core.errors import success_response
+from src.core.logging import logging_stats
+from src.core.security import password_hasher_stats
+from src.core.tracing import tracing_stats
+from src.deps.redis import get_redis, redis_pool_stats
+from src.middlewares.compression import compression_stats
 
 router = APIRouter(tags=["system"])
 
@@ -17,15 +29,28 @@ START_TIME = time.time()
     "/health",
     responses={**success_example(message="시스템 상태 정상")}
 )
-def health_check(request: Request, db: Session = Depends(get_db)):
+def health_check(
+    request: Request,
+    db: Session = Depends(get_db),
+    rds: Optional[Redis] = Depends(get_redis),
+):
     # 1. DB 연결 확인
     db.exec(text("SELECT 1"))
     
-    # 2. 런타임(Uptime) 계산
+    # 2. Redis 연결 확인 (장애 시 socket 타임아웃 내에 빠르게 실패)
+    redis_status = "disconnected"
+    if rds is not None:
+        try:
+            rds.ping()
+            redis_status = "connected"
+        except Exception:
+            pass
+
+    # 3. 런타임(Uptime) 계산
     uptime_seconds = int(time.time() - START_TIME)
     uptime_str = str(timedelta(seconds=uptime_seconds))
 
-    # 3. Request 객체를 반드시 전달해야 함
+    # 4. Request 객체를 반드시 전달해야 함
     return success_response(
         request, 
         message="System is healthy",
@@ -36,5 +61,22 @@ def health_check(request: Request, db: Session = Depends(get_db)):
             "uptime": uptime_str,
             "uptime_seconds": uptime_seconds,
             "db": "connected",
+            "db_pool": {
+                "sync": pool_stats(engine),
+                "async": pool_stats(async_engine.sync_engine),
+                "replicas": replica_stats(),
+            },
+            "redis": redis_status,
+            "redis_pool": redis_pool_stats(),
+            "password_hasher": password_hasher_stats(),
+            "compression": compression_stats.snapshot(),
+            "tracing": tracing_stats(),
+            "logging": logging_stats(),
         }
-    )
\ No newline at end of file
+    )
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    # Prometheus 스크레이프용 (text exposition format, 응답 봉투 없이 그대로)
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
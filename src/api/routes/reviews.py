@@ -2,13 +2,16 @@ from datetime import datetime
 from math import ceil
 
 from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import select as select_rows
 from sqlmodel import Session, select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.errors import ErrorCode, http_error, success_response, STANDARD_ERROR_RESPONSES
 from src.core.docs import success_example, error_example
+from src.core.fields import FIELDS_DESCRIPTION, Fields, parse_fields, pick, wants
 from src.db.models import Content, Review, ReviewLike
 from src.deps.auth import get_current_user
-from src.deps.db import get_db
+from src.deps.db import get_db, get_read_db
 from src.schemas.reviews import (
     ReviewCreate,
     ReviewListResponse,
@@ -57,6 +60,31 @@ def _review_to_response(review: Review, like_count: int) -> ReviewResponse:
     )
 
 
+# 좋아요 수(집계)를 제외한 응답 필드 = reviews 테이블 컬럼
+_REVIEW_COLUMNS = tuple(name for name in ReviewResponse.model_fields if name != "like_count")
+
+
+def _review_select(selected: Fields, like_counts):
+    """
+    전체 필드면 Review 엔티티, 일부 필드면 요청된 컬럼만 조회합니다.
+    like_counts 가 None 이면(좋아요 수 미요청) 집계 컬럼을 넣지 않습니다.
+    """
+    if selected is None:
+        return select(Review, like_counts.c.like_count)
+    stmt = select_rows(*[getattr(Review, name) for name in _REVIEW_COLUMNS if name in selected])
+    stmt = stmt.select_from(Review)
+    if like_counts is not None:
+        stmt = stmt.add_columns(like_counts.c.like_count)
+    return stmt
+
+
+def _review_fields(row, selected: Fields) -> dict:
+    data = pick(row._mapping, selected)
+    if "like_count" in data:
+        data["like_count"] = data["like_count"] or 0
+    return data
+
+
 def _like_count_subquery():
     return (
         select(
@@ -80,25 +108,30 @@ def _like_count_subquery():
         400: error_example(400, ErrorCode.INVALID_QUERY_PARAM, "잘못된 요청입니다."),
     }
 )
-def get_popular_reviews(
+async def get_popular_reviews(
     request: Request,
-    db: Session = Depends(get_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db),
 ):
+    selected = parse_fields(fields, ReviewResponse.model_fields)
     like_counts = _like_count_subquery()
     stmt = (
-        select(Review, like_counts.c.like_count)
+        _review_select(selected, like_counts if wants(selected, "like_count") else None)
         .join(like_counts, like_counts.c.id == Review.id)
         .order_by(like_counts.c.like_count.desc(), Review.created_at.desc())
         .limit(10)
     )
-    rows = db.exec(stmt).all()
-    responses = [
-        _review_to_response(review, like_count or 0) for review, like_count in rows
-    ]
+    rows = (await db.exec(stmt)).all()
+    if selected is None:
+        responses = [
+            _review_to_response(review, like_count or 0) for review, like_count in rows
+        ]
+    else:
+        responses = [_review_fields(row, selected) for row in rows]
     return success_response(
         request,
         message="인기 리뷰 목록 조회 성공",
-        data=[r.model_dump() for r in responses],
+        data=responses,
     )
 
 
@@ -160,7 +193,7 @@ def create_review(
         404: error_example(404, ErrorCode.RESOURCE_NOT_FOUND, "콘텐츠를 찾을 수 없습니다."),
     }
 )
-def get_reviews_by_content(
+async def get_reviews_by_content(
     request: Request,
     content_id: int,
     sort: str = Query("createdAt,DESC"),
@@ -171,21 +204,22 @@ def get_reviews_by_content(
     rating_max: int | None = Query(None, ge=1, le=5, alias="ratingMax"),
     date_from: datetime | None = Query(None, alias="dateFrom"),
     date_to: datetime | None = Query(None, alias="dateTo"),
-    db: Session = Depends(get_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    content = db.get(Content, content_id)
+    selected = parse_fields(fields, ReviewResponse.model_fields)
+    content = await db.get(Content, content_id)
     if not content or content.deleted_at is not None:
         raise http_error(
             404, ErrorCode.RESOURCE_NOT_FOUND, "요청하신 콘텐츠를 찾을 수 없습니다.",
             details={"contentId": content_id}
         )
 
-    like_counts = _like_count_subquery()
-    stmt = (
-        select(Review, like_counts.c.like_count)
-        .join(like_counts, like_counts.c.id == Review.id, isouter=True) # isouter=True 추가하여 좋아요 없는 리뷰도 조회
-        .where(Review.content_id == content_id)
-    )
+    # 좋아요 수를 요청하지 않으면 집계 조인을 생략
+    like_counts = _like_count_subquery() if wants(selected, "like_count") else None
+    stmt = _review_select(selected, like_counts).where(Review.content_id == content_id)
+    if like_counts is not None:
+        stmt = stmt.join(like_counts, like_counts.c.id == Review.id, isouter=True) # isouter=True 추가하여 좋아요 없는 리뷰도 조회
 
     if keyword:
         stmt = stmt.where(Review.comment.ilike(f"%{keyword}%"))
@@ -202,23 +236,22 @@ def get_reviews_by_content(
 
     # Count Query
     count_stmt = select(func.count()).select_from(stmt.subquery())
-    total = db.exec(count_stmt).one()
+    total = (await db.exec(count_stmt)).one()
     
     # Data Query
-    rows = db.exec(stmt.offset(page * size).limit(size)).all()
+    rows = (await db.exec(stmt.offset(page * size).limit(size))).all()
 
-    responses = [
-        _review_to_response(review, like_count or 0) for review, like_count in rows
-    ]
-    
-    payload = ReviewListResponse(
-        items=responses,
-        total=int(total),
-    )
+    if selected is None:
+        payload = ReviewListResponse(
+            items=[_review_to_response(review, like_count or 0) for review, like_count in rows],
+            total=int(total),
+        )
+    else:
+        payload = {"items": [_review_fields(row, selected) for row in rows], "total": int(total)}
     return success_response(
         request,
         message="리뷰 목록이 조회되었습니다.",
-        data=payload.model_dump(),
+        data=payload,
     )
 
 
@@ -1,16 +1,20 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
 from redis import Redis
 from typing import Optional
 
+from src.core import export as export_svc
+from src.core import revocation
 from src.core.docs import success_example, error_example
 from src.core.errors import ErrorCode, http_error, success_response, STANDARD_ERROR_RESPONSES
-from src.core.security import hash_password, verify_password
-from src.db.models import User, UserStatus, Review, Bookmark
+from src.core.security import hash_password_async, verify_password_async
+from src.db.models import User, UserStatus, Review, Bookmark, Content
 from src.deps.db import get_db
 from src.deps.redis import get_redis
-from src.deps.auth import get_current_user
+from src.deps.auth import get_current_user, get_current_db_user
 from src.repositories import users as users_repo
 from src.schemas.users import (
     SignupRequest,
@@ -26,8 +30,31 @@ router = APIRouter(
 )
 
 
-def _refresh_key(user_id: int) -> str:
-    return f"refresh:{user_id}"
+EXPORT_YIELD_PER = 500
+
+REVIEW_EXPORT_FIELDS = (
+    "id", "content_id", "rating", "comment", "like_count", "created_at", "updated_at",
+)
+BOOKMARK_EXPORT_FIELDS = ("content_id", "title", "created_at")
+
+
+def _export_response(db: Session, stmt, fields, fmt: str, filename: str) -> StreamingResponse:
+    """
+    서버 사이드 커서(yield_per)로 행을 스트리밍합니다.
+    요청 세션 하나를 응답이 끝날 때까지 그대로 사용하므로 커넥션도 하나만 점유합니다.
+    """
+    def _rows():
+        result = db.exec(stmt.execution_options(yield_per=EXPORT_YIELD_PER))
+        try:
+            yield from result
+        finally:
+            result.close()
+
+    return StreamingResponse(
+        export_svc.serialize(_rows(), fields, fmt),
+        media_type=export_svc.EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
 
 
 @router.post(
@@ -38,21 +65,21 @@ def _refresh_key(user_id: int) -> str:
         409: error_example(409, ErrorCode.DUPLICATE_RESOURCE, "이미 가입된 이메일입니다."),
     },
 )
-def signup(
+async def signup(
     request: Request,
     body: SignupRequest,
     db: Session = Depends(get_db),
 ):
-    if users_repo.get_user_by_email(db, body.email):
+    if await run_in_threadpool(users_repo.get_user_by_email, db, body.email):
         raise http_error(409, ErrorCode.DUPLICATE_RESOURCE, "이미 가입된 이메일입니다.")
 
     user = User(
         email=body.email,
-        password_hash=hash_password(body.password),
+        password_hash=await hash_password_async(body.password),
         nickname=body.nickname,
         status=UserStatus.ACTIVE,
     )
-    created_user = users_repo.create_user(db, user)
+    created_user = await run_in_threadpool(users_repo.create_user, db, user)
 
     return success_response(
         request,
@@ -69,7 +96,7 @@ def signup(
         401: error_example(401, ErrorCode.UNAUTHORIZED, "로그인이 필요합니다."),
     },
 )
-def me(request: Request, user=Depends(get_current_user)):
+def me(request: Request, user=Depends(get_current_db_user)):
     return success_response(request, data=user.model_dump())
 
 
@@ -85,7 +112,7 @@ def update_me(
     request: Request,
     body: UpdateMeRequest,
     db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+    user=Depends(get_current_db_user),
 ):
     if body.nickname is not None:
         user.nickname = body.nickname
@@ -110,19 +137,18 @@ def update_me(
         401: error_example(401, ErrorCode.UNAUTHORIZED, "로그인이 필요합니다."),
     },
 )
-def change_password(
+async def change_password(
     request: Request,
     body: ChangePasswordRequest,
     db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+    user=Depends(get_current_db_user),
 ):
-    if not verify_password(body.current_password, user.password_hash):
+    if not await verify_password_async(body.current_password, user.password_hash):
         raise http_error(400, ErrorCode.BAD_REQUEST, "현재 비밀번호가 일치하지 않습니다.")
 
-    user.password_hash = hash_password(body.new_password)
     user.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
-    db.add(user)
-    db.commit()
+    new_hash = await hash_password_async(body.new_password)
+    await run_in_threadpool(users_repo.update_password_hash, db, user, new_hash)
 
     return success_response(request, message="비밀번호가 변경되었습니다.", data={"ok": True})
 
@@ -138,18 +164,14 @@ def delete_me(
     request: Request,
     db: Session = Depends(get_db),
     rds: Optional[Redis] = Depends(get_redis),
-    user=Depends(get_current_user),
+    user=Depends(get_current_db_user),
 ):
     user.deleted_at = datetime.now(timezone.utc).replace(tzinfo=None)
     user.status = UserStatus.DELETED
     db.add(user)
     db.commit()
-
-    if rds:
-        try:
-            rds.delete(_refresh_key(user.id))
-        except Exception:
-            pass
+    # 인증 캐시, Access Token, 모든 기기의 Refresh Token 을 함께 폐기
+    revocation.revoke_user_access(rds, user.id)
 
     return success_response(request, message="회원 탈퇴가 완료되었습니다.", data={"ok": True})
 
@@ -215,4 +237,55 @@ def my_bookmarks(
             "size": size,
             "items": [b.model_dump() for b in items],
         },
-    )
\ No newline at end of file
+    )
+
+@router.get(
+    "/me/reviews/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "내 리뷰 전체 내보내기 (NDJSON 또는 CSV 스트림)",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        401: error_example(401, ErrorCode.UNAUTHORIZED, "로그인이 필요합니다.")
+    }
+)
+def export_my_reviews(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    stmt = (
+        select(
+            Review.id, Review.content_id, Review.rating, Review.comment,
+            Review.like_count, Review.created_at, Review.updated_at,
+        )
+        .where(Review.user_id == user.id)
+        .order_by(Review.id)
+    )
+    return _export_response(db, stmt, REVIEW_EXPORT_FIELDS, fmt, "reviews")
+
+
+@router.get(
+    "/me/bookmarks/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "내 북마크 전체 내보내기 (NDJSON 또는 CSV 스트림)",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        401: error_example(401, ErrorCode.UNAUTHORIZED, "로그인이 필요합니다.")
+    }
+)
+def export_my_bookmarks(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    stmt = (
+        select(Bookmark.content_id, Content.title, Bookmark.created_at)
+        .join(Content, Content.id == Bookmark.content_id)
+        .where(Bookmark.user_id == user.id)
+        .order_by(Bookmark.created_at)
+    )
+    return _export_response(db, stmt, BOOKMARK_EXPORT_FIELDS, fmt, "bookmarks")
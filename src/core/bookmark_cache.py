@@ -0,0 +1,224 @@
+# 사용자별 북마크 content_id 집합을 Redis Set으로 미러링
+#
+# - 키: bookmarks:{user_id} (SET, 멤버는 content_id 문자열)
+# - 센티널 멤버("0")로 "DB에서 적재 완료된 집합"임을 표시합니다.
+#   (북마크가 0개인 사용자도 키가 존재하므로 매번 DB를 다시 조회하지 않음)
+# - 북마크 라우트에서 추가/삭제 시 키가 이미 적재된 경우에만 반영하고,
+#   키가 없으면 다음 조회 때 DB에서 지연 재구성합니다.
+# - 추가/삭제는 항상 버전 키 bookmarks_ver:{user_id} 를 올립니다. 재구성은 이 키를 WATCH 한 뒤
+#   DB 를 읽으므로, 그 사이에 커밋된 추가/삭제가 있으면 오래된 스냅숏을 쓰지 않습니다.
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from redis import Redis, WatchError
+from sqlmodel import Session, func, select
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.db.models import Bookmark
+
+_SENTINEL = "0"  # content_id는 1부터 시작하므로 충돌하지 않음
+
+# 버전을 올리고, 키가 적재된 경우에만 SADD/SREM 수행 (키가 없을 때 부분 집합이 생기는 것을 방지)
+# KEYS: 집합, 버전 / ARGV: 명령, content_id, 버전 키 TTL
+_APPLY_IF_LOADED = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call(ARGV[1], KEYS[1], ARGV[2])
+end
+return -1
+"""
+
+
+def _bookmark_key(user_id: int) -> str:
+    return f"bookmarks:{user_id}"
+
+
+def _version_key(user_id: int) -> str:
+    return f"bookmarks_ver:{user_id}"
+
+
+def _load_ids(db: Session, user_id: int) -> List[int]:
+    stmt = select(Bookmark.content_id).where(Bookmark.user_id == user_id)
+    return [int(cid) for cid in db.exec(stmt).all()]
+
+
+def rebuild(rds: Redis, db: Session, user_id: int) -> set[int]:
+    """
+    DB 기준으로 사용자의 북마크 집합을 다시 만들고 결과를 반환합니다.
+    DB 를 읽는 동안 추가/삭제가 반영되면(버전 변경) 캐시에 쓰지 않고 DB 결과만 반환합니다.
+    """
+    key = _bookmark_key(user_id)
+    with rds.pipeline(transaction=True) as pipe:
+        # DB 조회보다 먼저 WATCH 해야 조회 이후의 변경을 감지할 수 있음
+        pipe.watch(_version_key(user_id))
+        ids = _load_ids(db, user_id)
+        pipe.multi()
+        pipe.delete(key)
+        pipe.sadd(key, _SENTINEL, *ids)
+        pipe.expire(key, settings.BOOKMARK_CACHE_TTL_SECONDS)
+        try:
+            pipe.execute()
+        except WatchError:
+            logger.info("bookmark cache rebuild skipped, concurrent change (user=%s)", user_id)
+    return set(ids)
+
+
+def _apply(rds: Optional[Redis], op: str, user_id: int, content_id: int) -> None:
+    if rds is None:
+        return
+    try:
+        rds.eval(
+            _APPLY_IF_LOADED, 2, _bookmark_key(user_id), _version_key(user_id),
+            op, str(content_id), settings.BOOKMARK_CACHE_TTL_SECONDS,
+        )
+    except Exception as e:
+        # 동기화 실패 시 키를 지워 다음 조회에서 DB 기준으로 재구성되도록 함
+        # (진행 중인 재구성이 오래된 스냅숏을 쓰지 않도록 버전도 올림)
+        logger.warning("bookmark cache %s failed (user=%s): %s", op, user_id, e)
+        try:
+            pipe = rds.pipeline(transaction=False)
+            pipe.delete(_bookmark_key(user_id))
+            pipe.incr(_version_key(user_id))
+            pipe.expire(_version_key(user_id), settings.BOOKMARK_CACHE_TTL_SECONDS)
+            pipe.execute()
+        except Exception:
+            pass
+
+
+def add(rds: Optional[Redis], user_id: int, content_id: int) -> None:
+    _apply(rds, "SADD", user_id, content_id)
+
+
+def remove(rds: Optional[Redis], user_id: int, content_id: int) -> None:
+    _apply(rds, "SREM", user_id, content_id)
+
+
+def contains_many(
+    rds: Optional[Redis],
+    db: Session,
+    user_id: int,
+    content_ids: Sequence[int],
+) -> Dict[int, bool]:
+    """
+    content_ids 각각의 북마크 여부를 반환합니다.
+    캐시가 적재되어 있으면 EXISTS + SMISMEMBER 를 한 번의 파이프라인으로 처리하고,
+    미스이거나 Redis를 쓸 수 없으면 DB 기준으로 판단합니다.
+    """
+    if not content_ids:
+        return {}
+
+    key = _bookmark_key(user_id)
+    if rds is not None:
+        try:
+            pipe = rds.pipeline(transaction=False)
+            pipe.exists(key)
+            pipe.smismember(key, [str(cid) for cid in content_ids])
+            exists, flags = pipe.execute()
+            if exists:
+                return {cid: bool(flag) for cid, flag in zip(content_ids, flags)}
+            owned = rebuild(rds, db, user_id)
+            return {cid: cid in owned for cid in content_ids}
+        except Exception as e:
+            logger.warning("bookmark cache lookup failed (user=%s): %s", user_id, e)
+
+    stmt = select(Bookmark.content_id).where(
+        Bookmark.user_id == user_id,
+        Bookmark.content_id.in_(content_ids),
+    )
+    owned = {int(cid) for cid in db.exec(stmt).all()}
+    return {cid: cid in owned for cid in content_ids}
+
+
+# ==========================================
+# 정합성 검사 (Redis vs DB)
+# ==========================================
+
+def _iter_cached_user_batches(rds: Redis, batch_size: int) -> Iterable[List[int]]:
+    """
+    Redis 에 적재된 사용자 id 를 SCAN 으로 배치 단위로 반환합니다.
+    DB 쪽에서 사용자를 고르면 북마크가 0개가 된 사용자의 남은 집합(SREM 실패 등)을 놓치므로
+    Redis 키를 기준으로 순회합니다.
+    """
+    batch: List[int] = []
+    for key in rds.scan_iter(match=_bookmark_key("*"), count=batch_size, _type="set"):
+        if isinstance(key, bytes):
+            key = key.decode()
+        suffix = key.rsplit(":", 1)[-1]
+        if not suffix.isdigit():
+            continue
+        batch.append(int(suffix))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def check_consistency(
+    rds: Redis,
+    db: Session,
+    batch_size: int = 500,
+    repair: bool = False,
+) -> Dict[str, int]:
+    """
+    적재된 Redis 집합과 DB의 북마크를 사용자 단위 배치로 비교합니다.
+    적재되지 않은 사용자는 다음 조회 때 재구성되므로 비교 대상에서 제외합니다.
+    (SCAN 과 SMEMBERS 사이에 만료된 키는 skipped)
+    repair=True 이면 불일치한 사용자의 키를 삭제하여 재구성을 유도합니다.
+    """
+    stats = {"checked": 0, "skipped": 0, "mismatched": 0, "repaired": 0}
+
+    for user_ids in _iter_cached_user_batches(rds, batch_size):
+        pipe = rds.pipeline(transaction=False)
+        for uid in user_ids:
+            pipe.smembers(_bookmark_key(uid))
+        cached_sets = pipe.execute()
+
+        rows = db.exec(
+            select(Bookmark.user_id, Bookmark.content_id).where(
+                Bookmark.user_id.in_(user_ids)
+            )
+        ).all()
+        expected: Dict[int, set[str]] = {uid: set() for uid in user_ids}
+        for uid, cid in rows:
+            expected[int(uid)].add(str(cid))
+
+        stale: List[str] = []
+        for uid, cached in zip(user_ids, cached_sets):
+            if not cached:
+                stats["skipped"] += 1
+                continue
+            stats["checked"] += 1
+            if set(cached) - {_SENTINEL} != expected[uid]:
+                stats["mismatched"] += 1
+                logger.warning("bookmark cache mismatch (user=%s)", uid)
+                stale.append(_bookmark_key(uid))
+
+        if repair and stale:
+            rds.delete(*stale)
+            stats["repaired"] += len(stale)
+
+    return stats
+
+
+def count_db_bookmarks(db: Session) -> int:
+    return int(db.exec(select(func.count()).select_from(Bookmark)).one())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from src.db.session import engine
+    from src.deps.redis import init_redis_pool
+
+    parser = argparse.ArgumentParser(description="북마크 Redis 캐시 정합성 검사")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--repair", action="store_true", help="불일치 키 삭제")
+    args = parser.parse_args()
+
+    client = init_redis_pool()
+    with Session(engine) as session:
+        result = check_consistency(client, session, args.batch_size, args.repair)
+        result["db_bookmarks"] = count_db_bookmarks(session)
+    print(result)
@@ -10,6 +10,65 @@ class Settings(BaseSettings):
     TMDB_API_KEY: str = ""
     TMDB_API_BASE: str = "https://api.themoviedb.org/3"
     GOOGLE_CLIENT_ID: str = ""
+    FIREBASE_PROJECT_ID: str = ""  # 비어 있으면 firebase_admin 앱의 project_id 사용
+    SOCIAL_AUTH_LOCAL_CERTS_FILE: str = ""  # 오프라인 테스트용 공개키 JSON
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    REFRESH_MAX_SESSIONS: int = 10  # 사용자당 동시에 유지되는 로그인(기기) 수
+    # True 이면 Access Token의 role/status 클레임과 Redis 폐기 목록만으로 인증 (DB 조회 생략)
+    AUTH_STATELESS: bool = False
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 0  # 0 이면 CPU 코어 수
+    PASSWORD_HASH_QUEUE_LIMIT: int = 64
+    # DB 커넥션 풀 (워커 프로세스당, sync/async 엔진 각각 적용. SQLite 는 무시)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: float = 5  # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간
+    DB_POOL_SLOW_WAIT_MS: float = 100  # 이 시간 이상 기다리면 풀 고갈로 보고 경고 로그
+    DB_POOL_SLOW_HOLD_MS: float = 1000  # 커넥션을 이 시간 이상 점유한 요청은 경고 로그
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # Postgres statement_timeout (0 이면 미적용)
+    # 읽기 복제본 (쉼표로 구분한 URL 목록, 비어 있으면 Primary 만 사용)
+    DATABASE_REPLICA_URLS: str = ""
+    READ_YOUR_WRITES_SECONDS: float = 5  # 쓰기 후 해당 사용자의 조회를 Primary 로 보내는 시간
+    REPLICA_RETRY_SECONDS: float = 30  # 장애 복제본을 제외하는 시간
+    REPLICA_CONNECT_TIMEOUT: float = 2
+    # 한 요청에서 같은 SQL 이 반복되면 N+1 의심 경고 (개발/스테이징용)
+    SQL_DEBUG_N_PLUS_ONE: bool = False
+    SQL_REPEAT_THRESHOLD: int = 5
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 0.5  # 풀의 커넥션이 모두 사용 중일 때 대기 시간
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 0.5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_RETRY_SECONDS: float = 5  # 장애 감지 후 재시도까지 Redis 사용을 건너뛰는 시간
+    BOOKMARK_CACHE_TTL_SECONDS: int = 60 * 60 * 24
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 5
+    USER_CACHE_MAX_SIZE: int = 10000
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_DEFAULT: str = "100/minute"  # 라우트별 정책이 없는 경우 (사용자/IP, 라우트 단위)
+    # 응답 압축 (br 은 brotli 패키지가 설치된 경우에만)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes, 이보다 작은 응답은 압축하지 않음
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # HTTP 캐시 (카탈로그 조회의 ETag/Cache-Control)
+    CACHE_CATALOG_MAX_AGE: int = 30  # seconds, 프록시/브라우저가 재검증 없이 쓰는 시간
+    CACHE_CATALOG_STALE_SECONDS: int = 60  # stale-while-revalidate
+    CACHE_AGGREGATE_MAX_AGE: int = 60  # 인기 콘텐츠 등 집계 응답
+    CACHE_TMDB_WINDOW_SECONDS: int = 3600  # 버전이 없는 TMDB 상세 정보를 ETag 에 반영하는 주기
+    # 로깅 (src/core/logging.py)
+    LOG_JSON: bool = False  # true 이면 한 줄에 JSON 하나
+    LOG_QUEUE_SIZE: int = 10000  # 출력 대기 레코드 상한 (초과분은 버리고 개수만 셈)
+    LOG_ACCESS_SAMPLING: str = ""  # 접근 로그 레벨별 샘플링, 예: "INFO=0.1" (WARNING 이상은 항상 출력)
+    # 요청 트레이싱 (src/core/tracing.py)
+    TRACING_ENABLED: bool = False
+    TRACING_SAMPLE_RATE: float = 0.01  # traceparent 가 없는 요청의 샘플링 비율
+    TRACING_EXPORTER: str = "file"  # file | otlp
+    TRACING_FILE: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SERVICE_NAME: str = "movie-api"
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
@@ -1,3 +1,4 @@
+import math
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
@@ -6,9 +7,11 @@ from fastapi import HTTPException, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded  # [추가] RateLimit 예외
+from pydantic_core import to_json
 
 from src.core.logging import logger
+from src.core.rate_limit import RateLimitExceeded
+from src.core.security import PasswordHasherBusy
 
 # ==========================================
 # 1. Error Codes
@@ -45,6 +48,9 @@ class ErrorCode(str, Enum):
     INTERNAL_SERVER_ERROR = "INTERNAL_SERVER_ERROR"
     DATABASE_ERROR = "DATABASE_ERROR"
     UNKNOWN_ERROR = "UNKNOWN_ERROR"
+
+    # 503
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
     
     # Success
     SUCCESS = "SUCCESS"
@@ -59,6 +65,7 @@ DEFAULT_ERROR_CODE_BY_STATUS = {
     422: ErrorCode.UNPROCESSABLE_ENTITY,
     429: ErrorCode.TOO_MANY_REQUESTS,
     500: ErrorCode.INTERNAL_SERVER_ERROR,
+    503: ErrorCode.SERVICE_UNAVAILABLE,
 }
 
 
@@ -74,6 +81,19 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+class FastJSONResponse(JSONResponse):
+    """
+    pydantic_core 의 JSON 직렬화기로 한 번에 bytes 를 만드는 JSONResponse.
+    data 에 pydantic 모델을 그대로 넘기면 model_dump()/jsonable_encoder 를 거치지 않고 직렬화되며,
+    dict/list/datetime 등 기본 타입도 그대로 처리합니다.
+    직렬화기가 모르는 타입만 jsonable_encoder 로 변환합니다.
+    (model_dump() 와 같은 필드명을 쓰도록 by_alias=False)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=False, fallback=jsonable_encoder)
+
+
 def success_response(
     request: Request,
     data: Any = None,
@@ -82,16 +102,17 @@ def success_response(
     code: ErrorCode = ErrorCode.SUCCESS,
     message: str = "성공",
 ) -> JSONResponse:
-    return JSONResponse(
+    """data 에는 pydantic 모델(또는 모델 리스트)을 model_dump() 없이 바로 넘길 수 있습니다."""
+    return FastJSONResponse(
         status_code=status_code,
-        content=jsonable_encoder({
+        content={
             "timestamp": _utc_now_iso(),
             "path": request.url.path,
             "status": status_code,
             "code": code.value,
             "message": message,
             "data": data,
-        }),
+        },
     )
 
 
@@ -103,22 +124,28 @@ def error_response(
     message: str,
     details: Optional[dict] = None,
 ) -> JSONResponse:
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status_code,
-        content=jsonable_encoder({
+        content={
             "timestamp": _utc_now_iso(),
             "path": request.url.path,
             "status": status_code,
             "code": code.value,
             "message": message,
             "details": details or {},
-        }),
+        },
     )
 
 # [수정] 모든 라우터에 기본 적용될 에러 응답 예시 (Swagger용)
 STANDARD_ERROR_RESPONSES = {
     429: {
-        "description": "요청 한도 초과",
+        "description": "요청 한도 초과 (라우트별 정책, 로그인 사용자는 사용자 id / 그 외는 IP 단위)",
+        "headers": {
+            "Retry-After": {
+                "description": "다음 요청이 허용되기까지 남은 시간(초, 올림)",
+                "schema": {"type": "integer"},
+            }
+        },
         "content": {
             "application/json": {
                 "example": {
@@ -127,7 +154,7 @@ STANDARD_ERROR_RESPONSES = {
                     "status": 429,
                     "code": "TOO_MANY_REQUESTS",
                     "message": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
-                    "details": {"error": "Rate limit exceeded: 100 per 1 minute"}
+                    "details": {"error": "Rate limit exceeded: 100 per 60 second(s)", "retryAfter": 0.6}
                 }
             }
         }
@@ -226,8 +253,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception):
-    logger.exception(f"Unhandled Error {request.method} {request.url.path}")
+def internal_error_response(request: Request) -> JSONResponse:
     return error_response(
         request,
         status_code=500,
@@ -235,13 +261,32 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
         message="서버 내부 오류가 발생했습니다.",
     )
 
+
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception(f"Unhandled Error {request.method} {request.url.path}")
+    return internal_error_response(request)
+
 # [추가] 429 에러 핸들러
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     logger.warning(f"RATE_LIMIT_EXCEEDED {request.method} {request.url.path}")
-    return error_response(
+    response = error_response(
         request,
         status_code=429,
         code=ErrorCode.TOO_MANY_REQUESTS,
         message="요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
-        details={"error": str(exc)},
-    )
\ No newline at end of file
+        details={"error": str(exc), "retryAfter": round(exc.retry_after, 3)},
+    )
+    response.headers["Retry-After"] = str(max(1, math.ceil(exc.retry_after)))
+    return response
+
+# [추가] 비밀번호 해시 대기열 초과 시 503
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    logger.warning(f"PASSWORD_HASHER_BUSY {request.method} {request.url.path}")
+    response = error_response(
+        request,
+        status_code=503,
+        code=ErrorCode.SERVICE_UNAVAILABLE,
+        message="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+    )
+    response.headers["Retry-After"] = "1"
+    return response
@@ -0,0 +1,47 @@
+# 대용량 내보내기(NDJSON / CSV) 직렬화 헬퍼
+# 행을 하나씩 문자열로 변환하여 내보내므로 전체 결과를 메모리에 올리지 않습니다.
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Sequence
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _to_primitive(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def ndjson_lines(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> Iterator[str]:
+    for row in rows:
+        record = {f: _to_primitive(v) for f, v in zip(fields, row)}
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def csv_lines(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+
+    def _flush() -> str:
+        line = buf.getvalue()
+        buf.seek(0)
+        buf.truncate(0)
+        return line
+
+    writer.writerow(fields)
+    yield _flush()
+    for row in rows:
+        writer.writerow([_to_primitive(v) for v in row])
+        yield _flush()
+
+
+def serialize(rows: Iterable[Sequence[Any]], fields: Sequence[str], fmt: str) -> Iterator[str]:
+    if fmt == "csv":
+        return csv_lines(rows, fields)
+    return ndjson_lines(rows, fields)
@@ -0,0 +1,37 @@
+# Sparse fieldsets (?fields=id,title,genres)
+#
+# 목록/상세 조회에서 클라이언트가 필요한 필드만 요청할 수 있게 합니다.
+# 라우트는 요청된 필드에 맞춰 SELECT 컬럼을 줄이고, 요청되지 않은 조인/부가 조회
+# (장르, 좋아요 수, TMDB 등)를 건너뜁니다. fields 를 생략하면 기존과 같은 전체 응답입니다.
+from typing import Any, Iterable, Mapping, Optional
+
+from src.core.errors import ErrorCode, http_error
+
+FIELDS_DESCRIPTION = "응답에 포함할 필드 (쉼표로 구분, 생략 시 전체). 예: id,title,genres"
+
+Fields = Optional[frozenset]
+
+
+def parse_fields(raw: Optional[str], allowed: Iterable[str]) -> Fields:
+    """fields 쿼리 파라미터를 검증합니다. 생략되면 None(전체 필드)."""
+    if raw is None:
+        return None
+    allowed = set(allowed)
+    fields = frozenset(f.strip() for f in raw.split(",") if f.strip())
+    if not fields or not fields <= allowed:
+        raise http_error(
+            400, ErrorCode.INVALID_QUERY_PARAM, "지원하지 않는 필드입니다.",
+            details={"fields": raw, "allowed": sorted(allowed)},
+        )
+    return fields
+
+
+def wants(fields: Fields, name: str) -> bool:
+    return fields is None or name in fields
+
+
+def pick(values: Mapping[str, Any], fields: Fields) -> dict:
+    """조회 결과(Row._mapping 등)에서 요청된 필드만 남깁니다."""
+    if fields is None:
+        return dict(values)
+    return {k: v for k, v in values.items() if k in fields}
@@ -0,0 +1,54 @@
+# HTTP 캐시 (ETag / 조건부 GET / Cache-Control)
+#
+# 카탈로그 조회(콘텐츠 목록/상세, 장르 목록)는 응답 본문을 만들기 전에
+# 가벼운 버전 값(max(updated_at) 등)으로 강한 ETag 를 계산합니다.
+# If-None-Match 가 일치하면 본문 조회/직렬화(및 TMDB 호출) 없이 304 를 돌려줍니다.
+# 카탈로그 응답은 사용자와 무관하므로 public 으로 표시하여 리버스 프록시가 캐시할 수 있게 합니다.
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from src.core.config import settings
+
+# 라우트별 Cache-Control 정책
+CATALOG_CACHE = (
+    f"public, max-age={settings.CACHE_CATALOG_MAX_AGE}, "
+    f"stale-while-revalidate={settings.CACHE_CATALOG_STALE_SECONDS}"
+)
+# 집계형 응답(인기 콘텐츠 등): ETag 없이 짧게만 캐시
+AGGREGATE_CACHE = f"public, max-age={settings.CACHE_AGGREGATE_MAX_AGE}"
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 값들로 강한 ETag 를 만듭니다. 배포 버전을 포함하여 응답 형식 변경 시 무효화."""
+    raw = "|".join(str(p) for p in (settings.APP_VERSION, *parts))
+    return '"' + hashlib.sha1(raw.encode()).hexdigest()[:20] + '"'
+
+
+def _opaque(tag: str) -> str:
+    # If-None-Match 는 약한 비교 (압축 미들웨어가 ETag 를 W/ 로 바꿔도 일치)
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(t) for t in if_none_match.split(",")}
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Optional[Response]:
+    """If-None-Match 가 현재 ETag 와 일치하면 304 응답, 아니면 None."""
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def with_cache_headers(response: Response, cache_control: str, etag: Optional[str] = None) -> Response:
+    if etag:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return response
@@ -1,19 +1,153 @@
+import copy
+import json
 import logging
+import queue
+import random
 import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from src.core.config import settings
+from src.core.request_context import current_request_id, current_route
+
+# 앱 로깅 구성
+#
+# 요청 처리 코드는 레코드를 메모리 큐에 넣기만 하고, stdout 출력(포맷/스택트레이스 변환 포함)은
+# 백그라운드 리스너 스레드가 합니다. stdout 파이프가 느려도 요청이 막히지 않습니다.
+# - 큐 크기는 LOG_QUEUE_SIZE 로 제한. 가득 차면 기다리지 않고 버린 뒤 개수를 셉니다. (/health)
+# - LOG_JSON=true 이면 한 줄에 JSON 하나 (수집기에서 필드로 검색)
+# - 요청마다 남는 접근 로그(app.access)는 LOG_ACCESS_SAMPLING 으로 레벨별 샘플링
+#   예: "INFO=0.1" -> INFO 접근 로그의 10% 만 출력. WARNING 이상은 항상 출력.
+
+TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+
+class _DropCountingQueueHandler(QueueHandler):
+    """큐가 가득 차면 레코드를 버리고 개수를 셉니다. (QueueHandler 기본 동작은 에러 출력)"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지 인자만 합치고 포맷(스택트레이스 문자열 변환 포함)은 리스너 스레드에서 처리
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        # 요청 컨텍스트는 리스너 스레드에서 읽을 수 없으므로 여기서 기록
+        record.route = current_route()
+        record.request_id = current_request_id()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("route", "request_id"):
+            value = getattr(record, key, "-")
+            if value != "-":
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """레벨별 비율로 레코드를 통과시킵니다. 지정하지 않은 레벨은 모두 통과."""
+
+    def __init__(self, rates: Dict[int, float]):
+        super().__init__()
+        self.rates = rates
+        self.sampled_out = 0
+
+    @classmethod
+    def parse(cls, value: str) -> "SamplingFilter":
+        """"INFO=0.1,DEBUG=0" 형식. 모르는 레벨이나 0~1 밖의 비율은 설정 오류로 ValueError."""
+        rates = {}
+        for part in value.split(","):
+            if not part.strip():
+                continue
+            level, _, rate = part.partition("=")
+            # getLevelName 은 모르는 이름이면 예외 대신 "Level X" 문자열을 반환
+            levelno = logging.getLevelName(level.strip().upper())
+            if not isinstance(levelno, int):
+                raise ValueError(f"LOG_ACCESS_SAMPLING: unknown log level {level.strip()!r}")
+            rates[levelno] = float(rate)
+            if not 0 <= rates[levelno] <= 1:
+                raise ValueError(f"LOG_ACCESS_SAMPLING: rate must be between 0 and 1 ({part.strip()!r})")
+        return cls(rates)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno)
+        if rate is None or rate >= 1 or random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+_handler: Optional[_DropCountingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+_access_filter: Optional[SamplingFilter] = None
+
 
 def setup_logging(level: str = "INFO") -> None:
     """
     앱 전체 로깅 기본 설정.
-    - stdout으로 출력
-    - 포맷 통일
+    - 큐 + 백그라운드 리스너를 거쳐 stdout으로 출력
+    - 포맷 통일 (LOG_JSON 이면 JSON)
     """
+    global _handler, _listener, _access_filter
+    shutdown_logging()
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
-    logging.basicConfig(
-        level=numeric_level,
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if settings.LOG_JSON else logging.Formatter(TEXT_FORMAT))
+
+    _handler = _DropCountingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    _listener = QueueListener(_handler.queue, output, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.handlers = [_handler]
+    root.setLevel(numeric_level)
+
+    if _access_filter is not None:
+        access_logger.removeFilter(_access_filter)
+    _access_filter = SamplingFilter.parse(settings.LOG_ACCESS_SAMPLING)
+    access_logger.addFilter(_access_filter)
+
+
+def shutdown_logging() -> None:
+    # 큐에 남은 레코드를 모두 출력하고 리스너 종료
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_stats() -> Dict[str, Any]:
+    return {
+        "json": settings.LOG_JSON,
+        "queue_size": settings.LOG_QUEUE_SIZE,
+        "queued": _handler.queue.qsize() if _handler else 0,
+        "dropped": _handler.dropped if _handler else 0,
+        "access_sampled_out": _access_filter.sampled_out if _access_filter else 0,
+    }
+
 
 # 여기서 export 되는 logger (다른 파일들이 import해서 씀)
-logger = logging.getLogger("app")
\ No newline at end of file
+logger = logging.getLogger("app")
+# 요청마다 한 줄씩 남는 접근 로그 (샘플링 대상)
+access_logger = logging.getLogger("app.access")
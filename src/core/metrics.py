@@ -0,0 +1,107 @@
+# Prometheus 메트릭 (/metrics)
+#
+# - HTTP: 라우트(경로 템플릿)별 요청 수/지연 시간 히스토그램, 처리 중인 요청 수
+# - DB 커넥션 풀: 획득 대기/점유 시간, 타임아웃, 사용 중 커넥션 수
+# - Redis 명령, TMDB 호출: 지연 시간과 오류
+#
+# 여러 uvicorn 워커: PROMETHEUS_MULTIPROC_DIR 환경 변수를 설정하면 prometheus_client 의
+# multiprocess 모드로 동작하여 각 워커가 mmap 파일에 기록하고, 어느 워커가 /metrics 를
+# 받더라도 전체 워커의 합계를 응답합니다. (디렉터리는 서버 시작 전에 비워야 함: entrypoint.sh)
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.types import Scope
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# API 라우트가 아닌 경로(404, 정적 문서 등)는 한 라벨로 묶어 시계열 수를 라우트 수로 제한
+OTHER_ROUTE = "other"
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+_DB_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP 요청 수", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ["method", "route"],
+    buckets=_LATENCY_BUCKETS,
+)
+# 라우트는 라우팅이 끝나야 알 수 있으므로 메서드 단위로 집계
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수", ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "DB 커넥션 획득 대기 시간", ["pool"], buckets=_DB_BUCKETS,
+)
+DB_POOL_HOLD = Histogram(
+    "db_pool_hold_seconds", "DB 커넥션 점유 시간 (획득~반납)", ["pool"], buckets=_DB_BUCKETS,
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "DB 커넥션 획득 타임아웃 수", ["pool"]
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use", "사용 중인 DB 커넥션 수", ["pool"], multiprocess_mode="livesum",
+)
+
+REDIS_LATENCY = Histogram(
+    "redis_command_duration_seconds", "Redis 명령 처리 시간", ["command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5),
+)
+REDIS_ERRORS = Counter(
+    "redis_command_errors_total", "Redis 명령 오류 수", ["command"]
+)
+
+TMDB_LATENCY = Histogram(
+    "tmdb_request_duration_seconds", "TMDB API 호출 시간", ["endpoint", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+
+def route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", OTHER_ROUTE)
+
+
+def observe_request(method: str, route: str, status: int, elapsed: float) -> None:
+    HTTP_REQUESTS.labels(method, route, str(status)).inc()
+    HTTP_LATENCY.labels(method, route).observe(elapsed)
+
+
+@contextmanager
+def track_tmdb(endpoint: str) -> Iterator[dict]:
+    """TMDB 호출 시간 측정. 호출부가 result["status"] 에 응답 코드를 기록합니다."""
+    result = {"status": "error"}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        TMDB_LATENCY.labels(endpoint, str(result["status"])).observe(time.perf_counter() - start)
+
+
+def render_latest() -> tuple:
+    """(본문, Content-Type). multiprocess 모드면 모든 워커의 값을 합산합니다."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    # 종료하는 워커의 livesum 게이지 파일 정리 (in-progress/사용 중 커넥션 값이 남지 않도록)
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
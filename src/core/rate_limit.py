@@ -0,0 +1,140 @@
+# Redis 기반 분산 Rate Limiter (GCRA)
+#
+# - 모든 워커가 같은 Redis 키를 공유하므로 워커 수와 무관하게 한도가 유지됩니다.
+# - 키 하나에 "이론적 도착 시각(TAT)"만 저장하여 사용자/IP 수가 늘어도 메모리가 작고,
+#   키는 한도 기간이 지나면 자동 만료됩니다.
+# - 판정은 Lua 스크립트(EVALSHA) 한 번, 즉 요청당 Redis 왕복 1회로 원자적으로 처리합니다.
+# - 식별자: 유효한 Access Token 이 있으면 user id, 없으면 클라이언트 IP.
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from fastapi import Depends, Request
+from redis import Redis
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.security import bearer_subject
+from src.deps.redis import get_redis
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_POLICY_RE = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)\s*$")
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    limit: int
+    period: int  # seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimitPolicy":
+        match = _POLICY_RE.match(value)
+        if not match:
+            raise ValueError(f"Invalid rate limit policy: {value}")
+        return cls(limit=int(match.group(1)), period=_PERIODS[match.group(2)])
+
+    def __str__(self) -> str:
+        return f"{self.limit} per {self.period} second(s)"
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, policy: RateLimitPolicy, retry_after: float):
+        self.policy = policy
+        self.retry_after = retry_after
+        super().__init__(f"Rate limit exceeded: {policy}")
+
+
+# 라우트별 정책 ("METHOD 경로 템플릿" -> 정책). 없는 라우트는 RATE_LIMIT_DEFAULT.
+ROUTE_POLICIES: Dict[str, str] = {
+    "POST /auth/login": "10/minute",
+    "POST /auth/google": "10/minute",
+    "POST /auth/firebase": "10/minute",
+    "POST /auth/refresh": "30/minute",
+    "POST /users/signup": "5/minute",
+    "PATCH /users/me/password": "5/minute",
+    "GET /users/me/reviews/export": "5/hour",
+    "GET /users/me/bookmarks/export": "5/hour",
+}
+
+_default_policy = RateLimitPolicy.parse(settings.RATE_LIMIT_DEFAULT)
+_route_policies = {k: RateLimitPolicy.parse(v) for k, v in ROUTE_POLICIES.items()}
+
+# GCRA: 반환값 {허용 여부(1/0), 재시도까지 남은 ms, 남은 요청 수}
+# 시간은 모두 정수 마이크로초 (7/minute 처럼 간격이 ms 로 나누어떨어지지 않아도 정수 연산).
+# TAT 는 %d 로 저장 (Lua 의 tostring 은 16자리 정수를 지수 표기로 바꿔 정밀도를 잃음),
+# PX 에는 올림한 ms 를 넘김 (SET PX 는 정수만 허용)
+_GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local ahead = new_tat - now
+if ahead > period then
+    return {0, math.ceil((ahead - period) / 1000), 0}
+end
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', math.ceil(ahead / 1000))
+return {1, 0, math.floor((period - ahead) / interval)}
+"""
+
+
+class RateLimiter:
+    def __init__(self):
+        self._script = None
+        self._script_client: Optional[Redis] = None
+
+    def _get_script(self, rds: Redis):
+        # Script 객체는 EVALSHA 를 사용하고, 서버에 없으면 자동으로 EVAL 로 재시도
+        if self._script is None or self._script_client is not rds:
+            self._script = rds.register_script(_GCRA_SCRIPT)
+            self._script_client = rds
+        return self._script
+
+    def hit(self, rds: Redis, key: str, policy: RateLimitPolicy) -> tuple[bool, float, int]:
+        period_us = policy.period * 1_000_000
+        # 내림: limit 개의 간격 합이 period 를 넘지 않아야 한 번에 limit 개까지 허용됨
+        interval_us = period_us // policy.limit
+        allowed, retry_ms, remaining = self._get_script(rds)(
+            keys=[key], args=[interval_us, period_us]
+        )
+        return bool(allowed), float(retry_ms) / 1000, int(remaining)
+
+
+limiter = RateLimiter()
+
+
+def policy_for(method: str, route_path: str) -> tuple[str, RateLimitPolicy]:
+    route_key = f"{method} {route_path}"
+    return route_key, _route_policies.get(route_key, _default_policy)
+
+
+def _identity(request: Request) -> str:
+    sub = bearer_subject(request.headers.get("authorization"))
+    if sub:
+        return f"u:{sub}"
+    client = request.client.host if request.client else "unknown"
+    return f"ip:{client}"
+
+
+def enforce_rate_limit(request: Request, rds: Optional[Redis] = Depends(get_redis)) -> None:
+    """
+    앱 전역 Dependency. 라우팅이 끝난 뒤 실행되므로 경로 템플릿 단위로 정책을 적용합니다.
+    Redis 를 쓸 수 없으면 제한하지 않습니다(fail-open).
+    """
+    if rds is None or not settings.RATE_LIMIT_ENABLED:
+        return
+    route = request.scope.get("route")
+    route_path = getattr(route, "path", request.url.path)
+    route_key, policy = policy_for(request.method, route_path)
+    key = f"rl:{route_key}:{_identity(request)}"
+    try:
+        allowed, retry_after, _ = limiter.hit(rds, key, policy)
+    except Exception as e:
+        logger.warning("rate limit check failed: %s", e)
+        return
+    if not allowed:
+        raise RateLimitExceeded(policy, retry_after)
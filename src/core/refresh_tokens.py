@@ -0,0 +1,121 @@
+# Refresh Token 패밀리 저장소 (Redis)
+#
+# - 키: refresh_tokens:{user_id} (HASH, 필드 = 패밀리 id(fid), 값 = "{jti}:{만료 epoch}")
+# - 로그인(기기)마다 패밀리 하나가 생기므로 사용자당 여러 세션을 동시에 유지합니다.
+# - 갱신 시 같은 패밀리 안에서 jti 를 교체(rotation)하며, 이미 교체된 이전 토큰이 다시
+#   사용되면 탈취로 보고 해당 패밀리를 폐기합니다(reuse detection).
+# - 발급/갱신은 Lua 스크립트 한 번(요청당 Redis 왕복 1회)으로 원자적으로 처리합니다.
+# - 사용자 전체 폐기(관리자 차단/삭제, 탈퇴)는 키 하나를 지우는 것으로 끝납니다.
+import time
+import uuid
+from typing import Optional, Tuple
+
+from redis import Redis
+
+from src.core.config import settings
+
+# rotate() 결과
+ROTATED = "rotated"
+REUSED = "reused"
+UNKNOWN = "unknown"
+
+# 만료된 패밀리를 정리하고, 세션 수가 한도를 넘으면 만료가 가장 이른 패밀리부터 제거
+_PRUNE = """
+local function prune(key, now, max_sessions)
+    local entries = redis.call('HGETALL', key)
+    local live = {}
+    for i = 1, #entries, 2 do
+        local exp = tonumber(string.match(entries[i + 1], ':(%d+)$'))
+        if not exp or exp <= now then
+            redis.call('HDEL', key, entries[i])
+        else
+            table.insert(live, {entries[i], exp})
+        end
+    end
+    if #live > max_sessions then
+        table.sort(live, function(a, b) return a[2] < b[2] end)
+        for i = 1, #live - max_sessions do
+            redis.call('HDEL', key, live[i][1])
+        end
+    end
+end
+"""
+
+# ARGV: fid, jti, exp, now, ttl, max_sessions
+_ISSUE_SCRIPT = _PRUNE + """
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2] .. ':' .. ARGV[3])
+prune(KEYS[1], tonumber(ARGV[4]), tonumber(ARGV[6]))
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+# ARGV: fid, 제시된 jti, 새 jti, 새 exp, now, ttl
+_ROTATE_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if not current then
+    return 'unknown'
+end
+local jti, exp = string.match(current, '^(.*):(%d+)$')
+if tonumber(exp) <= tonumber(ARGV[5]) then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    return 'unknown'
+end
+if jti ~= ARGV[2] then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    return 'reused'
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3] .. ':' .. ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[6])
+return 'rotated'
+"""
+
+
+def _store_key(user_id: int) -> str:
+    return f"refresh_tokens:{user_id}"
+
+
+def new_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _ttl_seconds() -> int:
+    return settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60
+
+
+def issue(rds: Redis, user_id: int, fid: str, jti: str) -> None:
+    """새 패밀리를 등록합니다. (로그인 1회 = 패밀리 1개)"""
+    now = int(time.time())
+    ttl = _ttl_seconds()
+    rds.eval(
+        _ISSUE_SCRIPT, 1, _store_key(user_id),
+        fid, jti, now + ttl, now, ttl, settings.REFRESH_MAX_SESSIONS,
+    )
+
+
+def rotate(rds: Redis, user_id: int, fid: str, jti: str) -> Tuple[str, Optional[str]]:
+    """
+    제시된 (fid, jti)가 패밀리의 현재 토큰이면 새 jti 로 교체하고 (ROTATED, 새 jti)를 반환합니다.
+    이전 jti 재사용이면 패밀리를 폐기하고 (REUSED, None),
+    패밀리가 없거나 만료되었으면 (UNKNOWN, None)을 반환합니다.
+    """
+    now = int(time.time())
+    ttl = _ttl_seconds()
+    new_jti = new_id()
+    result = rds.eval(
+        _ROTATE_SCRIPT, 1, _store_key(user_id),
+        fid, jti, new_jti, now + ttl, now, ttl,
+    )
+    if isinstance(result, bytes):
+        result = result.decode()
+    return result, new_jti if result == ROTATED else None
+
+
+def revoke(rds: Redis, user_id: int, fid: str) -> None:
+    """한 기기(패밀리)만 로그아웃합니다."""
+    rds.hdel(_store_key(user_id), fid)
+
+
+def revoke_all(rds: Redis, user_id: int) -> None:
+    """사용자의 모든 세션을 폐기합니다. Redis 파이프라인 객체도 받을 수 있습니다."""
+    rds.delete(_store_key(user_id))
+
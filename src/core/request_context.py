@@ -0,0 +1,34 @@
+# 요청 단위 컨텍스트 (contextvars)
+#
+# 미들웨어에서 현재 요청을 기록해 두면, 라우트/의존성/DB 풀 등 요청 객체를 받지 않는
+# 코드에서도 "어떤 요청에서 발생했는지"를 로그에 남길 수 있습니다.
+# (sync 라우트가 실행되는 스레드 풀에도 컨텍스트가 복사되어 전달됩니다)
+from contextvars import ContextVar, Token
+from typing import Optional
+
+_current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def set_route(method: str, path: str) -> Token:
+    return _current_route.set(f"{method} {path}")
+
+
+def reset_route(token: Token) -> None:
+    _current_route.reset(token)
+
+
+def current_route() -> str:
+    return _current_route.get() or "-"
+
+
+def set_request_id(request_id: str) -> Token:
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    _request_id.reset(token)
+
+
+def current_request_id() -> str:
+    return _request_id.get() or "-"
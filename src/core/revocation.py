@@ -0,0 +1,52 @@
+# Access Token 폐기 목록 (Redis)
+#
+# AUTH_STATELESS 모드에서는 Access Token의 role/status 클레임을 그대로 신뢰하므로,
+# 역할 변경/차단/탈퇴 시 해당 사용자의 "이 시각 이전에 발급된 토큰은 무효"라는
+# 타임스탬프(epoch 초, 밀리초 정밀도)를 revoked_before:{user_id} 키에 기록합니다.
+# 키는 Access Token 수명만큼만 유지되므로(그 이전 토큰은 어차피 만료) 크기가 작게 유지됩니다.
+import time
+from typing import Optional
+
+from redis import Redis
+
+from src.core import refresh_tokens, user_cache
+from src.core.config import settings
+from src.core.logging import logger
+
+
+def _revoked_key(user_id: int) -> str:
+    return f"revoked_before:{user_id}"
+
+
+def is_revoked(rds: Redis, user_id: int, issued_at: float) -> bool:
+    """
+    토큰 발급 시각(iat)이 폐기 시각 이하이면 True.
+    둘 다 밀리초 정밀도라 폐기 직후(같은 초)에 다시 발급된 토큰은 유효합니다.
+    Redis 오류는 호출자가 처리하도록 그대로 전파합니다.
+    """
+    raw = rds.get(_revoked_key(user_id))
+    if raw is None:
+        return False
+    return float(issued_at) <= float(raw)
+
+
+def revoke_user_access(rds: Optional[Redis], user_id: int) -> None:
+    """
+    역할/상태 변경 및 탈퇴 시 호출합니다.
+    인증 캐시를 비우고, 이미 발급된 Access Token을 폐기 목록에 올리며,
+    모든 기기의 Refresh Token 패밀리를 삭제합니다. (파이프라인 1회)
+    """
+    user_cache.invalidate(rds, user_id)
+    if rds is None:
+        return
+    try:
+        pipe = rds.pipeline(transaction=False)
+        pipe.set(
+            _revoked_key(user_id),
+            f"{time.time():.3f}",
+            ex=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        )
+        refresh_tokens.revoke_all(pipe, user_id)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("token revocation failed (user=%s): %s", user_id, e)
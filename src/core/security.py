@@ -1,6 +1,11 @@
 # 비번 해시 + JWT
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional, Dict
+from typing import Any, Callable, Optional, Dict
 
 import bcrypt
 from jose import jwt, JWTError
@@ -8,15 +13,140 @@ from jose import jwt, JWTError
 from src.core.config import settings
 
 
+# ==========================================
+# 1. Password Hashing (bcrypt)
+# ==========================================
+
 def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
+    if not password_hash:  # 소셜 로그인 계정은 비밀번호 해시가 비어 있음
+        return False
     return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
 
 
+def needs_rehash(password_hash: str) -> bool:
+    """저장된 해시의 cost가 현재 BCRYPT_ROUNDS 와 다르면 True ($2b$<cost>$...)."""
+    if not password_hash:
+        return False
+    try:
+        return int(password_hash.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return False
+
+
+class PasswordHasherBusy(Exception):
+    """해시 작업 대기열이 가득 찬 경우."""
+
+
+class _PasswordHasher:
+    """
+    bcrypt 전용 스레드 풀.
+    anyio 기본 스레드 풀(요청 처리용)과 분리하여 로그인/가입 폭주 시에도
+    다른 엔드포인트가 굶지 않도록 하고, 대기열 길이를 제한합니다.
+    bcrypt는 해시 계산 중 GIL을 해제하므로 스레드 수만큼 코어를 활용합니다.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers or (os.cpu_count() or 1)
+        self.queue_limit = queue_limit
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="bcrypt"
+                    )
+        return self._executor
+
+    def _run(self, fn: Callable, args: tuple, submitted_at: float):
+        waited = time.perf_counter() - submitted_at
+        with self._lock:
+            self._running += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._pending -= 1
+                self._completed += 1
+
+    async def run(self, fn: Callable, *args):
+        with self._lock:
+            if self._pending >= self.workers + self.queue_limit:
+                self._rejected += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+            self._submitted += 1
+        try:
+            future = self._get_executor().submit(self._run, fn, args, time.perf_counter())
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait_avg_ms": round(self._wait_total / self._completed * 1000, 2)
+                if self._completed else 0.0,
+                "wait_max_ms": round(self._wait_max * 1000, 2),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_hasher = _PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_LIMIT)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _hasher.run(hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    return await _hasher.run(verify_password, password, password_hash)
+
+
+def password_hasher_stats() -> Dict[str, Any]:
+    return _hasher.stats()
+
+
+def shutdown_password_hasher() -> None:
+    _hasher.shutdown()
+
+
+# ==========================================
+# 2. JWT
+# ==========================================
+
+
 def create_token(
     subject: str,
     token_type: str,
@@ -27,7 +157,8 @@ def create_token(
     payload: Dict[str, Any] = {
         "sub": subject,
         "type": token_type,  # "access" or "refresh"
-        "iat": int(now.timestamp()),
+        # 폐기 시각과 밀리초 단위로 비교할 수 있도록 소수 3자리 (RFC 7519 NumericDate 는 소수 허용)
+        "iat": round(now.timestamp(), 3),
         "exp": int((now + timedelta(minutes=expires_minutes)).timestamp()),
     }
     if extra:
@@ -35,8 +166,29 @@ def create_token(
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
+def access_token_claims(user) -> Dict[str, Any]:
+    """Stateless 인증에 필요한 role/status 클레임."""
+    return {
+        "role": str(getattr(user.role, "value", user.role)),
+        "status": str(getattr(user.status, "value", user.status)),
+    }
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     try:
         return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
     except JWTError as e:
         raise ValueError("Invalid token") from e
+
+
+def bearer_subject(authorization: Optional[str]) -> Optional[str]:
+    """
+    Authorization 헤더의 Bearer 토큰에서 sub 를 꺼냅니다. 없거나 유효하지 않으면 None.
+    (인증 자체가 아니라 Rate Limit 키, 읽기 라우팅 등 요청 식별 용도)
+    """
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    try:
+        return decode_token(authorization[7:]).get("sub")
+    except ValueError:
+        return None
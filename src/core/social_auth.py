@@ -0,0 +1,183 @@
+# Google / Firebase ID 토큰 검증 서비스
+#
+# 공개 서명 키(x509 인증서)를 프로세스 메모리에 보관하고,
+# 응답의 Cache-Control max-age 에 맞춰 백그라운드 스레드에서 갱신합니다.
+# 토큰 검증은 메모리의 키로 로컬에서 수행하므로 요청 경로에 네트워크 호출이 없습니다.
+# (처음 사용 시 키가 없거나, 알 수 없는 kid 가 들어온 경우에만 동기 갱신)
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from google.auth import jwt as google_jwt
+
+from src.core.config import settings
+from src.core.logging import logger
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+FIREBASE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+)
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+DEFAULT_TTL_SECONDS = 3600
+RETRY_SECONDS = 60          # 갱신 실패 시 재시도 간격 (기존 키는 계속 사용)
+REFRESH_MARGIN_SECONDS = 300  # 만료 전 미리 갱신
+FORCED_REFRESH_INTERVAL = 60  # 알 수 없는 kid 로 인한 강제 갱신 최소 간격
+CLOCK_SKEW_SECONDS = 10
+
+
+class KeySet:
+    """하나의 인증서 엔드포인트에 대한 kid -> PEM 인증서 캐시."""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.url = url
+        self._certs: Dict[str, str] = {}
+        self._expires_at = 0.0
+        self._last_fetch = 0.0
+        self._static = False
+        self._lock = threading.Lock()
+
+    def load_local(self, certs: Dict[str, str]) -> None:
+        """오프라인 테스트용: 주어진 키만 사용하고 네트워크 갱신을 하지 않습니다."""
+        with self._lock:
+            self._certs = dict(certs)
+            self._static = True
+            self._expires_at = float("inf")
+
+    def refresh(self, force: bool = False) -> None:
+        if self._static:
+            return
+        with self._lock:
+            # 대기하는 동안 다른 스레드가 이미 갱신했다면 생략
+            if not force and self._certs and self._expires_at > time.monotonic():
+                return
+            self._last_fetch = time.monotonic()
+            try:
+                resp = httpx.get(self.url, timeout=5.0)
+                resp.raise_for_status()
+                certs = resp.json()
+            except Exception as e:
+                logger.warning("%s key fetch failed: %s", self.name, e)
+                self._expires_at = time.monotonic() + RETRY_SECONDS
+                return
+            match = _MAX_AGE_RE.search(resp.headers.get("cache-control", ""))
+            ttl = int(match.group(1)) if match else DEFAULT_TTL_SECONDS
+            self._certs = certs
+            self._expires_at = time.monotonic() + ttl
+
+    def seconds_until_refresh(self) -> float:
+        return self._expires_at - REFRESH_MARGIN_SECONDS - time.monotonic()
+
+    def certs(self, kid: Optional[str] = None) -> Dict[str, str]:
+        # 콜드 스타트 또는 백그라운드 갱신이 멈춘 경우에만 요청 경로에서 갱신
+        if not self._certs or self._expires_at < time.monotonic():
+            self.refresh()
+        elif (
+            kid is not None
+            and kid not in self._certs
+            and time.monotonic() - self._last_fetch > FORCED_REFRESH_INTERVAL
+        ):
+            self.refresh(force=True)
+        return self._certs
+
+
+class SocialTokenVerifier:
+    def __init__(self):
+        self.google = KeySet("google", GOOGLE_CERTS_URL)
+        self.firebase = KeySet("firebase", FIREBASE_CERTS_URL)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------- key management ----------
+
+    def load_local_keys(
+        self,
+        google: Optional[Dict[str, str]] = None,
+        firebase: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if google is not None:
+            self.google.load_local(google)
+        if firebase is not None:
+            self.firebase.load_local(firebase)
+
+    def load_local_keys_file(self, path: str) -> None:
+        """{"google": {kid: pem}, "firebase": {kid: pem}} 형식의 JSON 파일."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.load_local_keys(data.get("google"), data.get("firebase"))
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            for key_set in (self.google, self.firebase):
+                if key_set.seconds_until_refresh() <= 0:
+                    key_set.refresh(force=True)
+            wait = min(self.google.seconds_until_refresh(), self.firebase.seconds_until_refresh())
+            self._stop.wait(min(max(wait, RETRY_SECONDS), DEFAULT_TTL_SECONDS))
+
+    def start(self) -> None:
+        if settings.SOCIAL_AUTH_LOCAL_CERTS_FILE:
+            self.load_local_keys_file(settings.SOCIAL_AUTH_LOCAL_CERTS_FILE)
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="social-key-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    # ---------- verification ----------
+
+    def _decode(self, key_set: KeySet, token: str, audience: Optional[str]) -> Dict[str, Any]:
+        kid = google_jwt.decode_header(token).get("kid")
+        certs = key_set.certs(kid)
+        return google_jwt.decode(
+            token,
+            certs=certs,
+            audience=audience,
+            clock_skew_in_seconds=CLOCK_SKEW_SECONDS,
+        )
+
+    def verify_google(self, token: str) -> Dict[str, Any]:
+        """
+        Google ID 토큰 검증. 실패 시 ValueError.
+        (기존 동작과 동일하게 audience 는 검사하지 않습니다)
+        """
+        claims = self._decode(self.google, token, audience=None)
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise ValueError("Wrong issuer")
+        return claims
+
+    def firebase_project_id(self) -> Optional[str]:
+        if settings.FIREBASE_PROJECT_ID:
+            return settings.FIREBASE_PROJECT_ID
+        try:
+            import firebase_admin
+            return firebase_admin.get_app().project_id
+        except Exception:
+            return None
+
+    def verify_firebase(self, token: str) -> Dict[str, Any]:
+        """Firebase ID 토큰 검증. 실패 시 ValueError."""
+        project_id = self.firebase_project_id()
+        if not project_id:
+            raise ValueError("Firebase project id is not configured")
+        claims = self._decode(self.firebase, token, audience=project_id)
+        if claims.get("iss") != f"https://securetoken.google.com/{project_id}":
+            raise ValueError("Wrong issuer")
+        if not claims.get("sub"):
+            raise ValueError("Missing subject")
+        return claims
+
+
+verifier = SocialTokenVerifier()
@@ -1,10 +1,38 @@
 from datetime import date
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from src.core.config import settings
 from src.core.errors import ErrorCode, http_error
+from src.core.metrics import track_tmdb
+from src.core import tracing
+
+# async 라우트용 공유 클라이언트 (워커 프로세스당 하나, 앱 lifespan 에서 생성/종료)
+# 호출마다 클라이언트를 만들면 TLS 연결과 커넥션 풀을 매번 새로 만듭니다.
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def init_tmdb_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient()
+    return _async_client
+
+
+async def close_tmdb_client() -> None:
+    global _async_client
+    client, _async_client = _async_client, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _get_async(url: str, params: dict) -> httpx.Response:
+    if _async_client is None:
+        # lifespan 없이 사용되는 경우(스크립트, 테스트)에는 호출마다 생성
+        async with httpx.AsyncClient() as client:
+            return await client.get(url, params=params, headers=tracing.inject())
+    return await _async_client.get(url, params=params, headers=tracing.inject())
 
 
 def _params() -> dict:
@@ -17,9 +45,13 @@ def _params() -> dict:
     return {"api_key": settings.TMDB_API_KEY, "language": "ko-KR"}
 
 
-def fetch_movie_detail(tmdb_id: int) -> Dict[str, Any]:
-    url = f"{settings.TMDB_API_BASE}/movie/{tmdb_id}"
-    resp = httpx.get(url, params=_params())
+def _trace_response(span, resp: httpx.Response) -> None:
+    if span is not None:
+        # URL 에 api_key 가 있으므로 경로만 기록
+        span.attributes.update({"http.path": resp.request.url.path, "http.status_code": resp.status_code})
+
+
+def _movie_detail(resp: httpx.Response) -> Dict[str, Any]:
     if resp.status_code != 200:
         raise http_error(
             status_code=502,
@@ -37,9 +69,34 @@ def fetch_movie_detail(tmdb_id: int) -> Dict[str, Any]:
     return data
 
 
+def fetch_movie_detail(tmdb_id: int) -> Dict[str, Any]:
+    url = f"{settings.TMDB_API_BASE}/movie/{tmdb_id}"
+    params = _params()
+    with track_tmdb("movie") as result, tracing.span("tmdb GET /movie/{id}", kind="client") as span:
+        resp = httpx.get(url, params=params, headers=tracing.inject())
+        result["status"] = resp.status_code
+        _trace_response(span, resp)
+    return _movie_detail(resp)
+
+
+async def fetch_movie_detail_async(tmdb_id: int) -> Dict[str, Any]:
+    """async 라우트용: TMDB 응답을 기다리는 동안 이벤트 루프를 막지 않습니다."""
+    url = f"{settings.TMDB_API_BASE}/movie/{tmdb_id}"
+    params = _params()
+    with track_tmdb("movie") as result, tracing.span("tmdb GET /movie/{id}", kind="client") as span:
+        resp = await _get_async(url, params)
+        result["status"] = resp.status_code
+        _trace_response(span, resp)
+    return _movie_detail(resp)
+
+
 def fetch_genre_list() -> List[dict]:
     url = f"{settings.TMDB_API_BASE}/genre/movie/list"
-    resp = httpx.get(url, params=_params())
+    params = _params()
+    with track_tmdb("genre_list") as result, tracing.span("tmdb GET /genre/movie/list", kind="client") as span:
+        resp = httpx.get(url, params=params, headers=tracing.inject())
+        result["status"] = resp.status_code
+        _trace_response(span, resp)
     if resp.status_code != 200:
         raise http_error(
             status_code=502,
@@ -0,0 +1,314 @@
+# 경량 요청 트레이싱
+#
+# 요청마다 루트 span 을 만들고(미들웨어), 그 안에서 실행되는 SQL 문장, Redis 명령,
+# TMDB 호출을 자식 span 으로 기록합니다. "느린 /contents/{id} 의 시간이 Postgres/Redis/TMDB
+# 중 어디에 쓰였는지"를 보는 용도이며 OpenTelemetry SDK 없이 동작합니다.
+#
+# - 샘플링: 요청의 traceparent 에 sampled 플래그가 있으면 따르고, 없으면 TRACING_SAMPLE_RATE 확률
+#   (샘플링되지 않은 요청은 span 객체를 만들지 않아 비용이 거의 없음)
+# - 전파: W3C traceparent 헤더를 받아 이어 쓰고, TMDB 호출에 traceparent 를 붙여 보냄
+# - 내보내기: 백그라운드 스레드가 모아서 기록
+#     file: TRACING_FILE 에 span 한 줄씩 JSON (jq 로 trace_id 별로 보기 쉬움)
+#     otlp: TRACING_OTLP_ENDPOINT 로 OTLP/HTTP JSON POST (collector 나 호환 수집기)
+#   큐가 가득 차면 버리고 개수만 셉니다. (요청 처리를 막지 않음)
+import json
+import queue
+import random
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+from src.core.logging import logger
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], kind: str = "internal"):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    def child(self, name: str, kind: str = "internal") -> "Span":
+        return Span(name, self.trace_id, self.span_id, kind)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def end(self) -> None:
+        self.end_ns = time.time_ns()
+        _exporter.submit(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+# ==========================================
+# 요청(루트) span
+# ==========================================
+
+def _sampled(traceparent: Optional[str]) -> tuple:
+    """(샘플링 여부, trace_id, 부모 span id)"""
+    match = _TRACEPARENT_RE.match(traceparent or "")
+    if match and match.group(1) != "0" * 32:
+        trace_id, parent_id, flags = match.groups()
+        return bool(int(flags, 16) & 1), trace_id, parent_id
+    return random.random() < settings.TRACING_SAMPLE_RATE, secrets.token_hex(16), None
+
+
+def start_request(method: str, path: str, traceparent: Optional[str] = None):
+    """루트 span 을 시작합니다. 샘플링되지 않으면 (None, None)."""
+    if not settings.TRACING_ENABLED:
+        return None, None
+    sampled, trace_id, parent_id = _sampled(traceparent)
+    if not sampled:
+        return None, None
+    span = Span(f"{method} {path}", trace_id, parent_id, kind="server")
+    span.attributes.update({"http.method": method, "http.target": path})
+    return span, _current.set(span)
+
+
+def end_request(span: Optional[Span], token, route: Optional[str], status: int) -> None:
+    if span is None:
+        return
+    _current.reset(token)
+    if route:
+        # 집계하기 쉽도록 span 이름은 경로 템플릿으로
+        span.name = f"{span.attributes['http.method']} {route}"
+        span.attributes["http.route"] = route
+    span.attributes["http.status_code"] = status
+    if status >= 500:
+        span.error = span.error or f"HTTP {status}"
+    span.end()
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Optional[Span]]:
+    """현재 요청이 샘플링된 경우에만 자식 span 을 기록합니다."""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    child = parent.child(name, kind)
+    child.attributes.update(attributes)
+    token = _current.set(child)
+    try:
+        yield child
+    except Exception as e:
+        child.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current.reset(token)
+        child.end()
+
+
+def inject(headers: Optional[dict] = None) -> dict:
+    """외부 호출 헤더에 traceparent 추가 (샘플링된 요청인 경우)."""
+    headers = dict(headers or {})
+    current = _current.get()
+    if current is not None:
+        headers["traceparent"] = current.traceparent
+    return headers
+
+
+# ==========================================
+# SQLAlchemy: 커서 실행마다 자식 span
+# ==========================================
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    parent = _current.get()
+    if parent is None:
+        return
+    child = parent.child("db.query", kind="client")
+    child.attributes.update({
+        "db.system": conn.dialect.name,
+        "db.statement": " ".join(statement.split())[:500],
+    })
+    conn.info.setdefault("trace_spans", []).append(child)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get("trace_spans")
+    if spans:
+        spans.pop().end()
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    conn = context.connection
+    spans = conn.info.get("trace_spans") if conn is not None else None
+    if spans:
+        failed = spans.pop()
+        failed.error = f"{type(context.original_exception).__name__}: {context.original_exception}"
+        failed.end()
+
+
+# ==========================================
+# Exporter
+# ==========================================
+
+class _Exporter:
+    def __init__(self, max_queue: int = 10000, batch_size: int = 512):
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue)
+        self._batch_size = batch_size
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self.exported = 0
+
+    def submit(self, finished: Span) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(finished)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch: List[Span] = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=0.5)
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self._export(batch)
+                    self.exported += len(batch)
+                except Exception as e:
+                    self.dropped += len(batch)
+                    logger.warning("Trace export failed (%d spans dropped): %s", len(batch), e)
+
+    def _export(self, batch: List[Span]) -> None:
+        if settings.TRACING_EXPORTER == "otlp":
+            httpx.post(settings.TRACING_OTLP_ENDPOINT, json=_otlp_payload(batch), timeout=5)
+        else:
+            with open(settings.TRACING_FILE, "a", encoding="utf-8") as f:
+                for s in batch:
+                    f.write(json.dumps(s.to_dict(), ensure_ascii=False, default=str) + "\n")
+
+    def shutdown(self, timeout: float = 5) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+        self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": settings.TRACING_ENABLED,
+            "sample_rate": settings.TRACING_SAMPLE_RATE,
+            "exporter": settings.TRACING_EXPORTER,
+            "queued": self._queue.qsize(),
+            "exported": self.exported,
+            "dropped": self.dropped,
+        }
+
+
+_OTLP_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_payload(batch: List[Span]) -> dict:
+    spans = []
+    for s in batch:
+        item = {
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": _OTLP_KINDS.get(s.kind, 1),
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 0},
+        }
+        if s.parent_id:
+            item["parentSpanId"] = s.parent_id
+        spans.append(item)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                {"key": "service.name", "value": {"stringValue": settings.TRACING_SERVICE_NAME}},
+                {"key": "service.version", "value": {"stringValue": settings.APP_VERSION}},
+            ]},
+            "scopeSpans": [{"scope": {"name": "src.core.tracing"}, "spans": spans}],
+        }]
+    }
+
+
+_exporter = _Exporter()
+
+
+def tracing_stats() -> Dict[str, Any]:
+    return _exporter.stats()
+
+
+def shutdown_tracing() -> None:
+    # 남은 span 을 내보내고 종료
+    _exporter.shutdown()
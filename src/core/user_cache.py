@@ -0,0 +1,133 @@
+# 인증용 사용자 정보 캐시 (프로세스 내 LRU + Redis)
+#
+# get_current_user 가 매 요청마다 users 테이블을 조회하지 않도록
+# 인증 판단에 필요한 필드(id, role, status, deleted_at)만 짧게 캐싱합니다.
+# - Redis TTL(USER_CACHE_TTL_SECONDS): 워커 간 공유되는 캐시
+# - 로컬 TTL(USER_CACHE_LOCAL_TTL_SECONDS): 다른 워커에서 무효화된 값이 남아있을 수 있는
+#   최대 시간이므로 Redis TTL보다 짧게 유지합니다.
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional
+
+from redis import Redis
+
+from src.core.config import settings
+from src.core.logging import logger
+
+
+@dataclass(frozen=True)
+class AuthUser:
+    id: int
+    role: str
+    status: str
+    deleted_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user) -> "AuthUser":
+        return cls(
+            id=int(user.id),
+            role=str(getattr(user.role, "value", user.role)),
+            status=str(getattr(user.status, "value", user.status)),
+            deleted_at=user.deleted_at,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["deleted_at"] = self.deleted_at.isoformat() if self.deleted_at else None
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "AuthUser":
+        data = json.loads(raw)
+        if data.get("deleted_at"):
+            data["deleted_at"] = datetime.fromisoformat(data["deleted_at"])
+        return cls(**data)
+
+
+class _LocalLRU:
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[int, tuple[float, AuthUser]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[AuthUser]:
+        with self._lock:
+            entry = self._items.get(user_id)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._items[user_id]
+                return None
+            self._items.move_to_end(user_id)
+            return value
+
+    def put(self, value: AuthUser) -> None:
+        with self._lock:
+            self._items[value.id] = (time.monotonic() + self.ttl_seconds, value)
+            self._items.move_to_end(value.id)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def pop(self, user_id: int) -> None:
+        with self._lock:
+            self._items.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_local = _LocalLRU(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_LOCAL_TTL_SECONDS)
+
+
+def _user_key(user_id: int) -> str:
+    return f"auth_user:{user_id}"
+
+
+def get(rds: Optional[Redis], user_id: int) -> Optional[AuthUser]:
+    cached = _local.get(user_id)
+    if cached is not None:
+        return cached
+    if rds is None:
+        return None
+    try:
+        raw = rds.get(_user_key(user_id))
+    except Exception as e:
+        logger.warning("user cache get failed (user=%s): %s", user_id, e)
+        return None
+    if not raw:
+        return None
+    value = AuthUser.from_json(raw)
+    _local.put(value)
+    return value
+
+
+def put(rds: Optional[Redis], value: AuthUser) -> None:
+    _local.put(value)
+    if rds is None:
+        return
+    try:
+        rds.setex(_user_key(value.id), settings.USER_CACHE_TTL_SECONDS, value.to_json())
+    except Exception as e:
+        logger.warning("user cache put failed (user=%s): %s", value.id, e)
+
+
+def invalidate(rds: Optional[Redis], user_id: int) -> None:
+    """역할/상태/탈퇴 변경 직후 호출하여 캐시된 인증 정보를 즉시 제거합니다."""
+    _local.pop(user_id)
+    if rds is None:
+        return
+    try:
+        rds.delete(_user_key(user_id))
+    except Exception as e:
+        logger.warning("user cache invalidate failed (user=%s): %s", user_id, e)
+
+
+def clear() -> None:
+    _local.clear()
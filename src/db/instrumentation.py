@@ -0,0 +1,79 @@
+# 요청 단위 SQL 계측
+#
+# 모든 Engine(sync/async/복제본)의 커서 실행 이벤트에서 쿼리 수와 DB 시간을 집계합니다.
+# 집계 대상은 미들웨어가 요청 시작 시 contextvar 에 넣어 둔 QueryStats 이며,
+# 요청 밖(스크립트, 백그라운드 작업)의 쿼리는 집계하지 않습니다.
+#
+# SQL_DEBUG_N_PLUS_ONE=true 이면 같은 모양(파라미터 바인딩 전 SQL 문자열)의 쿼리가
+# 한 요청에서 SQL_REPEAT_THRESHOLD 회 이상 반복될 때 N+1 의심 경고를 남깁니다.
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+
+
+class QueryStats:
+    __slots__ = ("count", "total", "statements")
+
+    def __init__(self, track_statements: bool = False):
+        self.count = 0
+        self.total = 0.0  # seconds
+        self.statements: Optional[Counter] = Counter() if track_statements else None
+
+    @property
+    def total_ms(self) -> float:
+        return self.total * 1000
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        if not self.statements:
+            return []
+        return [(stmt, n) for stmt, n in self.statements.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_request() -> Tuple[QueryStats, Token]:
+    stats = QueryStats(track_statements=settings.SQL_DEBUG_N_PLUS_ONE)
+    return stats, _current.set(stats)
+
+
+def end_request(token: Token) -> None:
+    _current.reset(token)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    stats.count += 1
+    stats.total += time.perf_counter() - starts.pop()
+    if stats.statements is not None:
+        stats.statements[statement] += 1
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    # 실패한 쿼리의 시작 시각이 남아 다음 쿼리 시간이 틀어지지 않도록 정리
+    conn = context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
@@ -2,6 +2,7 @@ from datetime import datetime, date
 from enum import Enum
 from typing import Optional, List
 
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship
 
 
@@ -50,6 +51,9 @@ class User(SQLModel, table=True):
 
 class ContentGenreLink(SQLModel, table=True):
     __tablename__ = "content_genres"
+    __table_args__ = (
+        Index("ix_content_genres_genre_id", "genre_id"),
+    )
 
     content_id: int = Field(foreign_key="contents.id", primary_key=True)
     genre_id: int = Field(foreign_key="genres.id", primary_key=True)
@@ -67,6 +71,7 @@ class Genre(SQLModel, table=True):
     name: str
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
     deleted_at: Optional[datetime] = Field(default=None)
 
     contents: List["Content"] = Relationship(
@@ -81,6 +86,15 @@ class Genre(SQLModel, table=True):
 
 class Content(SQLModel, table=True):
     __tablename__ = "contents"
+    __table_args__ = (
+        # 삭제되지 않은 콘텐츠 최신순 목록 (partial index)
+        Index(
+            "ix_contents_created_at_active", "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # 목록 ETag 용 max(updated_at) (인덱스 끝 값만 읽음)
+        Index("ix_contents_updated_at", "updated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -108,6 +122,10 @@ class Content(SQLModel, table=True):
 
 class Review(SQLModel, table=True):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("ix_reviews_content_id_created_at", "content_id", "created_at"),
+        Index("ix_reviews_user_id_created_at", "user_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -133,6 +151,9 @@ class Review(SQLModel, table=True):
 
 class ReviewLike(SQLModel, table=True):
     __tablename__ = "review_likes"
+    __table_args__ = (
+        Index("ix_review_likes_review_id", "review_id"),
+    )
 
     user_id: int = Field(
         foreign_key="users.id",
@@ -154,6 +175,9 @@ class ReviewLike(SQLModel, table=True):
 
 class Bookmark(SQLModel, table=True):
     __tablename__ = "bookmarks"
+    __table_args__ = (
+        Index("ix_bookmarks_user_id_created_at", "user_id", "created_at"),
+    )
 
     user_id: int = Field(
         foreign_key="users.id",
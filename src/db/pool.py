@@ -0,0 +1,151 @@
+# 커넥션 풀 계측
+#
+# QueuePool 의 커넥션 획득(_do_get)에 걸린 시간을 측정하여
+# 대기 횟수/누적·최대 대기 시간/타임아웃 횟수를 집계합니다.
+# 풀이 가득 차 DB_POOL_SLOW_WAIT_MS 이상 기다렸거나 타임아웃이 나면
+# 대기 중이던 요청(route)과 함께 경고 로그를 남깁니다.
+# 획득부터 반납(_do_return_conn)까지의 점유 시간도 집계하며,
+# DB_POOL_SLOW_HOLD_MS 이상 점유한 요청은 경고 로그를 남깁니다.
+# 같은 값을 Prometheus 메트릭(/metrics)으로도 내보냅니다. (워커 간 합산은 src/core/metrics.py)
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core import metrics as prom
+from src.core.request_context import current_route
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_waits = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.holds = 0
+        self.slow_holds = 0
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            if timed_out:
+                self.timeouts += 1
+            elif waited * 1000 >= settings.DB_POOL_SLOW_WAIT_MS:
+                self.slow_waits += 1
+
+    def record_hold(self, held: float) -> None:
+        with self._lock:
+            self.holds += 1
+            self.hold_total += held
+            self.hold_max = max(self.hold_max, held)
+            if held * 1000 >= settings.DB_POOL_SLOW_HOLD_MS:
+                self.slow_holds += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "slow_waits": self.slow_waits,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "slow_holds": self.slow_holds,
+                "hold_avg_ms": round(self.hold_total / self.holds * 1000, 3) if self.holds else 0.0,
+                "hold_max_ms": round(self.hold_max * 1000, 3),
+            }
+
+
+class _InstrumentedMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics("db")
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            waited = time.perf_counter() - start
+            self.metrics.record(waited, timed_out=True)
+            prom.DB_POOL_TIMEOUTS.labels(self.metrics.name).inc()
+            logger.warning(
+                "DB pool exhausted (%s): timed out after %.0fms, route=%s, %s",
+                self.metrics.name, waited * 1000, current_route(), self.status(),
+            )
+            raise
+        waited = time.perf_counter() - start
+        self.metrics.record(waited)
+        prom.DB_POOL_WAIT.labels(self.metrics.name).observe(waited)
+        prom.DB_POOL_IN_USE.labels(self.metrics.name).inc()
+        if waited * 1000 >= settings.DB_POOL_SLOW_WAIT_MS:
+            logger.warning(
+                "DB pool exhausted (%s): waited %.0fms, route=%s, %s",
+                self.metrics.name, waited * 1000, current_route(), self.status(),
+            )
+        conn.info["checkout_at"] = time.perf_counter()
+        conn.info["checkout_route"] = current_route()
+        return conn
+
+    def _do_return_conn(self, record):
+        checkout_at = record.info.pop("checkout_at", None)
+        route = record.info.pop("checkout_route", None)
+        if checkout_at is not None:
+            held = time.perf_counter() - checkout_at
+            self.metrics.record_hold(held)
+            prom.DB_POOL_HOLD.labels(self.metrics.name).observe(held)
+            prom.DB_POOL_IN_USE.labels(self.metrics.name).dec()
+            if held * 1000 >= settings.DB_POOL_SLOW_HOLD_MS:
+                logger.warning(
+                    "DB connection held (%s): %.0fms, route=%s",
+                    self.metrics.name, held * 1000, route,
+                )
+        super()._do_return_conn(record)
+
+    def recreate(self):
+        # pre_ping/무효화 등으로 풀이 재생성되어도 같은 집계를 이어서 사용
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def label_pool(engine, name: str) -> None:
+    """로그/통계에서 엔진을 구분하기 위한 이름을 붙입니다."""
+    metrics = getattr(engine.pool, "metrics", None)
+    if metrics is not None:
+        metrics.name = name
+
+
+def pool_stats(engine) -> Dict[str, Any]:
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
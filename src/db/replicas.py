@@ -0,0 +1,186 @@
+# 읽기 전용 복제본(Read Replica) 라우팅
+#
+# - DATABASE_REPLICA_URLS 에 지정된 복제본으로 조회 전용 라우트(get_read_db)를 분산합니다.
+# - Read-your-writes: 사용자가 쓰기(커밋)를 하면 READ_YOUR_WRITES_SECONDS 동안
+#   그 사용자의 조회는 Primary 로 보내 복제 지연으로 방금 쓴 데이터가 안 보이는 문제를 막습니다.
+#   (Redis 키 recent_write:{user_id} 로 워커 간 공유, Redis 장애 시 프로세스 로컬 기록으로 폴백)
+# - 복제본 커넥션 획득에 실패하면 REPLICA_RETRY_SECONDS 동안 해당 복제본을 제외하고
+#   이번 요청은 Primary 로 처리합니다.
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.security import bearer_subject
+from src.db.pool import label_pool, pool_stats
+from src.db.session import AsyncReadSessionLocal, pool_options, async_database_url
+from src.deps.redis import get_redis_client
+
+
+class Replica:
+    def __init__(self, name: str, url: str):
+        self.name = name
+        options = pool_options(url, is_async=True)
+        if url.startswith("postgres"):
+            # 장애 복제본에 연결을 오래 기다리지 않도록 (asyncpg 기본값 60초)
+            options["connect_args"] = {
+                **options.get("connect_args", {}),
+                "timeout": settings.REPLICA_CONNECT_TIMEOUT,
+            }
+        self.engine = create_async_engine(
+            async_database_url(url),
+            pool_pre_ping=True,
+            **options,
+        )
+        label_pool(self.engine.sync_engine, name)
+        self.sessionmaker = async_sessionmaker(
+            self.engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+        self.down_until = 0.0
+
+    def healthy(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+    def mark_down(self, exc: Exception) -> None:
+        if self.healthy():
+            logger.warning(
+                "DB replica %s unavailable, using primary for %ss: %s",
+                self.name, settings.REPLICA_RETRY_SECONDS, exc,
+            )
+        self.down_until = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+
+
+def _build_replicas() -> List[Replica]:
+    urls = [u.strip() for u in settings.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+    return [Replica(f"replica{i}", url) for i, url in enumerate(urls)]
+
+
+replicas: List[Replica] = _build_replicas()
+_round_robin = itertools.cycle(range(len(replicas) or 1))
+
+
+# ==========================================
+# Read-your-writes
+# ==========================================
+
+_local_writes: Dict[str, float] = {}
+_local_lock = threading.Lock()
+_LOCAL_MAX_SIZE = 10000
+
+
+def _recent_write_key(user_id: str) -> str:
+    return f"recent_write:{user_id}"
+
+
+def mark_write(user_id: Optional[str]) -> None:
+    """사용자의 쓰기 직후 호출합니다. 복제본이 없으면 아무것도 하지 않습니다."""
+    if not replicas or not user_id:
+        return
+    window = settings.READ_YOUR_WRITES_SECONDS
+    with _local_lock:
+        if len(_local_writes) >= _LOCAL_MAX_SIZE:
+            now = time.monotonic()
+            for uid in [u for u, t in _local_writes.items() if t <= now]:
+                del _local_writes[uid]
+        _local_writes[user_id] = time.monotonic() + window
+    rds = get_redis_client()
+    if rds is None:
+        return
+    try:
+        rds.set(_recent_write_key(user_id), 1, px=int(window * 1000))
+    except Exception as e:
+        logger.warning("recent write mark failed (user=%s): %s", user_id, e)
+
+
+def _wrote_recently_local(user_id: str) -> bool:
+    with _local_lock:
+        return _local_writes.get(user_id, 0.0) > time.monotonic()
+
+
+def _wrote_recently_shared(user_id: str) -> bool:
+    # 다른 워커에서 쓴 경우 (동기 Redis 호출이므로 스레드풀에서 실행)
+    rds = get_redis_client()
+    if rds is None:
+        return False
+    try:
+        return bool(rds.exists(_recent_write_key(user_id)))
+    except Exception:
+        return False
+
+
+async def _wrote_recently(user_id: str) -> bool:
+    if _wrote_recently_local(user_id):
+        return True
+    return await run_in_threadpool(_wrote_recently_shared, user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session) -> None:
+    # get_db 가 요청의 Authorization 헤더를 session.info 에 남긴 경우에만 기록
+    authorization = session.info.get("request_authorization")
+    if authorization:
+        mark_write(bearer_subject(authorization))
+
+
+def track_writes(session: Session, request: Request) -> None:
+    """이 세션의 커밋을 요청 사용자의 쓰기로 기록하도록 표시합니다."""
+    if replicas:
+        session.info["request_authorization"] = request.headers.get("authorization")
+
+
+def request_user(request: Request) -> Optional[str]:
+    return bearer_subject(request.headers.get("authorization"))
+
+
+# ==========================================
+# Routing
+# ==========================================
+
+def _pick_replica() -> Optional[Replica]:
+    for _ in range(len(replicas)):
+        replica = replicas[next(_round_robin)]
+        if replica.healthy():
+            return replica
+    return None
+
+
+async def open_read_session(request: Request) -> AsyncSession:
+    """조회용 AsyncSession. 조건에 맞으면 복제본, 아니면 Primary."""
+    if not replicas:
+        return AsyncReadSessionLocal()
+    user_id = request_user(request)
+    if user_id and await _wrote_recently(user_id):
+        return AsyncReadSessionLocal()
+
+    replica = _pick_replica()
+    if replica is None:
+        return AsyncReadSessionLocal()
+    session = replica.sessionmaker()
+    try:
+        # 커넥션을 미리 확보하여(pre_ping 포함) 장애 복제본이면 여기서 Primary 로 전환
+        await session.connection()
+    except Exception as e:
+        replica.mark_down(e)
+        await session.close()
+        return AsyncReadSessionLocal()
+    return session
+
+
+def replica_stats() -> List[dict]:
+    return [
+        {
+            "name": r.name,
+            "status": "up" if r.healthy() else "down",
+            **pool_stats(r.engine.sync_engine),
+        }
+        for r in replicas
+    ]
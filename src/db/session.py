@@ -1,9 +1,87 @@
+from typing import Any, Dict
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from src.core.config import settings
+from src.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, label_pool
+
+# 동기 드라이버 URL -> 비동기 드라이버 URL
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL(psycopg2 등)을 같은 DB를 가리키는 비동기 드라이버 URL로 바꿉니다."""
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def pool_options(url: str, is_async: bool) -> Dict[str, Any]:
+    """
+    풀 크기/타임아웃 설정. SQLite 는 드라이버 기본 풀을 그대로 사용합니다.
+    statement_timeout 은 서버 측에서 적용되어 오래 걸리는 쿼리가 커넥션을 붙잡지 않게 합니다.
+    (앞의 요청이 커넥션을 반납하지 않으면 뒤의 요청은 DB_POOL_TIMEOUT 후 실패)
+    """
+    if url.startswith("sqlite"):
+        return {}
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+    timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout_ms and url.startswith("postgres"):
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout_ms)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout_ms}"}
+    return options
+
 
 # DB 연결 설정 (Engine 생성)
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
+    **pool_options(settings.DATABASE_URL, is_async=False),
     # echo=True  # 쿼리 로그를 보고 싶다면 주석 해제
-)
\ No newline at end of file
+)
+label_pool(engine, "sync")
+
+# 비동기 라우트용 엔진 (asyncpg). 요청이 DB 응답을 기다리는 동안 워커 스레드를 점유하지 않습니다.
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+    **pool_options(settings.DATABASE_URL, is_async=True),
+)
+label_pool(async_engine.sync_engine, "async")
+
+# 커밋 후에도 응답 직렬화에서 속성을 읽을 수 있도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+def read_only(bind):
+    """
+    조회 전용 트랜잭션으로 실행하는 엔진 뷰(같은 풀 공유).
+    Postgres 는 BEGIN READ ONLY 로 시작하여 실수로 인한 쓰기를 막고,
+    반납 시 드라이버가 원래 모드로 되돌립니다. 그 외 DB 는 그대로 사용합니다.
+    """
+    if bind.dialect.name != "postgresql":
+        return bind
+    return bind.execution_options(postgresql_readonly=True)
+
+
+# GET 요청용: 쓰기가 없으므로 autoflush/커밋 시 만료 처리를 하지 않음
+read_only_engine = read_only(engine)
+AsyncReadSessionLocal = async_sessionmaker(
+    read_only(async_engine), class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
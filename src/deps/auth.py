@@ -2,18 +2,53 @@ from typing import Optional
 
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from redis import Redis
 from sqlmodel import Session, select
 
-from src.deps.db import get_db
+from src.deps.db import get_db, release_connection
+from src.deps.redis import get_redis
+from src.core import revocation, user_cache
+from src.core.config import settings
+from src.core.logging import logger
 from src.core.security import decode_token
+from src.core.user_cache import AuthUser
 from src.db.models import User, UserRole, UserStatus
 
 bearer = HTTPBearer(auto_error=False)
 
+
+def _principal_from_claims(
+    rds: Optional[Redis], user_id: int, payload: dict
+) -> Optional[AuthUser]:
+    """
+    AUTH_STATELESS 모드: 토큰 클레임과 Redis 폐기 목록만으로 AuthUser 를 만듭니다.
+    클레임이 없는 구 토큰이거나 Redis를 쓸 수 없으면 None (캐시/DB 경로로 폴백).
+    """
+    if not settings.AUTH_STATELESS or rds is None:
+        return None
+    if "role" not in payload or "status" not in payload:
+        return None
+    try:
+        revoked = revocation.is_revoked(rds, user_id, payload.get("iat", 0))
+    except Exception as e:
+        logger.warning("revocation check failed (user=%s): %s", user_id, e)
+        return None
+    if revoked:
+        raise HTTPException(status_code=401, detail="Token revoked")
+    return AuthUser(id=user_id, role=payload["role"], status=payload["status"])
+
+
 def get_current_user(
     creds: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
     db: Session = Depends(get_db),
-) -> User:
+    rds: Optional[Redis] = Depends(get_redis),
+) -> AuthUser:
+    """
+    인증된 사용자의 id/role/status 만 담은 AuthUser 를 반환합니다.
+    AUTH_STATELESS 모드에서는 토큰 클레임을, 그 외에는 캐시(user_cache)를 우선 사용하여
+    DB 조회를 생략합니다.
+    전체 User 엔티티가 필요한 경우 get_current_db_user 를 사용하세요.
+    """
     if creds is None:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
@@ -29,18 +64,40 @@ def get_current_user(
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.exec(select(User).where(User.id == int(user_id))).first()
-    if not user or user.deleted_at is not None:
+    principal = _principal_from_claims(rds, int(user_id), payload)
+    if principal is None:
+        principal = user_cache.get(rds, int(user_id))
+    if principal is None:
+        user = db.exec(select(User).where(User.id == int(user_id))).first()
+        if not user:
+            raise HTTPException(status_code=401, detail="User not found")
+        principal = AuthUser.from_user(user)
+        user_cache.put(rds, principal)
+        # 라우트 처리 동안 인증 조회용 커넥션을 붙잡지 않도록 반납
+        release_connection(db)
+
+    if principal.deleted_at is not None:
         raise HTTPException(status_code=401, detail="User not found")
 
-    if user.status in (UserStatus.BLOCKED, UserStatus.DELETED):
+    if principal.status in (UserStatus.BLOCKED, UserStatus.DELETED):
         raise HTTPException(status_code=403, detail="User blocked/deleted")
 
+    return principal
+
+
+# 프로필 조회/수정처럼 User 엔티티 전체가 필요한 경우
+def get_current_db_user(
+    principal: AuthUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> User:
+    user = db.get(User, principal.id)
+    if not user or user.deleted_at is not None:
+        raise HTTPException(status_code=401, detail="User not found")
     return user
 
 
 # Admin 권한이 필요한 경우(RBAC)
-def require_admin(user: User = Depends(get_current_user)) -> User:
+def require_admin(user: AuthUser = Depends(get_current_user)) -> AuthUser:
     if user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Admin only")
     return user
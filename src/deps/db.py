@@ -1,15 +1,61 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from fastapi import Request
 from sqlmodel import Session
-from src.db.session import engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.db.replicas import open_read_session, track_writes
+from src.db.session import AsyncSessionLocal, engine, read_only_engine
 
-def get_db() -> Generator[Session, None, None]:
+# 쓰기가 없는 요청 (조회 전용 트랜잭션으로 실행)
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     FastAPI Dependency:
     요청이 들어올 때 DB 세션을 생성하고, 응답 후 닫습니다.
     (with 문 대신 try-finally를 사용하여 예외 전파 문제를 방지합니다)
+    세션 생성만으로는 커넥션을 잡지 않으며, 첫 쿼리 시점에 풀에서 가져옵니다.
+    GET 요청은 조회 전용 트랜잭션 + autoflush/expire_on_commit 없이 실행합니다.
+    """
+    if request.method in READ_ONLY_METHODS:
+        session = Session(read_only_engine, autoflush=False, expire_on_commit=False)
+    else:
+        session = Session(engine)
+    # 복제본 사용 시, 커밋하면 이 사용자의 다음 조회를 잠시 Primary 로 보냄
+    track_writes(session, request)
+    try:
+        yield session
+    finally:
+        session.close()
+
+def release_connection(session: Session) -> None:
+    """
+    조회를 마친 뒤 트랜잭션을 끝내 커넥션을 풀에 먼저 반납합니다.
+    (세션은 닫히지 않으며 다음 쿼리에서 커넥션을 다시 가져옴)
+    반영되지 않은 변경이 있으면 아무것도 하지 않습니다.
+    """
+    if session.in_transaction() and not (session.new or session.dirty or session.deleted):
+        session.rollback()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI Dependency (async 라우트용):
+    AsyncSession 을 생성하고, 응답 후 닫습니다.
+    """
+    session = AsyncSessionLocal()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI Dependency (조회 전용 async 라우트용):
+    DATABASE_REPLICA_URLS 가 설정되어 있으면 복제본 세션을, 아니면 Primary 세션을 제공합니다.
+    최근에 쓰기를 한 사용자나 복제본 장애 시에는 Primary 를 사용합니다.
     """
-    session = Session(engine)
+    session = await open_read_session(request)
     try:
         yield session
     finally:
-        session.close()
\ No newline at end of file
+        await session.close()
@@ -1,27 +1,152 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, Iterator, Optional
+
 import redis
-from typing import Generator, Optional
+
 from src.core.config import settings
+from src.core.logging import logger
+from src.core import metrics as prom
+from src.core import tracing
+
+# 워커 프로세스당 하나의 커넥션 풀 (앱 lifespan 에서 생성/종료)
+_pool: Optional[redis.BlockingConnectionPool] = None
+_client: Optional[redis.Redis] = None
+_lock = threading.Lock()
+
+# Redis 장애 시 빠른 실패: 연결 오류가 나면 REDIS_RETRY_SECONDS 동안은
+# 연결을 시도하지 않고 None 을 반환하여 호출부의 폴백 경로를 바로 타게 합니다.
+_down_until = 0.0
+
+
+def _mark_down(exc: Exception) -> None:
+    global _down_until
+    if _down_until < time.monotonic():
+        logger.warning("Redis unavailable, skipping for %ss: %s", settings.REDIS_RETRY_SECONDS, exc)
+    _down_until = time.monotonic() + settings.REDIS_RETRY_SECONDS
 
-def get_redis() -> Generator[Optional[redis.Redis], None, None]:
-    client = None
-    try:
-        # 1. Redis 연결 생성 시도
-        pool = redis.ConnectionPool.from_url(
-            settings.REDIS_URL, 
-            decode_responses=True
-        )
-        client = redis.Redis(connection_pool=pool)
-        # client.ping() # 연결 확인 필요 시 주석 해제
-    except Exception as e:
-        # 연결 단계 에러만 출력하고 None 반환
-        print(f"Redis connection failed: {e}")
-        yield None
-        return
 
-    # 2. 클라이언트 제공 (여기서는 예외를 잡지 않음)
+class RedisPoolExhausted(redis.ConnectionError):
+    """
+    REDIS_POOL_TIMEOUT 동안 풀에서 커넥션을 얻지 못함 (모든 커넥션 사용 중).
+    Redis 장애가 아니라 부하로 인한 해당 호출만의 실패이므로 장애로 표시하지 않습니다.
+    (ConnectionError 하위 클래스라 호출부의 기존 예외 처리/폴백은 그대로 동작)
+    """
+
+
+class _BlockingPool(redis.BlockingConnectionPool):
+    def get_connection(self, *args, **kwargs):
+        try:
+            return super().get_connection(*args, **kwargs)
+        except redis.ConnectionError as e:
+            # 풀 대기 시간 초과는 내부 큐의 Empty 를 처리하는 중에 발생
+            if isinstance(e.__context__, queue.Empty):
+                raise RedisPoolExhausted(str(e)) from e
+            raise
+
+
+@contextmanager
+def _track(command: str) -> Iterator[None]:
+    """명령(또는 파이프라인) 한 번의 지연 시간/오류 메트릭, 트레이싱 span, 장애 감지."""
+    start = time.perf_counter()
     try:
-        yield client
+        with tracing.span(f"redis {command}", kind="client", **{"db.system": "redis"}):
+            yield
+    except RedisPoolExhausted:
+        prom.REDIS_ERRORS.labels(command).inc()
+        raise
+    except (redis.ConnectionError, redis.TimeoutError) as e:
+        _mark_down(e)
+        prom.REDIS_ERRORS.labels(command).inc()
+        raise
+    except redis.RedisError:
+        prom.REDIS_ERRORS.labels(command).inc()
+        raise
     finally:
-        # 3. 리소스 정리
-        if client:
-            client.close()
\ No newline at end of file
+        prom.REDIS_LATENCY.labels(command).observe(time.perf_counter() - start)
+
+
+class _Pipeline(redis.client.Pipeline):
+    """파이프라인은 명령을 모아 execute() 에서 한 번에 보내므로 execute 단위로 기록합니다."""
+
+    def execute(self, raise_on_error: bool = True):
+        with _track("MULTI" if self.transaction else "PIPELINE"):
+            return super().execute(raise_on_error)
+
+
+class _Redis(redis.Redis):
+    """연결/타임아웃 오류를 감지하여 장애 상태를 기록하는 클라이언트. (명령별 지연 시간 메트릭 포함)"""
+
+    def execute_command(self, *args, **options):
+        with _track(str(args[0]).upper() if args else "-"):
+            return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint=None) -> _Pipeline:
+        return _Pipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+def init_redis_pool() -> redis.Redis:
+    global _pool, _client
+    with _lock:
+        if _client is None:
+            _pool = _BlockingPool.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            )
+            _client = _Redis(connection_pool=_pool)
+        return _client
+
+
+def close_redis_pool() -> None:
+    global _pool, _client
+    with _lock:
+        if _pool is not None:
+            _pool.disconnect()
+        _pool = None
+        _client = None
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """공유 클라이언트를 반환합니다. 장애로 표시된 동안에는 None."""
+    if _down_until > time.monotonic():
+        return None
+    try:
+        # lifespan 없이 사용되는 경우(스크립트 등)를 위해 지연 생성
+        return _client or init_redis_pool()
+    except Exception as e:
+        _mark_down(e)
+        return None
+
+
+def redis_pool_stats() -> Dict[str, Any]:
+    stats: Dict[str, Any] = {
+        "status": "down" if _down_until > time.monotonic() else "up",
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "created": 0,
+        "in_use": 0,
+        "idle": 0,
+    }
+    pool = _pool
+    if pool is None:
+        stats["status"] = "not_initialized"
+        return stats
+    created = len(getattr(pool, "_connections", []))
+    idle = len(pool._get_free_connections()) if hasattr(pool, "_get_free_connections") else 0
+    stats.update(created=created, in_use=created - idle, idle=idle)
+    return stats
+
+
+def get_redis() -> Generator[Optional[redis.Redis], None, None]:
+    """
+    FastAPI Dependency:
+    프로세스 공유 커넥션 풀의 클라이언트를 제공합니다. (요청마다 연결을 만들지 않음)
+    Redis 를 사용할 수 없으면 None 을 제공하며, 호출부는 None 일 때의 폴백을 처리합니다.
+    """
+    yield get_redis_client()
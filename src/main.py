@@ -1,14 +1,15 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 
 from src.core.config import settings
 from src.api.routes import all_routers
-from src.core.logging import setup_logging
-from src.middlewares.logging import logging_middleware
+from src.core.logging import setup_logging, shutdown_logging
+from src.core.metrics import mark_process_dead
+from src.core.tracing import shutdown_tracing
+from src.middlewares.compression import CompressionMiddleware
+from src.middlewares.logging import LoggingMiddleware
 from fastapi import HTTPException
 from fastapi.exceptions import RequestValidationError
 from src.core.errors import (
@@ -16,22 +17,39 @@ from src.core.errors import (
     unhandled_exception_handler,
     validation_exception_handler,
     rate_limit_handler,
+    password_hasher_busy_handler,
 )
+from src.core.rate_limit import RateLimitExceeded, enforce_rate_limit
+from src.core.security import PasswordHasherBusy, shutdown_password_hasher
+from src.core.social_auth import verifier as social_verifier
+from src.core.tmdb import close_tmdb_client, init_tmdb_client
+from src.deps.redis import init_redis_pool, close_redis_pool
 
-# 1. Rate Limiter 설정 (IP 기준, 분당 100회 제한)
-limiter = Limiter(key_func=get_remote_address, default_limits=["100/minute"])
-
-app = FastAPI(title="Movie API", version=settings.APP_VERSION)
-# 2. State에 limiter 저장 (라우터에서 사용 가능하도록)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.add_middleware(SlowAPIMiddleware)
-
-@app.on_event("startup")
-def on_startup():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 프로세스 단위 공유 자원 생성/정리
     setup_logging("INFO")
+    init_redis_pool()
+    init_tmdb_client()
+    social_verifier.start()
+    yield
+    social_verifier.stop()
+    await close_tmdb_client()
+    shutdown_password_hasher()
+    close_redis_pool()
+    shutdown_tracing()
+    mark_process_dead()
+    shutdown_logging()
+
+# 1. Rate Limit: 모든 라우트에 Redis 기반 분산 제한 적용 (정책은 src/core/rate_limit.py)
+app = FastAPI(
+    title="Movie API",
+    version=settings.APP_VERSION,
+    lifespan=lifespan,
+    dependencies=[Depends(enforce_rate_limit)],
+)
 
-# 3. CORS 설정 (배포 주소 및 주요 로컬 환경 명시)
+# 2. CORS 설정 (배포 주소 및 주요 로컬 환경 명시)
 origins = [
     "http://113.198.66.75:10093",  # [중요] 실제 배포 주소
     "http://localhost",             # 로컬 (기본 포트)
@@ -49,14 +67,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],        # 모든 HTTP Method 허용 (GET, POST, etc.)
     allow_headers=["*"],        # 모든 Header 허용
+    expose_headers=["X-Request-ID"],  # 브라우저에서 오류 문의 시 request id 확인용
+)
+
+# 3. 응답 압축 (gzip / brotli)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
 )
 
-app.middleware("http")(logging_middleware)
+# 4. 요청 로그 / Server-Timing / 메트릭 / request id / 트레이싱 (가장 바깥에서 전체 시간 측정)
+app.add_middleware(LoggingMiddleware)
 
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
+app.add_exception_handler(PasswordHasherBusy, password_hasher_busy_handler)
 
 for r in all_routers:
     app.include_router(r)
\ No newline at end of file
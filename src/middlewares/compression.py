@@ -0,0 +1,182 @@
+# 응답 압축 미들웨어 (순수 ASGI)
+#
+# Accept-Encoding 에 따라 br(brotli 패키지가 설치된 경우) 또는 gzip 으로 압축합니다.
+# - COMPRESSION_MIN_SIZE 보다 작은 응답, JSON/텍스트가 아닌 응답은 그대로 보냄
+# - 이미 Content-Encoding 이 있는 응답, 스트리밍 응답(본문이 여러 조각: CSV 내보내기 등)은
+#   버퍼링하지 않고 그대로 흘려보냄
+# - 라우트(경로 템플릿)별 압축 전/후 바이트를 집계하여 /health 에서 압축률을 확인
+import gzip
+import threading
+from typing import Any, Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (pip install brotli)
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+
+def _accepted_encodings(accept_encoding: str) -> set:
+    encodings = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        encodings.add(name.strip().lower())
+    return encodings
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = _accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+# ==========================================
+# Metrics
+# ==========================================
+
+class _CompressionStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, list] = {}
+
+    def record(self, route: str, encoding: str, original: int, compressed: int) -> None:
+        key = f"{route} {encoding}"
+        with self._lock:
+            stats = self._routes.setdefault(key, [0, 0, 0])
+            stats[0] += 1
+            stats[1] += original
+            stats[2] += compressed
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                key: {
+                    "responses": count,
+                    "bytes_in": original,
+                    "bytes_out": compressed,
+                    "ratio": round(compressed / original, 3) if original else 0.0,
+                }
+                for key, (count, original, compressed) in sorted(self._routes.items())
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+compression_stats = _CompressionStats()
+
+
+# ==========================================
+# Middleware
+# ==========================================
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, scope, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, encoding: str, send: Send):
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self._send = send
+        self.start: Optional[Message] = None
+        self.passthrough = False
+
+    def _skip(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return True
+        content_type = headers.get("content-type", "")
+        return not content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            # 본문을 보기 전까지 헤더 전송을 미룸 (압축 시 Content-Length 가 바뀜)
+            self.start = message
+            if self._skip(Headers(raw=message["headers"])):
+                self.passthrough = True
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        if message.get("more_body", False) or len(body) < self.middleware.minimum_size:
+            # 스트리밍 응답은 조각마다 보내야 하므로 압축하지 않고 그대로 전달
+            self.passthrough = True
+            await self._send(self.start)
+            await self._send(message)
+            return
+
+        compressed = self.middleware.compress(self.encoding, body)
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # 압축본은 원본과 바이트가 다르므로 약한 ETag 로 표시 (If-None-Match 는 약한 비교라 304 는 그대로 동작)
+            headers["ETag"] = "W/" + etag
+        route = self.scope.get("route")
+        compression_stats.record(
+            # API 라우트가 아닌 경로(docs, 404 등)는 한 항목으로 묶어 집계 항목 수를 라우트 수로 제한
+            f"{self.scope['method']} {getattr(route, 'path', 'other')}",
+            self.encoding, len(body), len(compressed),
+        )
+        await self._send(self.start)
+        await self._send({"type": "http.response.body", "body": compressed})
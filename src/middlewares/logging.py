@@ -1,19 +1,124 @@
-#요청 및 응답 시간을 기록하는 미들웨어
-
+#요청 및 응답 시간을 기록하는 미들웨어 (순수 ASGI)
+#
+# 요청 하나에 대해 한 곳에서 처리합니다.
+# - request id: X-Request-ID 를 이어 받거나 새로 만들어 로그 컨텍스트와 응답 헤더에 기록
+# - 접근 로그, Server-Timing 헤더(DB 시간/앱 시간), N+1 의심 경고
+# - Prometheus 메트릭(라우트 템플릿별), 트레이싱 루트 span
+# - 처리되지 않은 예외는 여기서 500 에러 응답으로 바꿔 위 헤더가 붙도록 함
+# BaseHTTPMiddleware 와 달리 요청마다 태스크/메모리 스트림을 만들지 않고,
+# 응답 본문을 그대로 흘려보내므로 스트리밍 응답(CSV 내보내기 등)도 조각 단위로 전달됩니다.
+import logging
+import re
 import time
-from fastapi import Request
-from src.core.logging import logger
-
-async def logging_middleware(request: Request, call_next):
-    start = time.perf_counter()
-    try:
-        response = await call_next(request)
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        logger.info("%s %s -> %s (%.1fms)",
-                    request.method, request.url.path, response.status_code, elapsed_ms)
-        return response
-    except Exception:
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        # 스택트레이스 포함 (민감정보 제외)
-        logger.exception("%s %s -> EXCEPTION (%.1fms)", request.method, request.url.path, elapsed_ms)
-        raise
\ No newline at end of file
+import uuid
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.errors import internal_error_response
+from src.core.logging import access_logger, logger
+from src.core import metrics as prom
+from src.core import tracing
+from src.core.request_context import reset_request_id, reset_route, set_request_id, set_route
+from src.db import instrumentation as sql_stats
+
+# 외부에서 받은 request id 는 로그/헤더에 그대로 쓰이므로 형식과 길이를 제한
+_REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._:\-]{1,128}$")
+
+
+def _server_timing(stats: sql_stats.QueryStats, elapsed_ms: float) -> str:
+    return (
+        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", '
+        f"app;dur={elapsed_ms:.1f}"
+    )
+
+
+def _warn_repeated(method: str, path: str, stats: sql_stats.QueryStats) -> None:
+    # SQL_DEBUG_N_PLUS_ONE 모드에서만 statements 가 수집됨
+    for statement, count in stats.repeated(settings.SQL_REPEAT_THRESHOLD):
+        logger.warning("N+1 suspected %s %s: %dx %s",
+                       method, path, count, " ".join(statement.split())[:200])
+
+
+def _request_headers(scope: Scope) -> tuple:
+    """(request id, traceparent). 필요한 두 헤더만 raw 헤더에서 한 번에 찾음."""
+    request_id = traceparent = None
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            request_id = value.decode("latin-1")
+        elif name == b"traceparent":
+            traceparent = value.decode("latin-1")
+    if request_id is None or not _REQUEST_ID_RE.match(request_id):
+        request_id = uuid.uuid4().hex
+    return request_id, traceparent
+
+
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        method, path = scope["method"], scope["path"]
+        request_id, traceparent = _request_headers(scope)
+        # DB 풀 고갈 로그 등에서 대기 중인 요청을 알 수 있도록 기록
+        route_token = set_route(method, path)
+        request_id_token = set_request_id(request_id)
+        stats, stats_token = sql_stats.start_request()
+        in_progress = prom.HTTP_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        span, span_token = tracing.start_request(method, path, traceparent)
+        status = 500  # 응답 시작 전에 예외가 나면 500 으로 집계
+        started = False
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status, started
+            if message["type"] == "http.response.start":
+                started = True
+                status = message["status"]
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"server-timing", _server_timing(stats, elapsed_ms).encode("latin-1")),
+                    (b"x-request-id", request_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        except Exception:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            # 스택트레이스는 바깥의 unhandled_exception_handler 가 남기므로 여기서는 요청 요약만
+            access_logger.warning("%s %s -> EXCEPTION (%.1fms, db %d queries %.1fms)",
+                                  method, path, elapsed_ms, stats.count, stats.total_ms)
+            app = scope.get("app")
+            if not started and not getattr(app, "debug", False):
+                # 바깥의 ServerErrorMiddleware 가 만드는 500 에는 헤더를 붙일 수 없으므로 먼저 응답.
+                # 예외는 그대로 올려 보내며, 응답이 시작된 것을 본 ServerErrorMiddleware 는
+                # 핸들러만 실행(로그)하고 응답을 다시 보내지 않습니다. (debug 모드는 트레이스백 페이지)
+                await internal_error_response(Request(scope))(scope, receive, send_with_headers)
+            raise
+        else:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            # 5xx 는 접근 로그 샘플링과 무관하게 남도록 WARNING
+            access_logger.log(
+                logging.WARNING if status >= 500 else logging.INFO,
+                "%s %s -> %s (%.1fms, db %d queries %.1fms)%s",
+                method, path, status, elapsed_ms,
+                stats.count, stats.total_ms, f" trace={span.trace_id}" if span else "",
+            )
+            _warn_repeated(method, path, stats)
+        finally:
+            # 라우팅 후 scope 에 기록된 경로 템플릿으로 집계 (/contents/{content_id})
+            route = prom.route_label(scope)
+            prom.observe_request(method, route, status, time.perf_counter() - start)
+            tracing.end_request(span, span_token, None if route == prom.OTHER_ROUTE else route, status)
+            in_progress.dec()
+            sql_stats.end_request(stats_token)
+            reset_request_id(request_id_token)
+            reset_route(route_token)
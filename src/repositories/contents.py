@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import select as select_rows
 from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.db.models import Content, ContentGenreLink, Genre, Review
 
@@ -36,18 +38,37 @@ def set_content_genres(db: Session, content_id: int, genre_ids: List[int]) -> No
     )
     for gid in genre_ids:
         db.add(ContentGenreLink(content_id=content_id, genre_id=gid))
+    # 장르 구성도 응답에 포함되므로 버전(updated_at)을 올림
+    db.exec(
+        Content.__table__.update()
+        .where(Content.id == content_id)
+        .values(updated_at=datetime.utcnow())
+    )
     db.commit()
 
 
-def list_contents(
-    db: Session,
-    q: Optional[str],
-    genre_id: Optional[int],
-    sort: str,
-    page: int,
-    size: int,
-) -> Tuple[List[Content], int]:
-    stmt = select(Content).where(Content.deleted_at.is_(None))
+# 응답(ContentBase)에 쓰이는 컬럼
+CONTENT_COLUMNS = (
+    "id", "tmdb_id", "title", "release_date", "runtime_minutes",
+    "created_at", "updated_at", "deleted_at",
+)
+
+
+def content_columns(names: Iterable[str]) -> list:
+    """요청된 필드에 해당하는 컬럼 목록. 장르 매핑을 위해 id 는 항상 포함합니다."""
+    names = set(names) | {"id"}
+    return [getattr(Content, name) for name in CONTENT_COLUMNS if name in names]
+
+
+def _select_content(columns: Optional[list]):
+    # 컬럼이 하나여도 스칼라가 아닌 Row 로 받도록 sqlalchemy select 사용
+    return select_rows(*columns) if columns else select(Content)
+
+
+def _list_contents_stmt(
+    q: Optional[str], genre_id: Optional[int], sort: str, columns: Optional[list] = None
+):
+    stmt = _select_content(columns).where(Content.deleted_at.is_(None))
     if q:
         stmt = stmt.where(Content.title.ilike(f"%{q}%"))
     if genre_id:
@@ -59,7 +80,19 @@ def list_contents(
         stmt = stmt.order_by(Content.created_at.asc())
     else:
         stmt = stmt.order_by(Content.id.desc())
+    return stmt
+
 
+def list_contents(
+    db: Session,
+    q: Optional[str],
+    genre_id: Optional[int],
+    sort: str,
+    page: int,
+    size: int,
+    columns: Optional[list] = None,
+) -> Tuple[List[Content], int]:
+    stmt = _list_contents_stmt(q, genre_id, sort, columns)
     total = db.exec(select(func.count()).select_from(stmt.subquery())).one()
     items = list(db.exec(stmt.offset((page - 1) * size).limit(size)).all())
     return items, int(total)
@@ -77,23 +110,53 @@ def get_content_by_tmdb_id(db: Session, tmdb_id: int) -> Content | None:
     ).first()
 
 
-def get_content_genres(db: Session, content_id: int) -> List[Genre]:
-    stmt = (
-        select(Genre)
+def _catalog_version_stmt():
+    # 목록 ETag: 콘텐츠 생성/수정/삭제(soft)와 장르 변경이 모두 updated_at 으로 반영됨
+    return select_rows(
+        select_rows(func.max(Content.updated_at)).scalar_subquery(),
+        select_rows(func.max(Genre.updated_at)).scalar_subquery(),
+    )
+
+
+def _content_version_stmt(content_id: int):
+    return select_rows(
+        Content.updated_at,
+        select_rows(func.max(Genre.updated_at)).scalar_subquery(),
+    ).where(Content.id == content_id, Content.deleted_at.is_(None))
+
+
+def _content_genres_stmt(content_ids: List[int]):
+    # 응답에 필요한 컬럼만 조회 (Genre 엔티티를 만들지 않음)
+    return (
+        select(ContentGenreLink.content_id, Genre.id, Genre.name)
         .join(ContentGenreLink, ContentGenreLink.genre_id == Genre.id)
         .where(
-            ContentGenreLink.content_id == content_id,
+            ContentGenreLink.content_id.in_(content_ids),
             Genre.deleted_at.is_(None),
         )
+        .order_by(ContentGenreLink.content_id, Genre.id)
     )
-    return list(db.exec(stmt).all())
+
+
+def _group_genres(rows) -> Dict[int, List[Tuple[int, str]]]:
+    grouped: Dict[int, List[Tuple[int, str]]] = {}
+    for content_id, genre_id, name in rows:
+        grouped.setdefault(content_id, []).append((genre_id, name))
+    return grouped
+
+
+def get_content_genres(db: Session, content_ids: List[int]) -> Dict[int, List[Tuple[int, str]]]:
+    """콘텐츠 id 목록의 장르를 한 번의 쿼리로 조회합니다. {content_id: [(genre_id, name), ...]}"""
+    if not content_ids:
+        return {}
+    return _group_genres(db.exec(_content_genres_stmt(content_ids)).all())
 
 def get_content_by_tmdb_id_with_deleted(db: Session, tmdb_id: int) -> Content | None:
     return db.exec(
         select(Content).where(Content.tmdb_id == tmdb_id)
     ).first()
     
-def top_rated(db: Session, limit: int = 10):
+def _top_rated_stmt(limit: int):
     avg_rating = func.avg(Review.rating).label("avg_rating")
     review_count = func.count(Review.id).label("review_count")
 
@@ -105,4 +168,59 @@ def top_rated(db: Session, limit: int = 10):
         .order_by(avg_rating.desc(), review_count.desc())
         .limit(limit)
     )
-    return db.exec(stmt).all()
+    return stmt
+
+
+def top_rated(db: Session, limit: int = 10):
+    return db.exec(_top_rated_stmt(limit)).all()
+
+
+# ==========================================
+# Async 버전 (조회 전용 라우트에서 사용)
+# ==========================================
+
+async def list_contents_async(
+    db: AsyncSession,
+    q: Optional[str],
+    genre_id: Optional[int],
+    sort: str,
+    page: int,
+    size: int,
+    columns: Optional[list] = None,
+) -> Tuple[List[Content], int]:
+    """columns 를 주면 Content 대신 해당 컬럼만 담은 Row 목록을 반환합니다."""
+    stmt = _list_contents_stmt(q, genre_id, sort, columns)
+    total = (await db.exec(select(func.count()).select_from(stmt.subquery()))).one()
+    items = list((await db.exec(stmt.offset((page - 1) * size).limit(size))).all())
+    return items, int(total)
+
+
+async def get_content_async(
+    db: AsyncSession, content_id: int, columns: Optional[list] = None
+) -> Content | None:
+    return (await db.exec(
+        _select_content(columns).where(Content.id == content_id, Content.deleted_at.is_(None))
+    )).first()
+
+
+async def get_content_genres_async(
+    db: AsyncSession, content_ids: List[int]
+) -> Dict[int, List[Tuple[int, str]]]:
+    if not content_ids:
+        return {}
+    return _group_genres((await db.exec(_content_genres_stmt(content_ids))).all())
+
+
+async def top_rated_async(db: AsyncSession, limit: int = 10):
+    return (await db.exec(_top_rated_stmt(limit))).all()
+
+
+async def catalog_version_async(db: AsyncSession) -> Tuple:
+    """(콘텐츠 max(updated_at), 장르 max(updated_at))"""
+    return tuple((await db.exec(_catalog_version_stmt())).one())
+
+
+async def content_version_async(db: AsyncSession, content_id: int) -> Optional[Tuple]:
+    """(콘텐츠 updated_at, 장르 max(updated_at)). 없거나 삭제된 콘텐츠면 None."""
+    row = (await db.exec(_content_version_stmt(content_id))).first()
+    return tuple(row) if row else None
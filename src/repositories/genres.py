@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Iterable, List, Sequence, Optional
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from src.db.models import Genre
 from src.schemas.genres import GenreCreate, GenreUpdate
@@ -16,10 +16,12 @@ def create_genre(db: Session, genre_in: GenreCreate) -> Genre:
     if existing:
         raise ValueError(f"이미 존재하는 장르입니다. (TMDB ID: {genre_in.tmdb_genre_id})")
 
+    now = datetime.utcnow()
     genre = Genre(
         name=genre_in.name,
         tmdb_genre_id=genre_in.tmdb_genre_id,
-        created_at=datetime.utcnow()
+        created_at=now,
+        updated_at=now,
     )
     db.add(genre)
     db.commit()
@@ -40,6 +42,7 @@ def update_genre(db: Session, genre_id: int, genre_in: GenreUpdate) -> Genre:
 
     genre.name = genre_in.name
     genre.tmdb_genre_id = genre_in.tmdb_genre_id
+    genre.updated_at = datetime.utcnow()
     
     db.add(genre)
     db.commit()
@@ -50,7 +53,7 @@ def update_genre(db: Session, genre_id: int, genre_in: GenreUpdate) -> Genre:
 def delete_genre(db: Session, genre_id: int) -> None:
     genre = get_genre(db, genre_id)
     if genre:
-        genre.deleted_at = datetime.utcnow()
+        genre.deleted_at = genre.updated_at = datetime.utcnow()
         db.add(genre)
         db.commit()
 
@@ -76,10 +79,13 @@ def upsert_genres_from_tmdb(
         name = tmdb_genre["name"]
         if gid in current:
             genre = current[gid]
-            genre.name = name
-            genre.deleted_at = None
+            # 바뀐 경우에만 updated_at 갱신 (동기화마다 ETag 가 무효화되지 않도록)
+            if genre.name != name or genre.deleted_at is not None:
+                genre.name = name
+                genre.deleted_at = None
+                genre.updated_at = now
         else:
-            genre = Genre(tmdb_genre_id=gid, name=name, created_at=now)
+            genre = Genre(tmdb_genre_id=gid, name=name, created_at=now, updated_at=now)
         db.add(genre)
         db.flush()
         result.append(genre)
@@ -102,11 +108,16 @@ def soft_delete_missing(db: Session, tmdb_ids: Sequence[int]) -> None:
             )
         ).all()
     for genre in stale:
-        genre.deleted_at = now
+        genre.deleted_at = genre.updated_at = now
         db.add(genre)
     if stale:
         db.commit()
 
 
 def list_active_genres(db: Session) -> List[Genre]:
-    return list(db.exec(select(Genre).where(Genre.deleted_at.is_(None))).all())
\ No newline at end of file
+    return list(db.exec(select(Genre).where(Genre.deleted_at.is_(None))).all())
+
+
+def genres_version(db: Session) -> Optional[datetime]:
+    # 장르 목록 ETag 용 (생성/수정/삭제 모두 updated_at 을 갱신)
+    return db.exec(select(func.max(Genre.updated_at))).one()
\ No newline at end of file
@@ -11,4 +11,11 @@ def create_user(db: Session, user: User) -> User:
     db.add(user)
     db.commit()
     db.refresh(user)
-    return user
\ No newline at end of file
+    return user
+
+def update_password_hash(db: Session, user: User, password_hash: str) -> User:
+    user.password_hash = password_hash
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
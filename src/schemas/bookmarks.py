@@ -20,3 +20,12 @@ class BookmarkListResponse(BaseModel):
     totalElements: int
     totalPages: int
     sort: str
+
+
+class BookmarkStatusItem(BaseModel):
+    content_id: int
+    bookmarked: bool
+
+
+class BookmarkStatusResponse(BaseModel):
+    items: list[BookmarkStatusItem]
@@ -1,22 +1,44 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+import fakeredis
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 
 from src.main import app
-from src.deps.db import get_db
+from src.db.session import async_database_url
+from src.deps.db import get_async_db, get_db, get_read_db
 from src.deps.redis import get_redis
+from src.core import user_cache
 from src.db.models import User, UserRole, UserStatus, Content, Genre
 from src.core.security import hash_password, create_token
 
-# 테스트용 인메모리 SQLite DB
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# 테스트용 SQLite DB
+# 동기 세션과 async 라우트의 AsyncSession(aiosqlite)이 같은 데이터를 보도록 임시 파일을 사용합니다.
+_fd, TEST_DB_PATH = tempfile.mkstemp(suffix=".db")
+os.close(_fd)
+TEST_DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
 
 engine = create_engine(
     TEST_DATABASE_URL, 
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+# TestClient 는 요청마다 이벤트 루프가 다를 수 있으므로 커넥션을 재사용하지 않음
+async_engine = create_async_engine(async_database_url(TEST_DATABASE_URL), poolclass=NullPool)
+
+def pytest_unconfigure(config):
+    engine.dispose()
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
 
 # DB 초기화 및 세션 오버라이드
 @pytest.fixture(name="session")
@@ -37,15 +59,58 @@ def client_fixture(session: Session):
     def get_session_override():
         return session
     
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            yield async_session
+
     def get_redis_override():
         yield None
 
     app.dependency_overrides[get_db] = get_session_override
+    app.dependency_overrides[get_async_db] = get_async_session_override
+    app.dependency_overrides[get_read_db] = get_async_session_override
     app.dependency_overrides[get_redis] = get_redis_override
     
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
+    # 테스트마다 DB가 초기화되어 같은 user id가 재사용되므로 인증 캐시도 비움
+    user_cache.clear()
+
+# Redis 가 필요한 테스트용 (Lua 스크립트까지 실행되는 fakeredis, 테스트마다 새 서버)
+#   def test_x(client, fake_redis): ...
+@pytest.fixture(name="fake_redis")
+def fake_redis_fixture(client):
+    rds = fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+    def get_redis_override():
+        yield rds
+
+    app.dependency_overrides[get_redis] = get_redis_override
+    yield rds
+    rds.close()
+
+# [Helper] 블록 안에서 실행된 SQL 수 상한 검사 (N+1 회귀 방지)
+#   with assert_max_queries(3):
+#       client.get("/contents")
+@pytest.fixture
+def assert_max_queries():
+    @contextmanager
+    def _assert(limit: int):
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "after_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "after_cursor_execute", _record)
+        assert len(statements) <= limit, (
+            f"{len(statements)} queries (max {limit}):\n" + "\n".join(statements)
+        )
+    return _assert
 
 # [Helper] 테스트용 유저 생성 및 토큰 발급
 @pytest.fixture
@@ -1,3 +1,5 @@
+from sqlmodel import select
+
 def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
@@ -27,6 +29,79 @@ def test_login_success(client):
     assert response.status_code == 200
     assert "access_token" in response.json()["data"]
 
+def test_refresh_rotates_and_rejects_access_token(client, fake_redis):
+    client.post("/users/signup", json={"email": "rot@test.com", "password": "pw", "nickname": "r1"})
+    tokens = client.post("/auth/login", json={"email": "rot@test.com", "password": "pw"}).json()["data"]
+
+    # Access Token 으로는 갱신 불가
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["access_token"]})
+    assert response.status_code == 401
+
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 200
+    assert response.json()["data"]["refresh_token"] != tokens["refresh_token"]
+
+def test_refresh_fails_closed_without_redis(client):
+    # conftest 의 기본 client 는 Redis 없음(None) = Redis 장애와 같은 경로
+    client.post("/users/signup", json={"email": "down@test.com", "password": "pw", "nickname": "d1"})
+    tokens = client.post("/auth/login", json={"email": "down@test.com", "password": "pw"}).json()["data"]
+
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 503
+    assert response.json()["code"] == "SERVICE_UNAVAILABLE"
+
+def test_refresh_fails_closed_on_redis_error(client, fake_redis, monkeypatch):
+    import redis
+    from src.core import refresh_tokens
+
+    client.post("/users/signup", json={"email": "err@test.com", "password": "pw", "nickname": "e1"})
+    tokens = client.post("/auth/login", json={"email": "err@test.com", "password": "pw"}).json()["data"]
+
+    def down(*args):
+        raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(refresh_tokens, "rotate", down)
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 503
+
+def test_refresh_reuse_revokes_family(client, fake_redis):
+    client.post("/users/signup", json={"email": "reuse@test.com", "password": "pw", "nickname": "r2"})
+    tokens = client.post("/auth/login", json={"email": "reuse@test.com", "password": "pw"}).json()["data"]
+    other = client.post("/auth/login", json={"email": "reuse@test.com", "password": "pw"}).json()["data"]
+
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 200
+    rotated = response.json()["data"]["refresh_token"]
+
+    # 이미 교체된 토큰 재사용 -> 탈취로 보고 패밀리 폐기
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+    response = client.post("/auth/refresh", json={"refresh_token": rotated})
+    assert response.status_code == 401
+
+    # 다른 로그인(패밀리)은 유지
+    response = client.post("/auth/refresh", json={"refresh_token": other["refresh_token"]})
+    assert response.status_code == 200
+    [key] = fake_redis.keys("refresh_tokens:*")
+    assert fake_redis.hlen(key) == 1
+
+def test_revocation_keeps_tokens_issued_after_revoke():
+    import time
+    import fakeredis
+    from src.core import revocation
+    from src.core.security import create_token, decode_token
+
+    rds = fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    before = decode_token(create_token("1", "access", 60))["iat"]
+    revocation.revoke_user_access(rds, 1)
+    # 폐기 직후 같은 초 안에 다시 발급된 토큰은 유효해야 함
+    time.sleep(0.002)
+    after = decode_token(create_token("1", "access", 60))["iat"]
+    assert int(after) - int(before) <= 1
+    assert revocation.is_revoked(rds, 1, before)
+    assert not revocation.is_revoked(rds, 1, after)
+    assert not revocation.is_revoked(rds, 2, before)
+
 def test_login_fail(client):
     response = client.post("/auth/login", json={"email": "wrong@test.com", "password": "pw"})
     assert response.status_code == 401
@@ -45,4 +120,82 @@ def test_change_password(client, user_token_headers):
         "current_password": "password123",
         "new_password": "newpassword123"
     })
-    assert response.status_code == 200
\ No newline at end of file
+    assert response.status_code == 200
+def test_blocked_user_rejected_after_cache(client, user_token_headers, admin_token_headers):
+    # 첫 요청으로 인증 캐시를 채운 뒤, 관리자 차단 시 즉시 무효화되는지 확인
+    me = client.get("/users/me", headers=user_token_headers)
+    assert me.status_code == 200
+    user_id = me.json()["data"]["id"]
+
+    res = client.patch(f"/users/{user_id}/status?status=BLOCKED", headers=admin_token_headers)
+    assert res.status_code == 200
+
+    response = client.get("/users/me", headers=user_token_headers)
+    assert response.status_code == 403
+
+def test_login_rehashes_when_cost_changes(client, session, monkeypatch):
+    from src.core.config import settings
+    from src.db.models import User
+
+    client.post("/users/signup", json={"email": "cost@test.com", "password": "pw", "nickname": "c1"})
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+    response = client.post("/auth/login", json={"email": "cost@test.com", "password": "pw"})
+    assert response.status_code == 200
+
+    user = session.exec(select(User).where(User.email == "cost@test.com")).one()
+    assert user.password_hash.startswith("$2b$04$")
+
+def _local_signing_key(kid: str):
+    # 오프라인 테스트용 RSA 키 + 자체 서명 인증서 생성
+    from datetime import datetime, timedelta, timezone
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+    from google.auth import crypt
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "test")])
+    now = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(1)
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    signer = crypt.RSASigner.from_string(private_pem, key_id=kid)
+    return signer, {kid: cert.public_bytes(serialization.Encoding.PEM).decode()}
+
+def test_google_login_with_local_keys(client, monkeypatch):
+    import time
+    from google.auth import jwt as google_jwt
+    from src.core.social_auth import GOOGLE_CERTS_URL, KeySet, verifier
+
+    # 전역 verifier 의 키셋을 테스트 동안만 교체 (다른 테스트에 로컬 키가 남지 않도록)
+    monkeypatch.setattr(verifier, "google", KeySet("google", GOOGLE_CERTS_URL))
+    signer, certs = _local_signing_key("test-kid")
+    verifier.load_local_keys(google=certs)
+    now = int(time.time())
+    token = google_jwt.encode(signer, {
+        "iss": "https://accounts.google.com",
+        "sub": "123",
+        "email": "google@test.com",
+        "iat": now,
+        "exp": now + 300,
+    }).decode()
+
+    response = client.post("/auth/google", json={"id_token": token})
+    assert response.status_code == 200
+    assert "access_token" in response.json()["data"]
+
+    response = client.post("/auth/google", json={"id_token": token[:-4] + "abcd"})
+    assert response.status_code == 401
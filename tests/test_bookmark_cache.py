@@ -0,0 +1,124 @@
+import fakeredis
+import pytest
+
+from src.core import bookmark_cache
+from src.db.models import Bookmark, Content, User
+
+
+@pytest.fixture
+def rds():
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    yield client
+    client.close()
+
+
+def setup_bookmarks(session, count=3):
+    user = User(email="bm@test.com", password_hash="x", nickname="bm")
+    contents = [Content(tmdb_id=700 + i, title=f"Movie {i}") for i in range(count)]
+    session.add(user)
+    session.add_all(contents)
+    session.commit()
+    return user.id, [c.id for c in contents]
+
+
+def test_rebuild_skips_stale_snapshot(session, rds, monkeypatch):
+    user_id, (first, second, _) = setup_bookmarks(session)
+    session.add(Bookmark(user_id=user_id, content_id=first))
+    session.commit()
+
+    load_ids = bookmark_cache._load_ids
+
+    def load_then_concurrent_add(db, uid):
+        ids = load_ids(db, uid)
+        # DB 를 읽은 뒤 다른 요청이 북마크를 커밋하고 캐시에 반영
+        session.add(Bookmark(user_id=user_id, content_id=second))
+        session.commit()
+        bookmark_cache.add(rds, user_id, second)
+        return ids
+
+    monkeypatch.setattr(bookmark_cache, "_load_ids", load_then_concurrent_add)
+    assert bookmark_cache.rebuild(rds, session, user_id) == {first}
+    # 오래된 스냅숏({first})을 캐시에 쓰지 않음
+    assert not rds.exists(f"bookmarks:{user_id}")
+
+    monkeypatch.setattr(bookmark_cache, "_load_ids", load_ids)
+    assert bookmark_cache.contains_many(rds, session, user_id, [first, second]) == {first: True, second: True}
+    assert rds.smembers(f"bookmarks:{user_id}") == {"0", str(first), str(second)}
+
+
+def test_check_consistency_finds_stale_set_without_db_rows(session, rds):
+    user_id, (first, second, _) = setup_bookmarks(session)
+    other = User(email="bm2@test.com", password_hash="x", nickname="bm2")
+    session.add(other)
+    session.add(Bookmark(user_id=user_id, content_id=first))
+    session.commit()
+
+    bookmark_cache.rebuild(rds, session, user_id)
+    # SREM 실패로 남은 집합: DB 에는 북마크가 없음
+    rds.sadd(f"bookmarks:{other.id}", "0", str(second))
+
+    stats = bookmark_cache.check_consistency(rds, session, batch_size=1)
+    assert stats == {"checked": 2, "skipped": 0, "mismatched": 1, "repaired": 0}
+
+    stats = bookmark_cache.check_consistency(rds, session, repair=True)
+    assert stats["repaired"] == 1
+    assert not rds.exists(f"bookmarks:{other.id}")
+    assert rds.exists(f"bookmarks:{user_id}")
+
+
+def _status(client, headers, content_ids):
+    response = client.get(
+        "/bookmarks/status", params={"contentIds": ",".join(map(str, content_ids))}, headers=headers
+    )
+    assert response.status_code == 200
+    return {item["content_id"]: item["bookmarked"] for item in response.json()["data"]["items"]}
+
+
+def test_bookmark_routes_keep_cache_in_sync(client, session, user_token_headers, fake_redis):
+    user_id = client.get("/users/me", headers=user_token_headers).json()["data"]["id"]
+    _, (first, second, third) = setup_bookmarks(session)
+    key = f"bookmarks:{user_id}"
+
+    # 적재 전 추가는 캐시에 부분 집합을 만들지 않음 (버전만 증가)
+    client.post("/bookmarks", headers=user_token_headers, json={"content_id": first})
+    assert not fake_redis.exists(key)
+    assert fake_redis.get(f"bookmarks_ver:{user_id}") == "1"
+
+    # 첫 조회에서 DB 기준으로 적재 (센티널 포함)
+    assert _status(client, user_token_headers, [first, second]) == {first: True, second: False}
+    assert fake_redis.smembers(key) == {"0", str(first)}
+    assert 0 < fake_redis.ttl(key)
+
+    # 적재 후에는 추가/삭제가 집합에 바로 반영
+    client.post("/bookmarks", headers=user_token_headers, json={"content_id": second})
+    client.delete(f"/bookmarks/{first}", headers=user_token_headers)
+    assert fake_redis.smembers(key) == {"0", str(second)}
+    assert _status(client, user_token_headers, [first, second, third]) == {
+        first: False, second: True, third: False,
+    }
+
+
+def test_bookmark_status_empty_user_is_cached(client, session, user_token_headers, fake_redis):
+    user_id = client.get("/users/me", headers=user_token_headers).json()["data"]["id"]
+    _, (first, _, _) = setup_bookmarks(session)
+
+    assert _status(client, user_token_headers, [first]) == {first: False}
+    # 북마크가 없어도 센티널로 적재 완료를 표시
+    assert fake_redis.smembers(f"bookmarks:{user_id}") == {"0"}
+
+
+def test_cache_db_disagreement_is_repaired(client, session, user_token_headers, fake_redis):
+    user_id = client.get("/users/me", headers=user_token_headers).json()["data"]["id"]
+    _, (first, second, _) = setup_bookmarks(session)
+    client.post("/bookmarks", headers=user_token_headers, json={"content_id": first})
+    assert _status(client, user_token_headers, [first]) == {first: True}
+
+    # 캐시를 거치지 않고 DB 만 바뀐 경우 (캐시 반영 실패 등)
+    session.delete(session.get(Bookmark, (user_id, first)))
+    session.add(Bookmark(user_id=user_id, content_id=second))
+    session.commit()
+    assert _status(client, user_token_headers, [first, second]) == {first: True, second: False}
+
+    stats = bookmark_cache.check_consistency(fake_redis, session, repair=True)
+    assert stats["mismatched"] == 1 and stats["repaired"] == 1
+    assert _status(client, user_token_headers, [first, second]) == {first: False, second: True}
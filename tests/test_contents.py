@@ -1,4 +1,5 @@
-from src.db.models import Content, Genre
+from src.db.models import Content, ContentGenreLink, Genre
+from src.repositories import contents as contents_repo
 
 def test_list_genres_empty(client):
     response = client.get("/genres")
@@ -54,4 +55,97 @@ def test_create_and_get_content(client, session):
     response = client.get("/contents")
     assert response.status_code == 200
     assert len(response.json()["data"]["items"]) == 1
-    assert response.json()["data"]["items"][0]["title"] == "Test Movie"
\ No newline at end of file
+    assert response.json()["data"]["items"][0]["title"] == "Test Movie"
+
+def test_list_contents_genres_batched(client, session, assert_max_queries):
+    genres = [Genre(tmdb_genre_id=28, name="Action"), Genre(tmdb_genre_id=18, name="Drama")]
+    contents = [Content(tmdb_id=100 + i, title=f"Movie {i}") for i in range(5)]
+    session.add_all(genres + contents)
+    session.commit()
+    for c in contents:
+        session.add_all([ContentGenreLink(content_id=c.id, genre_id=g.id) for g in genres])
+    session.commit()
+
+    # ETag 버전 + count + 목록 + 장르(페이지 전체 한 번)
+    with assert_max_queries(4):
+        response = client.get("/contents")
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert len(items) == 5
+    assert all([g["name"] for g in item["genres"]] == ["Action", "Drama"] for item in items)
+
+
+def test_list_contents_compressed(client, session):
+    session.add_all([Content(tmdb_id=200 + i, title=f"Compressed Movie {i}") for i in range(20)])
+    session.commit()
+
+    response = client.get("/contents", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()["data"]["items"]) == 20
+
+    response = client.get("/contents", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+    # 작은 응답은 압축하지 않음
+    response = client.get("/contents/99999", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_contents_sparse_fields(client, session, assert_max_queries):
+    genre = Genre(tmdb_genre_id=28, name="Action")
+    content = Content(tmdb_id=300, title="Sparse Movie")
+    session.add_all([genre, content])
+    session.commit()
+    session.add(ContentGenreLink(content_id=content.id, genre_id=genre.id))
+    session.commit()
+
+    # 장르를 요청하지 않으면 장르 조회 생략 (ETag 버전 + count + 목록)
+    with assert_max_queries(3) as statements:
+        response = client.get("/contents", params={"fields": "id,title"})
+    assert response.json()["data"]["items"] == [{"id": content.id, "title": "Sparse Movie"}]
+    assert "updated_at" not in statements[-1]
+
+    # tmdb 를 요청하지 않으면 TMDB 조회 없이 응답
+    response = client.get(f"/contents/{content.id}", params={"fields": "title,genres"})
+    assert response.status_code == 200
+    assert response.json()["data"] == {"title": "Sparse Movie", "genres": [{"id": genre.id, "name": "Action"}]}
+
+    response = client.get("/contents", params={"fields": "title,password"})
+    assert response.status_code == 400
+
+
+def test_contents_conditional_get(client, session, assert_max_queries):
+    content = Content(tmdb_id=400, title="Cached Movie")
+    session.add(content)
+    session.commit()
+
+    response = client.get("/contents")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public")
+
+    # 변경이 없으면 버전 조회 한 번으로 304
+    with assert_max_queries(1):
+        response = client.get("/contents", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    # 상세도 TMDB 호출 없이 304 (W/ 로 바뀐 ETag 도 일치)
+    response = client.get(f"/contents/{content.id}", params={"fields": "id,title"})
+    detail_etag = response.headers["etag"]
+    response = client.get(
+        f"/contents/{content.id}", params={"fields": "id,title"},
+        headers={"If-None-Match": "W/" + detail_etag},
+    )
+    assert response.status_code == 304
+
+    # 콘텐츠의 장르 구성이 바뀌면 목록 ETag 도 바뀜
+    genre = Genre(tmdb_genre_id=28, name="Action")
+    session.add(genre)
+    session.commit()
+    contents_repo.set_content_genres(session, content.id, [genre.id])
+    response = client.get("/contents", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,122 @@
+# 주요 조회 쿼리가 인덱스를 사용하는지 EXPLAIN 으로 확인합니다.
+# Postgres 가 필요하므로 TEST_POSTGRES_URL 이 설정된 경우에만 실행됩니다.
+#   TEST_POSTGRES_URL=postgresql://user:pw@localhost:5432/movie_test pytest tests/test_indexes.py
+# 지정한 DB 에 임시 스키마를 만들어 사용하고, 끝나면 스키마째 삭제합니다.
+import importlib.util
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, text
+from sqlmodel import SQLModel
+
+import src.db.models  # noqa: F401  (메타데이터 등록)
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set"
+)
+
+MIGRATION = (
+    Path(__file__).resolve().parents[1]
+    / "migrations/versions/7c1e4b9a2d35_add_fk_and_soft_delete_indexes.py"
+)
+
+# (쿼리, 사용해야 하는 인덱스)
+HOT_QUERIES = [
+    (
+        "SELECT * FROM reviews WHERE content_id = 7 ORDER BY created_at DESC LIMIT 20",
+        "ix_reviews_content_id_created_at",
+    ),
+    (
+        "SELECT * FROM reviews WHERE user_id = 7 ORDER BY created_at DESC LIMIT 20",
+        "ix_reviews_user_id_created_at",
+    ),
+    (
+        "SELECT review_id, count(user_id) FROM review_likes "
+        "WHERE review_id IN (1, 2, 3) GROUP BY review_id",
+        "ix_review_likes_review_id",
+    ),
+    (
+        "SELECT * FROM bookmarks WHERE user_id = 7 ORDER BY created_at DESC LIMIT 20",
+        "ix_bookmarks_user_id_created_at",
+    ),
+    (
+        "SELECT content_id FROM content_genres WHERE genre_id = 3",
+        "ix_content_genres_genre_id",
+    ),
+    (
+        "SELECT * FROM contents WHERE deleted_at IS NULL ORDER BY created_at DESC LIMIT 20",
+        "ix_contents_created_at_active",
+    ),
+]
+
+SEED_SQL = [
+    "INSERT INTO users (email, password_hash, nickname, role, status, created_at, updated_at) "
+    "SELECT 'u' || i || '@test.com', '', 'u' || i, 'USER', 'ACTIVE', now(), now() "
+    "FROM generate_series(1, 500) i",
+    "INSERT INTO genres (tmdb_genre_id, name, created_at) "
+    "SELECT i, 'g' || i, now() FROM generate_series(1, 20) i",
+    "INSERT INTO contents (tmdb_id, title, created_at, updated_at, deleted_at) "
+    "SELECT i, 'movie ' || i, now() - i * interval '1 minute', now(), "
+    "CASE WHEN i % 10 = 0 THEN now() END FROM generate_series(1, 5000) i",
+    "INSERT INTO content_genres (content_id, genre_id) "
+    "SELECT i, (i % 20) + 1 FROM generate_series(1, 5000) i",
+    "INSERT INTO reviews (user_id, content_id, rating, comment, like_count, created_at, updated_at) "
+    "SELECT (i % 500) + 1, (i % 5000) + 1, (i % 5) + 1, 'c', 0, "
+    "now() - i * interval '1 second', now() FROM generate_series(1, 20000) i",
+    "INSERT INTO review_likes (user_id, review_id, created_at) "
+    "SELECT (i % 500) + 1, i, now() FROM generate_series(1, 20000) i",
+    "INSERT INTO bookmarks (user_id, content_id, created_at) "
+    "SELECT (i % 500) + 1, i, now() - i * interval '1 second' FROM generate_series(1, 5000) i",
+]
+
+
+def _run_migration(connection) -> None:
+    spec = importlib.util.spec_from_file_location("index_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    context = MigrationContext.configure(connection)
+    with Operations.context(context):
+        migration.upgrade()
+
+
+@pytest.fixture(scope="module")
+def pg_engine():
+    schema = f"idx_test_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(TEST_POSTGRES_URL)
+    with admin.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+
+    engine = create_engine(
+        TEST_POSTGRES_URL, connect_args={"options": f"-c search_path={schema}"}
+    )
+    try:
+        SQLModel.metadata.create_all(engine)
+        with engine.begin() as conn:
+            # 모델에 선언된 인덱스를 지우고 마이그레이션으로 다시 만들어 마이그레이션 자체를 검증
+            for _, index in HOT_QUERIES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+            for sql in SEED_SQL:
+                conn.execute(text(sql))
+        with engine.connect() as conn:
+            _run_migration(conn)
+        with engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+        yield engine
+    finally:
+        engine.dispose()
+        with admin.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
+
+
+@pytest.mark.parametrize("query,index", HOT_QUERIES, ids=[i for _, i in HOT_QUERIES])
+def test_hot_query_uses_index(pg_engine, query, index):
+    with pg_engine.connect() as conn:
+        plan = "\n".join(row[0] for row in conn.execute(text(f"EXPLAIN {query}")))
+    assert index in plan, plan
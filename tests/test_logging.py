@@ -0,0 +1,93 @@
+import io
+import json
+import logging
+import queue
+import sys
+import time
+
+import pytest
+
+from src.core import logging as app_logging
+from src.core.config import settings
+from src.core.errors import ErrorCode, http_error
+from src.core.logging import SamplingFilter, _DropCountingQueueHandler, access_logger, logger
+from src.core.request_context import reset_route, set_route
+from src.repositories import genres as genres_repo
+
+
+def test_full_queue_drops_without_blocking():
+    handler = _DropCountingQueueHandler(queue.Queue(maxsize=2))
+    log = logging.getLogger("test.queue")
+    log.addHandler(handler)
+    log.propagate = False
+    try:
+        start = time.perf_counter()
+        for i in range(5):
+            log.warning("record %d", i)
+        assert time.perf_counter() - start < 1
+    finally:
+        log.removeHandler(handler)
+        log.propagate = True
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_sampling_parse_rejects_unknown_level():
+    assert SamplingFilter.parse("info=0.5, DEBUG=0").rates == {logging.INFO: 0.5, logging.DEBUG: 0.0}
+    assert SamplingFilter.parse("").rates == {}
+    for value in ("INF=0.1", "INFO=abc", "INFO=2"):
+        with pytest.raises(ValueError):
+            SamplingFilter.parse(value)
+
+
+def test_access_sampling_keeps_5xx(client, caplog, monkeypatch):
+    sampler = SamplingFilter.parse("INFO=0")
+    access_logger.addFilter(sampler)
+    caplog.set_level(logging.INFO, logger="app.access")
+    try:
+        assert client.get("/genres").status_code == 200
+
+        def unavailable(db):
+            raise http_error(503, ErrorCode.SERVICE_UNAVAILABLE, "점검 중")
+
+        monkeypatch.setattr(genres_repo, "list_active_genres", unavailable)
+        assert client.get("/genres").status_code == 503
+    finally:
+        access_logger.removeFilter(sampler)
+
+    # INFO(200) 는 샘플링으로 빠지고, 5xx 는 WARNING 으로 남음
+    access = [r for r in caplog.records if r.name == "app.access"]
+    assert sampler.sampled_out == 1
+    assert [(r.levelno, "-> 503" in r.getMessage()) for r in access] == [(logging.WARNING, True)]
+
+
+@pytest.fixture
+def json_output(monkeypatch):
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level, access_logger.filters[:]
+    output = io.StringIO()
+    monkeypatch.setattr(settings, "LOG_JSON", True)
+    monkeypatch.setattr(sys, "stdout", output)
+    app_logging.setup_logging("INFO")
+    yield output
+    app_logging.shutdown_logging()
+    root.handlers, root.level, access_logger.filters = saved[0], saved[1], saved[2]
+
+
+def test_json_log_has_route_and_exception(json_output):
+    token = set_route("GET", "/contents/1")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("failed")
+    finally:
+        reset_route(token)
+    logger.info("outside request")
+    app_logging.shutdown_logging()
+
+    lines = [json.loads(line) for line in json_output.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["failed", "outside request"]
+    assert lines[0]["route"] == "GET /contents/1"
+    assert lines[0]["level"] == "ERROR"
+    assert "RuntimeError: boom" in lines[0]["exception"]
+    assert "route" not in lines[1] and "exception" not in lines[1]
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core import tracing
+from src.core.config import settings
+from src.db.models import Content
+from src.main import app
+from src.repositories import genres as genres_repo
+
+
+# 트레이싱을 켜고 span 을 임시 파일로 내보냄. read() 는 exporter 를 비운 뒤 기록된 span 을 반환
+@pytest.fixture
+def traces(monkeypatch, tmp_path):
+    trace_file = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(settings, "TRACING_FILE", str(trace_file))
+
+    def read():
+        tracing.shutdown_tracing()
+        if not trace_file.exists():
+            return []
+        return [json.loads(line) for line in trace_file.read_text().splitlines()]
+
+    yield read
+    tracing.shutdown_tracing()
+
+
+def test_metrics_by_route_template(client):
+    client.get("/contents/987654")
+    body = client.get("/metrics").text
+    # 경로 파라미터 값이 아닌 라우트 템플릿으로 집계
+    assert 'http_requests_total{method="GET",route="/contents/{content_id}",status="404"}' in body
+    assert "/contents/987654" not in body
+    assert "db_pool_checkout_wait_seconds" in body
+
+
+def test_request_tracing(client, session, traces):
+    content = Content(tmdb_id=500, title="Traced Movie")
+    session.add(content)
+    session.commit()
+
+    # 샘플링 비율이 0 이어도 상위 서비스가 sampled 로 보낸 traceparent 는 따름
+    trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+    client.get(
+        f"/contents/{content.id}", params={"fields": "id,title"},
+        headers={"traceparent": f"00-{trace_id}-{parent_id}-01"},
+    )
+    client.get("/contents")  # 샘플링되지 않음
+
+    spans = traces()
+    assert {s["trace_id"] for s in spans} == {trace_id}
+    root = next(s for s in spans if s["kind"] == "server")
+    assert root["name"] == "GET /contents/{content_id}"
+    assert root["parent_id"] == parent_id
+    queries = [s for s in spans if s["name"] == "db.query"]
+    assert queries and all(s["parent_id"] == root["span_id"] for s in queries)
+
+
+def test_request_id_header(client):
+    response = client.get("/genres", headers={"X-Request-ID": "client-abc.123"})
+    assert response.headers["x-request-id"] == "client-abc.123"
+    assert response.headers["server-timing"].startswith("db;dur=")
+
+    # 형식이 맞지 않는 값은 새로 발급
+    response = client.get("/genres", headers={"X-Request-ID": "bad id\t<script>"})
+    assert len(response.headers["x-request-id"]) == 32
+
+
+def test_unhandled_exception_has_request_headers(client, monkeypatch, caplog):
+    def broken(db):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(genres_repo, "list_active_genres", broken)
+    # 예외는 서버(테스트 클라이언트)까지 그대로 전달됨
+    with pytest.raises(RuntimeError):
+        client.get("/genres")
+
+    # 응답은 미들웨어가 보낸 500 (request id / Server-Timing 포함)
+    client = TestClient(app, raise_server_exceptions=False)
+    caplog.clear()
+    response = client.get("/genres", headers={"X-Request-ID": "req-500"})
+    assert response.status_code == 500
+    assert response.json()["code"] == "INTERNAL_SERVER_ERROR"
+    assert response.headers["x-request-id"] == "req-500"
+    assert response.headers["server-timing"].startswith("db;dur=")
+    # 스택트레이스는 unhandled_exception_handler 가 한 번만 기록
+    assert len([r for r in caplog.records if r.exc_info]) == 1
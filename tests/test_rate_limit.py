@@ -0,0 +1,33 @@
+from src.core.errors import STANDARD_ERROR_RESPONSES
+from src.core.rate_limit import RateLimitPolicy, limiter
+
+
+def test_rate_limit_allows_then_denies_with_retry_after(client, fake_redis):
+    # POST /users/signup: 5/minute
+    for i in range(5):
+        response = client.post("/users/signup", json={
+            "email": f"rl{i}@test.com", "password": "pw", "nickname": f"rl{i}"
+        })
+        assert response.status_code == 200
+
+    response = client.post("/users/signup", json={"email": "rl5@test.com", "password": "pw", "nickname": "rl5"})
+    assert response.status_code == 429
+    assert response.json()["code"] == "TOO_MANY_REQUESTS"
+    # 5/minute -> 다음 요청까지 약 12초
+    assert 1 <= int(response.headers["Retry-After"]) <= 12
+    # 문서(Swagger) 예시와 같은 형식
+    example = STANDARD_ERROR_RESPONSES[429]["content"]["application/json"]["example"]
+    assert response.json()["details"].keys() == example["details"].keys()
+    assert response.json()["details"]["error"] == "Rate limit exceeded: 5 per 60 second(s)"
+
+
+def test_rate_limit_non_integer_interval(fake_redis):
+    # 간격이 ms 로 나누어떨어지지 않는 정책 (60000/7, 1000/3)
+    for policy, key in ((RateLimitPolicy.parse("7/minute"), "rl:test:7m"),
+                        (RateLimitPolicy.parse("3/second"), "rl:test:3s")):
+        results = [limiter.hit(fake_redis, key, policy) for _ in range(policy.limit + 1)]
+        assert [allowed for allowed, _, _ in results] == [True] * policy.limit + [False]
+        assert [remaining for _, _, remaining in results[:-1]] == list(range(policy.limit - 1, -1, -1))
+        retry_after = results[-1][1]
+        assert 0 < retry_after <= policy.period / policy.limit
+        assert 0 < fake_redis.pttl(key) <= policy.period * 1000
@@ -0,0 +1,48 @@
+import fakeredis
+import pytest
+import redis
+from prometheus_client import REGISTRY
+
+from src.deps import redis as redis_deps
+
+
+def _errors(command: str) -> float:
+    return REGISTRY.get_sample_value("redis_command_errors_total", {"command": command}) or 0
+
+
+def test_pipeline_failure_marks_redis_down(monkeypatch):
+    monkeypatch.setattr(redis_deps, "_down_until", 0.0)
+    monkeypatch.setattr(redis_deps, "_client", None)
+    # 닫힌 포트: 연결 오류
+    rds = redis_deps._Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+    before = _errors("PIPELINE")
+
+    pipe = rds.pipeline(transaction=False)
+    pipe.set("a", 1)
+    pipe.incr("b")
+    with pytest.raises(redis.ConnectionError):
+        pipe.execute()
+
+    assert _errors("PIPELINE") == before + 1
+    # 장애로 표시되어 REDIS_RETRY_SECONDS 동안은 연결을 시도하지 않음
+    assert redis_deps.get_redis_client() is None
+
+
+def test_pool_exhaustion_does_not_mark_redis_down(monkeypatch):
+    monkeypatch.setattr(redis_deps, "_down_until", 0.0)
+    pool = redis_deps._BlockingPool(
+        connection_class=fakeredis.FakeRedisConnection, server=fakeredis.FakeServer(),
+        max_connections=1, timeout=0.05,
+    )
+    rds = redis_deps._Redis(connection_pool=pool)
+    held = pool.get_connection()  # 하나뿐인 커넥션을 점유
+    before = _errors("GET")
+
+    with pytest.raises(redis_deps.RedisPoolExhausted):
+        rds.get("a")
+    assert _errors("GET") == before + 1
+    assert redis_deps._down_until == 0.0
+
+    # 커넥션이 반납되면 바로 다시 사용 가능
+    pool.release(held)
+    assert rds.get("a") is None
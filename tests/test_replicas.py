@@ -0,0 +1,97 @@
+import asyncio
+
+import fakeredis
+import pytest
+from starlette.requests import Request
+
+from src.core.security import create_token
+from src.db import replicas as replicas_mod
+
+PRIMARY = object()
+
+
+class FakeSession:
+    async def connection(self):
+        return None
+
+    async def close(self):
+        pass
+
+
+class FakeReplica:
+    name = "replica0"
+
+    def __init__(self):
+        self.opened = 0
+
+    def healthy(self) -> bool:
+        return True
+
+    def sessionmaker(self):
+        self.opened += 1
+        return FakeSession()
+
+
+def _request(user_id: str) -> Request:
+    token = create_token(user_id, "access", 60)
+    return Request({
+        "type": "http", "method": "GET", "path": "/contents", "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+def _open(user_id: str):
+    return asyncio.run(replicas_mod.open_read_session(_request(user_id)))
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    fake = FakeReplica()
+    monkeypatch.setattr(replicas_mod, "replicas", [fake])
+    monkeypatch.setattr(replicas_mod, "_round_robin", iter(lambda: 0, None))
+    monkeypatch.setattr(replicas_mod, "AsyncReadSessionLocal", lambda: PRIMARY)
+    monkeypatch.setattr(replicas_mod, "_local_writes", {})
+    return fake
+
+
+def _use_redis(monkeypatch, rds) -> None:
+    monkeypatch.setattr(replicas_mod, "get_redis_client", lambda: rds)
+
+
+def test_reads_go_to_replica(replica, monkeypatch):
+    _use_redis(monkeypatch, fakeredis.FakeRedis(server=fakeredis.FakeServer()))
+    assert isinstance(_open("1"), FakeSession)
+    assert replica.opened == 1
+
+
+def test_reads_go_to_primary_after_write(replica, monkeypatch):
+    rds = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    _use_redis(monkeypatch, rds)
+    replicas_mod.mark_write("1")
+    assert 0 < rds.pttl("recent_write:1") <= replicas_mod.settings.READ_YOUR_WRITES_SECONDS * 1000
+
+    assert _open("1") is PRIMARY
+    # 다른 사용자는 계속 복제본
+    assert isinstance(_open("2"), FakeSession)
+
+    # 다른 워커에서 쓴 경우: 로컬 기록 없이 Redis 키만 있음
+    replicas_mod._local_writes.clear()
+    assert _open("1") is PRIMARY
+
+    # 기간이 지나면 다시 복제본
+    rds.delete("recent_write:1")
+    assert isinstance(_open("1"), FakeSession)
+
+
+def test_read_routing_when_redis_down(replica, monkeypatch):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    _use_redis(monkeypatch, fakeredis.FakeRedis(server=server))
+
+    # Redis 오류는 조회를 막지 않고 복제본으로
+    assert isinstance(_open("1"), FakeSession)
+
+    # 같은 워커의 쓰기는 프로세스 로컬 기록으로 Primary 로 보냄
+    replicas_mod.mark_write("1")
+    assert _open("1") is PRIMARY
+    assert isinstance(_open("2"), FakeSession)
@@ -31,10 +31,20 @@ def test_create_review_duplicate(client, session, user_token_headers):
     response = client.post(f"/contents/{content.id}/reviews", headers=user_token_headers, json={"rating": 3, "comment": "Second"})
     assert response.status_code == 409
 
-def test_get_reviews(client, session):
+def test_get_reviews(client, session, assert_max_queries):
     content = setup_content(session)
-    response = client.get(f"/contents/{content.id}/reviews")
+    # 콘텐츠 확인 + count + 목록
+    with assert_max_queries(3):
+        response = client.get(f"/contents/{content.id}/reviews")
     assert response.status_code == 200
+    assert "db;dur=" in response.headers["server-timing"]
+
+def test_get_reviews_sparse_fields(client, session, user_token_headers):
+    content = setup_content(session)
+    client.post(f"/contents/{content.id}/reviews", headers=user_token_headers, json={"rating": 4, "comment": "Nice"})
+    response = client.get(f"/contents/{content.id}/reviews", params={"fields": "rating,like_count"})
+    assert response.status_code == 200
+    assert response.json()["data"]["items"] == [{"rating": 4, "like_count": 0}]
 
 def test_bookmark_create(client, session, user_token_headers):
     content = setup_content(session)
@@ -43,6 +53,19 @@ def test_bookmark_create(client, session, user_token_headers):
     })
     assert response.status_code == 201
 
+def test_bookmark_list(client, session, user_token_headers):
+    content = setup_content(session)
+    client.post("/bookmarks", headers=user_token_headers, json={"content_id": content.id})
+
+    # 동기 세션으로 추가한 북마크가 async 라우트에서 조회되어야 함
+    response = client.get("/bookmarks", headers=user_token_headers)
+    assert response.status_code == 200
+    assert response.json()["data"]["totalElements"] == 1
+    assert response.json()["data"]["content"][0]["title"] == content.title
+
+    response = client.get("/bookmarks", headers=user_token_headers, params={"fields": "content_id"})
+    assert response.json()["data"]["content"] == [{"content_id": content.id}]
+
 def test_bookmark_duplicate(client, session, user_token_headers):
     content = setup_content(session)
     client.post("/bookmarks", headers=user_token_headers, json={"content_id": content.id})
@@ -65,4 +88,33 @@ def test_delete_review_forbidden(client, session, admin_token_headers, user_toke
     
     # 본인 삭제
     del_res = client.delete(f"/reviews/{review_id}", headers=user_token_headers)
-    assert del_res.status_code == 200
\ No newline at end of file
+    assert del_res.status_code == 200
+
+def test_bookmark_status(client, session, user_token_headers):
+    content = setup_content(session)
+    client.post("/bookmarks", headers=user_token_headers, json={"content_id": content.id})
+    response = client.get(
+        f"/bookmarks/status?contentIds={content.id},99999", headers=user_token_headers
+    )
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    assert items == [
+        {"content_id": content.id, "bookmarked": True},
+        {"content_id": 99999, "bookmarked": False},
+    ]
+
+
+def test_export_my_reviews(client, session, user_token_headers):
+    content = setup_content(session)
+    client.post(f"/contents/{content.id}/reviews", headers=user_token_headers, json={"rating": 4, "comment": "Nice"})
+
+    response = client.get("/users/me/reviews/export", headers=user_token_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.strip().splitlines()
+    assert len(lines) == 1
+    assert '"comment": "Nice"' in lines[0]
+
+    response = client.get("/users/me/bookmarks/export?format=csv", headers=user_token_headers)
+    assert response.status_code == 200
+    assert response.text.strip() == "content_id,title,created_at"